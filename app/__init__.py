@@ -49,6 +49,18 @@ def create_app(config_object=None):
     login_manager.init_app(app)
     limiter.init_app(app)
 
+    from app.core.query_stats import init_app as init_query_stats
+    init_query_stats(app)
+
+    from app.core.slow_queries import init_app as init_slow_queries
+    init_slow_queries(app)
+
+    from app.core.telemetry import init_app as init_telemetry
+    init_telemetry(app)
+
+    from app.core.jobs import init_app as init_jobs
+    init_jobs(app)
+
     login_manager.login_view = 'auth.login'
     login_manager.login_message = 'Please log in to access this page.'
 
@@ -61,7 +73,7 @@ def create_app(config_object=None):
     @login_manager.user_loader
     def load_user(user_id):
         """Load user by ID."""
-        return User.query.get(int(user_id))
+        return db.session.get(User, int(user_id))
 
     # Import models
     from app.modules.business.models import BusinessReport
@@ -114,6 +126,25 @@ def create_app(config_object=None):
     from app.modules.settings.routes import bp as settings_bp
     app.register_blueprint(settings_bp)
 
+    # Register CLI commands
+    from app.core.calendar import init_app as init_calendar
+    init_calendar(app)
+
+    from app.modules.returns.return_rates import init_app as init_return_rates
+    init_return_rates(app)
+
+    from app.modules.inventory.snapshots import init_app as init_inventory_snapshots
+    init_inventory_snapshots(app)
+
+    from app.modules.inventory.health import init_app as init_inventory_health
+    init_inventory_health(app)
+
+    from app.core.synthetic import init_app as init_synthetic
+    init_synthetic(app)
+
+    from app.modules.uploaded_data.jobs import init_app as init_export_jobs
+    init_export_jobs(app)
+
     return app
 
 # Export db and migrate objects
@@ -17,6 +17,12 @@ class Config:
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB max file size
     UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'uploads')
     
+    # Statements slower than this many milliseconds go to the slow-query log
+    SLOW_QUERY_MS = float(os.environ['SLOW_QUERY_MS']) if os.environ.get('SLOW_QUERY_MS') else None
+
+    # Bearer token for /metrics; without one it is only served in debug and testing
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
     # Security Settings
     SESSION_TYPE = 'filesystem'
     WTF_CSRF_ENABLED = True
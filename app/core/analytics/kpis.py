@@ -0,0 +1,149 @@
+"""Shared KPI aggregate queries.
+
+Each function returns totals and derived ratios for a store from a single
+``SUM`` query over the report table. Only the aggregate row is fetched;
+report rows are never hydrated into ORM objects.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import func
+
+from app.extensions import db
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.models import InventoryReport
+
+
+def ratio(numerator, denominator, scale: float = 1) -> float:
+    """Return numerator / denominator * scale, or 0 when the denominator is 0."""
+    if not denominator:
+        return 0.0
+    return float(numerator) / float(denominator) * scale
+
+
+def advertising_kpis(store_id: int, start_date: datetime, end_date: datetime) -> Dict:
+    """Advertising totals with ROAS, ACoS, CTR and CPC.
+
+    Args:
+        store_id: Store ID
+        start_date: Start of the range (inclusive)
+        end_date: End of the range (inclusive)
+
+    Returns:
+        Dict with totals, derived ratios and the number of report rows
+    """
+    row = db.session.query(
+        func.count(AdvertisingReport.id).label('rows'),
+        func.coalesce(func.sum(AdvertisingReport.spend), 0).label('spend'),
+        func.coalesce(func.sum(AdvertisingReport.total_sales), 0).label('sales'),
+        func.coalesce(func.sum(AdvertisingReport.impressions), 0).label('impressions'),
+        func.coalesce(func.sum(AdvertisingReport.clicks), 0).label('clicks'),
+        func.coalesce(func.sum(AdvertisingReport.total_orders), 0).label('orders')
+    ).filter(
+        AdvertisingReport.store_id == store_id,
+        AdvertisingReport.date.between(start_date, end_date)
+    ).one()
+
+    return {
+        'rows': int(row.rows),
+        'total_spend': float(row.spend),
+        'total_sales': float(row.sales),
+        'total_impressions': int(row.impressions),
+        'total_clicks': int(row.clicks),
+        'total_orders': int(row.orders),
+        'roas': ratio(row.sales, row.spend),
+        'acos': ratio(row.spend, row.sales, 100),
+        'ctr': ratio(row.clicks, row.impressions, 100),
+        'cpc': ratio(row.spend, row.clicks)
+    }
+
+
+def business_kpis(store_id: int, start_date: datetime, end_date: datetime) -> Dict:
+    """Sales totals with conversion rate and average order value.
+
+    Args:
+        store_id: Store ID
+        start_date: Start of the range (inclusive)
+        end_date: End of the range (inclusive)
+
+    Returns:
+        Dict with totals, derived ratios and the number of report rows
+    """
+    row = db.session.query(
+        func.count(BusinessReport.id).label('rows'),
+        func.coalesce(func.sum(BusinessReport.ordered_product_sales), 0).label('sales'),
+        func.coalesce(func.sum(BusinessReport.units_ordered), 0).label('units'),
+        func.coalesce(func.sum(BusinessReport.total_order_items), 0).label('orders'),
+        func.coalesce(func.sum(BusinessReport.sessions), 0).label('sessions')
+    ).filter(
+        BusinessReport.store_id == store_id,
+        BusinessReport.date.between(start_date, end_date)
+    ).one()
+
+    return {
+        'rows': int(row.rows),
+        'total_sales': float(row.sales),
+        'total_units': int(row.units),
+        'total_orders': int(row.orders),
+        'total_sessions': int(row.sessions),
+        'conversion_rate': ratio(row.units, row.sessions, 100),
+        'average_order_value': ratio(row.sales, row.orders)
+    }
+
+
+def inventory_kpis(store_id: int) -> Dict:
+    """Stock totals from the store's latest inventory snapshot.
+
+    Args:
+        store_id: Store ID
+
+    Returns:
+        Dict with the snapshot date and fulfillable/unsellable quantities
+    """
+    latest = db.session.query(func.max(InventoryReport.date)).filter(
+        InventoryReport.store_id == store_id
+    ).scalar_subquery()
+
+    row = db.session.query(
+        func.max(InventoryReport.date).label('date'),
+        func.count(InventoryReport.id).label('skus'),
+        func.coalesce(func.sum(
+            InventoryReport.afn_fulfillable_quantity + InventoryReport.mfn_fulfillable_quantity
+        ), 0).label('fulfillable'),
+        func.coalesce(func.sum(InventoryReport.afn_unsellable_quantity), 0).label('unsellable'),
+        func.coalesce(func.sum(InventoryReport.afn_reserved_quantity), 0).label('reserved')
+    ).filter(
+        InventoryReport.store_id == store_id,
+        InventoryReport.date == latest
+    ).one()
+
+    return {
+        'snapshot_date': row.date,
+        'skus': int(row.skus),
+        'fulfillable_quantity': int(row.fulfillable),
+        'unsellable_quantity': int(row.unsellable),
+        'reserved_quantity': int(row.reserved)
+    }
+
+
+def dashboard_kpis(store_id: int, days: int = 30, end_date: Optional[datetime] = None) -> Dict:
+    """All dashboard KPI tiles for the last ``days`` days.
+
+    Args:
+        store_id: Store ID
+        days: Number of days to look back
+        end_date: End of the range, defaults to now
+
+    Returns:
+        Dict with 'business', 'advertising' and 'inventory' sections
+    """
+    end_date = end_date or datetime.now()
+    start_date = end_date - timedelta(days=days)
+
+    return {
+        'business': business_kpis(store_id, start_date, end_date),
+        'advertising': advertising_kpis(store_id, start_date, end_date),
+        'inventory': inventory_kpis(store_id)
+    }
@@ -1,26 +1,61 @@
 """Cache module for the application."""
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, Callable
 
+from flask import current_app, make_response, request
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.core.models.data_version import StoreDataVersion
+from app.core.telemetry import CACHE_EVICTIONS, CACHE_LOOKUPS
+
+# Entries kept per process before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 1024
+
+# Seconds a worker trusts its copy of a store's data version before
+# reading it from the database again
+DATA_VERSION_TTL = 5
+
 class Cache:
-    """Simple in-memory cache implementation."""
+    """Simple in-memory LRU cache implementation.
+
+    Holds at most ``max_entries`` entries; setting a new key beyond that
+    first drops expired entries, then the least recently used ones.
+    Lookups and evictions are counted per key namespace, the part of the
+    key before the first ':'.
+    """
     
-    def __init__(self):
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
         """Initialize cache storage."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache."""
-        if key not in self._cache:
-            return None
-            
-        entry = self._cache[key]
-        if entry['expires_at'] and entry['expires_at'] < datetime.now():
-            del self._cache[key]
-            return None
-            
+        namespace = key.split(':', 1)[0]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                CACHE_LOOKUPS.inc(namespace=namespace, result='miss')
+                return None
+
+            if entry['expires_at'] and entry['expires_at'] < datetime.now():
+                del self._cache[key]
+                CACHE_EVICTIONS.inc(namespace=namespace)
+                CACHE_LOOKUPS.inc(namespace=namespace, result='miss')
+                return None
+
+            self._cache.move_to_end(key)
+        CACHE_LOOKUPS.inc(namespace=namespace, result='hit')
         return entry['value']
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -29,19 +64,41 @@ class Cache:
         if ttl is not None:
             expires_at = datetime.now() + timedelta(seconds=ttl)
             
-        self._cache[key] = {
-            'value': value,
-            'expires_at': expires_at
-        }
+        with self._lock:
+            self._cache[key] = {
+                'value': value,
+                'expires_at': expires_at
+            }
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_entries:
+                self._evict()
     
     def delete(self, key: str) -> None:
         """Delete a value from cache."""
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used, down to the limit."""
+        now = datetime.now()
+        expired = [
+            key for key, entry in self._cache.items()
+            if entry['expires_at'] and entry['expires_at'] < now
+        ]
+        for key in expired:
+            del self._cache[key]
+            CACHE_EVICTIONS.inc(namespace=key.split(':', 1)[0])
+        while len(self._cache) > self.max_entries:
+            key, _ = self._cache.popitem(last=False)
+            CACHE_EVICTIONS.inc(namespace=key.split(':', 1)[0])
 
 def cached(ttl: Optional[int] = None) -> Callable:
     """Decorator for caching function results."""
@@ -66,5 +123,112 @@ def cached(ttl: Optional[int] = None) -> Callable:
         return wrapper
     return decorator
 
+def get_data_version(store_id: int) -> int:
+    """Get the current data version of a store.
+
+    The database is the source of truth, so a bump in one worker
+    invalidates the responses cached by every other worker. Each worker
+    keeps the version in its cache for ``DATA_VERSION_TTL`` seconds so that
+    cache hits and 304s usually skip the database; the trade-off is that
+    another worker's bump can take that long to be noticed. Bumps in this
+    worker are seen as soon as they commit, and by the bumping session
+    right away. Stores that were never bumped are at version 0.
+    """
+    key = _data_version_key(store_id)
+    # A session that bumped the version itself reads its uncommitted value
+    if store_id in db.session.info.get('data_versions_bumped', ()):
+        return _load_data_version(store_id)
+
+    version = cache.get(key)
+    if version is None:
+        version = _load_data_version(store_id)
+        cache.set(key, version, DATA_VERSION_TTL)
+    return version
+
+def _load_data_version(store_id: int) -> int:
+    """Read a store's data version from the database."""
+    version = db.session.query(StoreDataVersion.version)\
+        .filter(StoreDataVersion.store_id == store_id).scalar()
+    return version or 0
+
+def bump_data_version(store_id: int) -> int:
+    """Mark a store's report data as changed, invalidating cached responses.
+
+    The new version is a timestamp, never lower than the old version plus
+    one, so concurrent bumps from different workers still change it. It
+    becomes visible to other workers when the caller commits.
+    """
+    db.session.info.setdefault('data_versions_bumped', set()).add(store_id)
+    row = db.session.get(StoreDataVersion, store_id)
+    version = max(row.version + 1 if row else 0, time.time_ns())
+    if row is not None:
+        row.version = version
+        db.session.flush()
+        return version
+
+    try:
+        with db.session.begin_nested():
+            db.session.add(StoreDataVersion(store_id=store_id, version=version))
+    except IntegrityError:
+        # Another worker created the row first
+        StoreDataVersion.query.filter_by(store_id=store_id).update({'version': version})
+    return version
+
+def _data_version_key(store_id: int) -> str:
+    """Cache key of a store's data version."""
+    return f"data_version:{store_id}"
+
+@event.listens_for(Session, 'after_commit')
+def _forget_bumped_versions(session: Session) -> None:
+    for store_id in session.info.pop('data_versions_bumped', ()):
+        cache.delete(_data_version_key(store_id))
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_bumped_versions(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop('data_versions_bumped', None)
+
+def cached_response(key_func: Callable[[Any], Optional[Dict[str, Any]]],
+                    ttl: Optional[int] = None) -> Callable:
+    """Decorator for caching JSON view responses with ETag support.
+
+    ``key_func`` receives ``request.args`` and returns the normalized
+    parameters identifying the response, including ``store_id``, or None
+    to bypass the cache. The cache key and ETag combine these parameters
+    with the store's data version, so a matching ``If-None-Match`` gets a
+    304 without running the view, and without a database query while the
+    worker's copy of the version is fresh (see ``get_data_version``).
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            params = key_func(request.args)
+            if not params or params.get('store_id') is None:
+                return func(*args, **kwargs)
+
+            version = get_data_version(params['store_id'])
+            key_parts = [func.__name__, f"v{version}"]
+            key_parts.extend(f"{k}={params[k]}" for k in sorted(params))
+            cache_key = ":".join(key_parts)
+            etag = hashlib.sha1(cache_key.encode()).hexdigest()
+
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+            else:
+                entry = cache.get(cache_key)
+                if entry is None:
+                    response = make_response(func(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    entry = {'body': response.get_data(), 'mimetype': response.mimetype}
+                    cache.set(cache_key, entry, ttl)
+                response = current_app.response_class(entry['body'], mimetype=entry['mimetype'])
+
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
 # Global cache instance
 cache = Cache()
@@ -0,0 +1,250 @@
+"""Calendar dimension population and special-period rules.
+
+The ``calendar_dates`` table is filled from the rules below. Its migration
+seeds the default years; the ``flask calendar populate`` command extends
+or refreshes the range, and trend queries call ``ensure_calendar`` so a
+requested range outside it is filled in before the join. Holidays and special periods move
+from year to year (Thanksgiving, Prime Day, ...), so they are computed
+per year instead of being stored as fixed month/day windows.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func
+
+from app.extensions import db
+from app.core.models.calendar import CalendarDate
+
+DEFAULT_START_YEAR = 2020
+DEFAULT_END_YEAR = 2030
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """Return the n-th weekday (0 = Monday) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + timedelta(days=offset + 7 * (n - 1))
+
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _thanksgiving(year: int) -> date:
+    """Fourth Thursday of November."""
+    return _nth_weekday(year, 11, 3, 4)
+
+
+# US marketplace holidays: name -> rule returning the date for a year
+HOLIDAYS: Dict[str, Callable[[int], date]] = {
+    "New Year's Day": lambda y: date(y, 1, 1),
+    "Valentine's Day": lambda y: date(y, 2, 14),
+    "Mother's Day": lambda y: _nth_weekday(y, 5, 6, 2),
+    'Memorial Day': lambda y: _nth_weekday(y, 5, 0, -1),
+    "Father's Day": lambda y: _nth_weekday(y, 6, 6, 3),
+    'Independence Day': lambda y: date(y, 7, 4),
+    'Labor Day': lambda y: _nth_weekday(y, 9, 0, 1),
+    'Halloween': lambda y: date(y, 10, 31),
+    'Thanksgiving': _thanksgiving,
+    'Black Friday': lambda y: _thanksgiving(y) + timedelta(days=1),
+    'Cyber Monday': lambda y: _thanksgiving(y) + timedelta(days=4),
+    'Christmas Day': lambda y: date(y, 12, 25),
+    "New Year's Eve": lambda y: date(y, 12, 31),
+}
+
+# Special sales periods: key -> name, calendar flag column and date range rule
+SPECIAL_PERIODS: Dict[str, Dict] = {
+    'prime_day': {
+        'name': 'Prime Day',
+        'column': 'is_prime_day',
+        # Usually the second Tuesday and Wednesday of July
+        'range': lambda y: (_nth_weekday(y, 7, 1, 2), _nth_weekday(y, 7, 1, 2) + timedelta(days=1)),
+    },
+    'back_to_school': {
+        'name': 'Back to School',
+        'column': 'is_back_to_school',
+        'range': lambda y: (date(y, 7, 15), date(y, 9, 15)),
+    },
+    'cyber_week': {
+        'name': 'Black Friday / Cyber Monday',
+        'column': 'is_cyber_week',
+        'range': lambda y: (_thanksgiving(y), _thanksgiving(y) + timedelta(days=4)),
+    },
+    'holiday_season': {
+        'name': 'Holiday Season',
+        'column': 'is_holiday_season',
+        'range': lambda y: (date(y, 11, 1), date(y, 12, 31)),
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _holidays_for_year(year: int) -> Dict[date, str]:
+    """Map each holiday date of a year to its name."""
+    return {rule(year): name for name, rule in HOLIDAYS.items()}
+
+
+def build_calendar_row(day: date) -> Dict:
+    """Build the calendar_dates values for a single day."""
+    iso_year, iso_week, _ = day.isocalendar()
+    quarter = (day.month - 1) // 3 + 1
+
+    holidays = _holidays_for_year(day.year)
+
+    row = {
+        'date': day,
+        'year': day.year,
+        'quarter': quarter,
+        'month': day.month,
+        'day': day.day,
+        'day_of_week': day.weekday(),
+        'iso_year': iso_year,
+        'iso_week': iso_week,
+        'week_label': f'{iso_year}-W{iso_week:02d}',
+        'month_label': f'{day.year}-{day.month:02d}',
+        'quarter_label': f'{day.year}-Q{quarter}',
+        'year_label': str(day.year),
+        'is_weekend': day.weekday() >= 5,
+        'is_holiday': day in holidays,
+        'holiday_name': holidays.get(day),
+    }
+
+    for period in SPECIAL_PERIODS.values():
+        start, end = period['range'](day.year)
+        row[period['column']] = start <= day <= end
+
+    return row
+
+
+def iter_calendar_rows(start_date: date, end_date: date) -> Iterator[Dict]:
+    """Yield calendar rows for every day in [start_date, end_date]."""
+    day = start_date
+    while day <= end_date:
+        yield build_calendar_row(day)
+        day += timedelta(days=1)
+
+
+def day_match_sql(column: str, day: str) -> str:
+    """Return a SQLite condition matching a DateTime column to a calendar day.
+
+    Report dates are stored as DateTime values (``'2024-01-05 00:00:00.000000'``)
+    while ``calendar_dates.date`` holds plain dates, so an equality join never
+    matches. The half-open range keeps the column bare for the store/date
+    indexes, unlike ``DATE(column) = day``.
+
+    Args:
+        column: Qualified DateTime column, e.g. ``business_report.date``
+        day: Qualified calendar date expression, e.g. ``dates.date``
+
+    Returns:
+        str: SQL condition
+    """
+    return f"{column} >= {day} AND {column} < date({day}, '+1 day')"
+
+
+def populate_calendar(start_date: date, end_date: date) -> int:
+    """Insert or refresh calendar rows for a date range.
+
+    Existing rows in the range are replaced so that rule changes are
+    picked up on the next run.
+
+    Args:
+        start_date: First day to populate
+        end_date: Last day to populate
+
+    Returns:
+        int: Number of rows written
+    """
+    if start_date > end_date:
+        raise ValueError("Start date cannot be after end date")
+
+    rows = list(iter_calendar_rows(start_date, end_date))
+
+    CalendarDate.query.filter(
+        CalendarDate.date.between(start_date, end_date)
+    ).delete(synchronize_session=False)
+    db.session.bulk_insert_mappings(CalendarDate, rows)
+    db.session.commit()
+
+    return len(rows)
+
+
+def ensure_calendar(start_date: date, end_date: date) -> int:
+    """Populate the calendar for a range unless every day is already present.
+
+    Trend queries inner-join ``calendar_dates``, so a range the table does
+    not cover would silently return no rows.
+
+    Args:
+        start_date: First day of the range
+        end_date: Last day of the range
+
+    Returns:
+        int: Number of rows written; 0 if the range was already covered
+    """
+    if start_date > end_date:
+        raise ValueError("Start date cannot be after end date")
+
+    present = CalendarDate.query.filter(
+        CalendarDate.date.between(start_date, end_date)
+    ).count()
+    if present == (end_date - start_date).days + 1:
+        return 0
+    return populate_calendar(start_date, end_date)
+
+
+def get_special_period_range(period_key: str, year: int) -> Optional[Tuple[date, date]]:
+    """Return the (start, end) dates of a special period from the calendar table.
+
+    Args:
+        period_key: Key in ``SPECIAL_PERIODS``
+        year: Calendar year
+
+    Returns:
+        Optional[Tuple[date, date]]: Period range, or None if the calendar
+        has not been populated for that year
+    """
+    period = SPECIAL_PERIODS[period_key]
+    flag = getattr(CalendarDate, period['column'])
+
+    start, end = db.session.query(
+        func.min(CalendarDate.date),
+        func.max(CalendarDate.date)
+    ).filter(
+        CalendarDate.year == year,
+        flag.is_(True)
+    ).one()
+
+    if start is None:
+        return None
+    return start, end
+
+
+@click.group('calendar')
+def calendar_cli():
+    """Calendar dimension commands."""
+    pass
+
+
+@calendar_cli.command('populate')
+@click.option('--start-year', default=DEFAULT_START_YEAR, show_default=True, help='First year to populate')
+@click.option('--end-year', default=DEFAULT_END_YEAR, show_default=True, help='Last year to populate')
+@with_appcontext
+def populate_command(start_year: int, end_year: int):
+    """Populate the calendar_dates table."""
+    try:
+        count = populate_calendar(date(start_year, 1, 1), date(end_year, 12, 31))
+        click.echo(f"Populated {count} calendar days ({start_year}-{end_year}).")
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"Error: {str(e)}", err=True)
+
+
+def init_app(app):
+    """Register CLI commands with the app."""
+    app.cli.add_command(calendar_cli)
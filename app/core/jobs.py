@@ -0,0 +1,102 @@
+"""Background job execution.
+
+Jobs are plain functions that run inside an application context. The
+``JOB_EXECUTOR`` config selects where they run:
+
+- an object with a ``submit(func, *args)`` method, e.g. an adapter for an
+  external task queue;
+- ``'sync'`` to run the job inline, for tests and CLI commands;
+- unset, for a process-local thread pool of ``JOB_WORKERS`` threads.
+
+Jobs record their progress from a connection of their own while their
+main query is still reading. On a file-backed SQLite database that needs
+the WAL journal, which lets one connection write while another reads, so
+``init_app`` switches it on together with a busy timeout
+(``SQLITE_BUSY_TIMEOUT_MS``) for writers that do collide.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from flask import Flask, current_app
+from sqlalchemy import event
+
+from app.core.telemetry import JOBS, JOBS_QUEUED, JOBS_RUNNING
+from app.extensions import db
+
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+
+_local_executor: Optional[ThreadPoolExecutor] = None
+_local_executor_lock = threading.Lock()
+
+
+def submit_job(func: Callable, *args: Any) -> Any:
+    """Run ``func(*args)`` in the background with the current app's context.
+
+    Returns:
+        Whatever the executor's ``submit`` returns, or the job's result when
+        running inline
+    """
+    app = current_app._get_current_object()
+    executor = app.config.get('JOB_EXECUTOR')
+
+    if executor == 'sync':
+        return _run_job(func, *args)
+    if executor is None:
+        executor = _get_local_executor(app.config.get('JOB_WORKERS', DEFAULT_JOB_WORKERS))
+    JOBS_QUEUED.inc()
+    return executor.submit(_run_in_app_context, app, func, *args)
+
+
+def _get_local_executor(workers: int) -> ThreadPoolExecutor:
+    """Create the process-local thread pool on first use."""
+    global _local_executor
+    with _local_executor_lock:
+        if _local_executor is None:
+            _local_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+        return _local_executor
+
+
+def _run_in_app_context(app: Flask, func: Callable, *args: Any) -> Any:
+    """Run a queued job with its own app context and log failures."""
+    JOBS_QUEUED.dec()
+    with app.app_context():
+        try:
+            return _run_job(func, *args)
+        except Exception:
+            app.logger.exception(f"Background job {func.__name__} failed")
+            raise
+
+
+def _run_job(func: Callable, *args: Any) -> Any:
+    """Run a job, counting it in the job metrics."""
+    JOBS_RUNNING.inc()
+    try:
+        result = func(*args)
+    except Exception:
+        JOBS.inc(status='failed')
+        raise
+    finally:
+        JOBS_RUNNING.dec()
+    JOBS.inc(status='completed')
+    return result
+
+
+def init_app(app: Flask) -> None:
+    """Let background jobs write while requests read on file-backed SQLite."""
+    busy_timeout = int(app.config.get('SQLITE_BUSY_TIMEOUT_MS', DEFAULT_SQLITE_BUSY_TIMEOUT_MS))
+
+    def _configure_sqlite(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute(f'PRAGMA busy_timeout = {busy_timeout}')
+        finally:
+            cursor.close()
+
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == 'sqlite' and engine.url.database not in (None, '', ':memory:'):
+                event.listen(engine, 'connect', _configure_sqlite)
@@ -6,7 +6,6 @@ import operator
 import re
 from functools import reduce
 from datetime import datetime, timedelta
-import pandas as pd
 from app.core.cache import cache
 from decimal import Decimal
 
@@ -198,7 +197,7 @@ class MetricEngine:
         metric = self._metrics[metric_id]
         cache_config = metric.get('caching', {})
         
-        key_parts = [metric_id]
+        key_parts = ['metric', metric_id]
         if cache_config.get('key'):
             for key_field in cache_config['key']:
                 if context and key_field in context:
@@ -1,6 +1,8 @@
 """Core models package."""
 
 from .base_report import BaseReport
+from .calendar import CalendarDate
+from .data_version import StoreDataVersion
 from app.modules.stores.models import Store
 
-__all__ = ['BaseReport', 'Store']
+__all__ = ['BaseReport', 'CalendarDate', 'Store', 'StoreDataVersion']
@@ -0,0 +1,42 @@
+"""Calendar dimension model."""
+
+from app.extensions import db
+
+class CalendarDate(db.Model):
+    """One row per calendar day.
+
+    Trend queries join this table to fill gaps in the report data and to
+    group by week, month, quarter or year without date arithmetic in SQL.
+    Holiday and special-period flags are populated from the rules in
+    ``app.core.calendar``.
+    """
+    __tablename__ = 'calendar_dates'
+
+    date = db.Column(db.Date, primary_key=True)
+
+    # Date parts
+    year = db.Column(db.Integer, nullable=False)
+    quarter = db.Column(db.Integer, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    day = db.Column(db.Integer, nullable=False)
+    day_of_week = db.Column(db.Integer, nullable=False)  # 0 = Monday
+    iso_year = db.Column(db.Integer, nullable=False)
+    iso_week = db.Column(db.Integer, nullable=False)
+
+    # Group labels (e.g. 2024-W05, 2024-01, 2024-Q1, 2024)
+    week_label = db.Column(db.String(8), nullable=False, index=True)
+    month_label = db.Column(db.String(7), nullable=False, index=True)
+    quarter_label = db.Column(db.String(7), nullable=False, index=True)
+    year_label = db.Column(db.String(4), nullable=False)
+
+    # Flags
+    is_weekend = db.Column(db.Boolean, nullable=False, default=False)
+    is_holiday = db.Column(db.Boolean, nullable=False, default=False)
+    holiday_name = db.Column(db.String(100))
+    is_prime_day = db.Column(db.Boolean, nullable=False, default=False)
+    is_back_to_school = db.Column(db.Boolean, nullable=False, default=False)
+    is_cyber_week = db.Column(db.Boolean, nullable=False, default=False)
+    is_holiday_season = db.Column(db.Boolean, nullable=False, default=False)
+
+    def __repr__(self):
+        return f'<CalendarDate {self.date}>'
@@ -0,0 +1,17 @@
+"""Store data version model."""
+
+from app.extensions import db
+
+class StoreDataVersion(db.Model):
+    """Version counter of a store's report data.
+
+    Loads bump the version; cached responses and counts are keyed on it.
+    It lives in the database so that every worker process sees a bump.
+    """
+    __tablename__ = 'store_data_versions'
+
+    store_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    version = db.Column(db.BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f'<StoreDataVersion {self.store_id}: {self.version}>'
@@ -0,0 +1,151 @@
+"""Per-request SQL query counting and N+1 detection.
+
+SQLAlchemy engine events time every statement sent to the database and add
+it to the collectors active in the current context. ``init_app`` opens a
+collector per request, reports the query count and database time in a
+``Server-Timing`` response header and the debug log, and logs a warning
+when the same statement shape runs ``QUERY_REPEAT_THRESHOLD`` times or
+more in one request, the usual sign of a query issued per row.
+
+Tests lock in query budgets with ``assert_max_queries``::
+
+    with assert_max_queries(3):
+        client.get('/uploaded-data/api/business')
+
+Config:
+    QUERY_STATS_ENABLED: Track requests (default True)
+    QUERY_REPEAT_THRESHOLD: Executions of one statement shape flagged as a
+        possible N+1 (default 10)
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Tuple
+
+from flask import Flask, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_REPEAT_THRESHOLD = 10
+
+# Collectors receiving the statements executed in this context
+_active: ContextVar[Tuple['QueryStats', ...]] = ContextVar('query_stats', default=())
+
+_IN_LIST = re.compile(r'\bIN \((?:[^()]*)\)', re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_SPACE = re.compile(r'\s+')
+
+
+def statement_shape(statement: str) -> str:
+    """A statement with literals and IN lists collapsed.
+
+    Statements that differ only in their parameters share a shape.
+    """
+    shape = _STRING.sub('?', statement)
+    shape = _NUMBER.sub('?', shape)
+    shape = _IN_LIST.sub('IN (...)', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+
+class QueryStats:
+    """Queries executed while a collector was active."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed at least ``threshold`` times, most frequent first."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def summary(self, limit: int = 10) -> str:
+        """The most frequent statement shapes, one per line."""
+        return '\n'.join(f"{count:>5} x {shape}" for shape, count in self.shapes.most_common(limit))
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the queries executed inside the block."""
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail when the block executes more than ``limit`` queries."""
+    with track_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        raise AssertionError(
+            f"{stats.count} queries executed, at most {limit} expected:\n{stats.summary()}"
+        )
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _active.get():
+        conn.info['query_stats_start'] = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    collectors = _active.get()
+    start = conn.info.pop('query_stats_start', None)
+    if not collectors or start is None:
+        return
+    duration = time.perf_counter() - start
+    for stats in collectors:
+        stats.record(statement, duration)
+
+
+def _start_request() -> None:
+    stats = QueryStats()
+    g.query_stats = stats
+    _active.set(_active.get() + (stats,))
+
+
+def _report_request(response):
+    stats = g.get('query_stats')
+    if stats is None:
+        return response
+
+    duration_ms = stats.duration * 1000
+    response.headers.add('Server-Timing', f'db;dur={duration_ms:.2f};desc="{stats.count} queries"')
+    logger.debug(f"{request.method} {request.path}: {stats.count} queries in {duration_ms:.2f} ms")
+
+    threshold = current_app.config.get('QUERY_REPEAT_THRESHOLD', DEFAULT_QUERY_REPEAT_THRESHOLD)
+    for shape, count in stats.repeated(threshold):
+        logger.warning(f"Possible N+1 in {request.method} {request.path}: {count} x {shape}")
+    return response
+
+
+def _end_request(exc=None) -> None:
+    stats = g.pop('query_stats', None)
+    if stats is not None:
+        _active.set(tuple(active for active in _active.get() if active is not stats))
+
+
+def init_app(app: Flask) -> None:
+    """Track the queries of every request."""
+    if not app.config.get('QUERY_STATS_ENABLED', True):
+        return
+    app.before_request(_start_request)
+    app.after_request(_report_request)
+    app.teardown_request(_end_request)
@@ -0,0 +1,228 @@
+"""Slow-query log.
+
+Statements that take ``SLOW_QUERY_MS`` milliseconds or longer are logged
+as warnings and appended to a JSON-lines file with their parameters,
+elapsed time, the application frames that issued them and the database's
+query plan. The file rotates at ``SLOW_QUERY_LOG_MAX_BYTES`` and keeps
+``SLOW_QUERY_LOG_BACKUPS`` older files; appends and rotation hold an
+exclusive lock on a ``.lock`` file next to the log, so worker processes
+sharing it do not rotate over each other. Admins read it at
+``/admin/slow-queries``.
+
+Config:
+    SLOW_QUERY_MS: Threshold in milliseconds; unset disables the log
+    SLOW_QUERY_LOG: Log file (default: slow_queries.jsonl in the instance folder)
+    SLOW_QUERY_LOG_MAX_BYTES: Size at which the file rotates (default 1 MB)
+    SLOW_QUERY_LOG_BACKUPS: Rotated files kept (default 3)
+    SLOW_QUERY_EXPLAIN: Capture query plans (default True)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime, UTC
+from typing import Any, Dict, List, Optional
+
+from flask import Flask
+from sqlalchemy import event
+
+from app.extensions import db
+from app.utils.index_audit import explain_statement, plan_lines
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of one process are serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_LOG_MAX_BYTES = 1024 * 1024
+DEFAULT_SLOW_QUERY_LOG_BACKUPS = 3
+
+# Records shown on the admin page
+SLOW_QUERY_PAGE_SIZE = 100
+
+# Longest parameter list kept, as repr
+PARAMETERS_MAX_LENGTH = 2000
+
+# Application frames kept of the caller stack, innermost last
+STACK_DEPTH = 8
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PROJECT_ROOT = os.path.dirname(_APP_ROOT)
+
+# Only statements that read rows are explained; EXPLAIN of writes and DDL
+# is not supported everywhere
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+
+# Savepoint the EXPLAIN runs in, inside the statement's own transaction
+_EXPLAIN_SAVEPOINT = 'slow_query_explain'
+
+
+class SlowQueryLog:
+    """Size-rotated JSON-lines file of slow-query records."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_SLOW_QUERY_LOG_MAX_BYTES,
+                 backups: int = DEFAULT_SLOW_QUERY_LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str) + '\n'
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with self._locked():
+            if os.path.exists(self.path) and os.path.getsize(self.path) + len(line) > self.max_bytes:
+                self._rotate()
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    def records(self, limit: int = SLOW_QUERY_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """The newest records first, across the rotated files."""
+        records = []
+        for path in [self.path] + [f'{self.path}.{n}' for n in range(1, self.backups + 1)]:
+            if not os.path.exists(path):
+                continue
+            with open(path, encoding='utf-8') as f:
+                lines = f.readlines()
+            for line in reversed(lines):
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # Line cut short by a crash
+                if len(records) >= limit:
+                    return records
+        return records
+
+    @contextmanager
+    def _locked(self):
+        """Hold the log's lock against other threads and processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(f'{self.path}.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rotate(self) -> None:
+        """Shift log.1 to log.2 and so on, dropping the oldest file."""
+        for n in range(self.backups - 1, 0, -1):
+            if os.path.exists(f'{self.path}.{n}'):
+                os.replace(f'{self.path}.{n}', f'{self.path}.{n + 1}')
+        if self.backups:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+
+
+class SlowQueryRecorder:
+    """Engine event listeners that record statements over a threshold."""
+
+    def __init__(self, threshold_ms: float, log: SlowQueryLog, explain: bool = True):
+        self.threshold = threshold_ms / 1000
+        self.log = log
+        self.explain = explain
+
+    def listen(self, engine) -> None:
+        event.listen(engine, 'before_cursor_execute', self._start)
+        event.listen(engine, 'after_cursor_execute', self._finish)
+
+    def _start(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info['slow_query_start'] = time.perf_counter()
+
+    def _finish(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = conn.info.pop('slow_query_start', None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        if elapsed < self.threshold:
+            return
+
+        record = {
+            'recorded_at': datetime.now(UTC).isoformat(timespec='seconds'),
+            'elapsed_ms': round(elapsed * 1000, 2),
+            'statement': statement,
+            'parameters': repr(parameters)[:PARAMETERS_MAX_LENGTH],
+            'executemany': executemany,
+            'stack': caller_stack(),
+            'plan': None,
+        }
+        if self.explain and not executemany and _EXPLAINABLE.match(statement):
+            record['plan'] = _query_plan(conn.dialect.name, cursor, statement, parameters)
+
+        logger.warning(f"Slow query ({record['elapsed_ms']} ms): {' '.join(statement.split())[:200]}")
+        try:
+            self.log.append(record)
+        except OSError as e:
+            logger.error(f"Could not write slow query log {self.log.path}: {str(e)}")
+
+
+def caller_stack(depth: int = STACK_DEPTH) -> List[str]:
+    """Application frames of the current stack, innermost last."""
+    frames = [
+        frame for frame in traceback.extract_stack()
+        if frame.filename.startswith(_APP_ROOT) and frame.filename != __file__
+    ]
+    return [
+        f"{os.path.relpath(frame.filename, _PROJECT_ROOT)}:{frame.lineno} in {frame.name}"
+        for frame in frames[-depth:]
+    ]
+
+
+def _query_plan(dialect: str, cursor, statement: str, parameters) -> List[str]:
+    """Plan of a statement, explained on a new cursor of the same connection.
+
+    The raw DBAPI cursor keeps the EXPLAIN out of the engine events. It runs
+    inside a savepoint that is rolled back when it fails, because a failed
+    statement aborts the whole transaction on PostgreSQL.
+    """
+    try:
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute(f'SAVEPOINT {_EXPLAIN_SAVEPOINT}')
+            try:
+                explain_cursor.execute(explain_statement(dialect, statement), parameters)
+                plan = plan_lines(dialect, explain_cursor.fetchall())
+            except Exception as e:
+                explain_cursor.execute(f'ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}')
+                plan = [f"EXPLAIN failed: {type(e).__name__}: {str(e)}"]
+            explain_cursor.execute(f'RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}')
+            return plan
+        finally:
+            explain_cursor.close()
+    except Exception as e:
+        return [f"EXPLAIN failed: {type(e).__name__}: {str(e)}"]
+
+
+def get_slow_query_log(app: Flask) -> SlowQueryLog:
+    """The app's slow-query log file."""
+    return SlowQueryLog(
+        app.config.get('SLOW_QUERY_LOG') or os.path.join(app.instance_path, 'slow_queries.jsonl'),
+        app.config.get('SLOW_QUERY_LOG_MAX_BYTES', DEFAULT_SLOW_QUERY_LOG_MAX_BYTES),
+        app.config.get('SLOW_QUERY_LOG_BACKUPS', DEFAULT_SLOW_QUERY_LOG_BACKUPS),
+    )
+
+
+def init_app(app: Flask) -> Optional[SlowQueryRecorder]:
+    """Record the app's slow queries when SLOW_QUERY_MS is set."""
+    threshold = app.config.get('SLOW_QUERY_MS')
+    if threshold is None:
+        return None
+
+    recorder = SlowQueryRecorder(float(threshold), get_slow_query_log(app),
+                                 app.config.get('SLOW_QUERY_EXPLAIN', True))
+    with app.app_context():
+        for engine in db.engines.values():
+            recorder.listen(engine)
+    app.extensions['slow_queries'] = recorder
+    return recorder
@@ -0,0 +1,9 @@
+"""Synthetic benchmark data.
+
+The generator lives in ``generator`` and needs pandas and NumPy; importing
+this package only registers the ``flask synthetic`` commands.
+"""
+
+from .cli import init_app, synthetic_cli
+
+__all__ = ['init_app', 'synthetic_cli']
@@ -0,0 +1,80 @@
+"""Synthetic data CLI commands."""
+
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+import click
+from flask.cli import with_appcontext
+
+from app.extensions import db
+
+REPORT_CHOICES = ('business', 'advertising', 'inventory', 'returns')
+
+
+@click.group('synthetic')
+def synthetic_cli():
+    """Synthetic benchmark data commands."""
+    pass
+
+
+@synthetic_cli.command('generate')
+@click.option('--scale', default='100k', show_default=True,
+              help='Rows per report type: 10k, 100k, 1m, 10m, 50m or a row count')
+@click.option('--report', 'reports', multiple=True, type=click.Choice(REPORT_CHOICES),
+              help='Report type to generate, repeatable (default: all)')
+@click.option('--stores', default=3, show_default=True, help='Number of stores')
+@click.option('--store-id', 'store_ids', multiple=True, type=int,
+              help='Existing store to generate for, repeatable (overrides --stores)')
+@click.option('--user-id', type=int, help='Owner of the synthetic stores created for --load')
+@click.option('--days', default=365, show_default=True, help='Days of history')
+@click.option('--end-date', type=click.DateTime(formats=['%Y-%m-%d']),
+              help='Last day of history (default: yesterday)')
+@click.option('--seed', default=0, show_default=True, help='Random seed, equal seeds give equal data')
+@click.option('--output-dir', type=click.Path(file_okay=False), help='Write upload-ready CSV files here')
+@click.option('--load', is_flag=True, help='Bulk insert the rows into the database')
+@click.option('--batch-size', default=100_000, show_default=True, help='Rows per batch and commit')
+@with_appcontext
+def generate_command(scale: str, reports: Tuple[str, ...], stores: int, store_ids: Tuple[int, ...],
+                     user_id: Optional[int], days: int, end_date: Optional[datetime], seed: int,
+                     output_dir: Optional[str], load: bool, batch_size: int):
+    """Generate a deterministic multi-store dataset for benchmarks.
+
+    Loads are meant for empty stores: rows that already exist for the same
+    keys violate the report tables' unique indexes.
+    """
+    # pandas and NumPy load only when the command runs
+    from .generator import create_synthetic_stores, generate_dataset, resolve_scale
+
+    try:
+        rows = resolve_scale(scale)
+        if not output_dir and not load:
+            raise click.UsageError('Pass --output-dir, --load or both')
+
+        if store_ids:
+            store_ids = list(store_ids)
+        elif load:
+            if user_id is None:
+                raise click.UsageError('--load needs --store-id or --user-id')
+            store_ids = create_synthetic_stores(user_id, stores)
+        else:
+            store_ids = list(range(1, stores + 1))
+
+        end = end_date.date() if end_date else date.today() - timedelta(days=1)
+        counts = generate_dataset(
+            list(reports or REPORT_CHOICES), store_ids, rows, end, days=days, seed=seed,
+            output_dir=output_dir, load=load, batch_size=batch_size
+        )
+
+        for report_type, count in counts.items():
+            click.echo(f"{report_type}: {count} rows")
+        click.echo(f"Stores: {', '.join(str(store_id) for store_id in store_ids)}")
+    except click.UsageError:
+        raise
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"Error: {str(e)}", err=True)
+
+
+def init_app(app):
+    """Register CLI commands with the app."""
+    app.cli.add_command(synthetic_cli)
@@ -0,0 +1,515 @@
+"""Deterministic synthetic report data for benchmarks.
+
+Every store gets a product catalog whose demand follows a Zipf (long-tail)
+distribution. Daily demand is scaled by calendar seasonality (weekends,
+Prime Day, Cyber Week, the holiday season and the January lull) and a
+yearly growth trend. Business, advertising and inventory reports hold one
+row per catalog item (or keyword) per store and day; returns are sampled
+from the same demand.
+
+Rows are produced as pandas DataFrames of about ``batch_size`` rows; daily
+reports never split a store's day across batches. Every store and day of a
+daily report, and every batch of returns, draws from its own generator
+seeded with (seed, store, report, day or batch). Daily reports therefore do
+not depend on the batch size, and no report depends on which others are
+generated with it.
+"""
+
+import os
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
+
+from app.core.cache import bump_data_version
+from app.core.calendar import build_calendar_row
+from app.extensions import db
+from app.modules.advertising.dimensions import resolve_dimensions
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.models import InventoryReport
+from app.modules.inventory.snapshots import refresh_inventory_snapshots
+from app.modules.returns.constants import (
+    VALID_RETURN_CARRIERS, VALID_RETURN_CENTERS, VALID_TRACKING_PREFIXES
+)
+from app.modules.returns.models import ReturnReport
+from app.modules.returns.return_rates import refresh_return_rates
+from app.modules.stores.models import Store
+from app.modules.upload_csv.constants import CSV_COLUMNS
+
+# Report type -> (CSV_COLUMNS key, model, stream index used in seeding)
+SYNTHETIC_REPORTS = {
+    'business': ('business_report', BusinessReport, 1),
+    'advertising': ('advertising_report', AdvertisingReport, 2),
+    'inventory': ('inventory_report', InventoryReport, 3),
+    'returns': ('return_report', ReturnReport, 4),
+}
+
+# Named sizes: rows per report type
+SYNTHETIC_SCALES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000,
+    '50m': 50_000_000,
+}
+
+SYNTHETIC_BATCH_SIZE = 100_000
+
+# Demand shape
+ZIPF_EXPONENT = 1.1          # Popularity of the n-th best seller is n ** -ZIPF_EXPONENT
+TOP_DAILY_SESSIONS = 3000    # Mean daily sessions of a store's best seller
+ANNUAL_GROWTH = 0.2          # Demand growth per year across the date range
+JANUARY_LIFT = 0.85          # Post-holiday lull
+RETURN_LAG_DAYS = 10         # Returns follow orders by about this many days
+
+# Demand multipliers applied when a calendar flag is set
+SEASONAL_LIFT = {
+    'is_weekend': 1.12,
+    'is_back_to_school': 1.1,
+    'is_holiday_season': 1.3,
+    'is_cyber_week': 2.2,
+    'is_prime_day': 2.6,
+}
+
+# Advertising structure
+KEYWORDS_PER_AD_GROUP = 20
+AD_GROUPS_PER_CAMPAIGN = 10
+
+PRODUCT_WORDS = ['Wireless', 'Organic', 'Premium', 'Compact', 'Stainless', 'Bamboo',
+                 'Smart', 'Portable', 'Vintage', 'Ergonomic', 'Waterproof', 'Classic']
+PRODUCT_NOUNS = ['Earbuds', 'Water Bottle', 'Desk Lamp', 'Yoga Mat', 'Backpack', 'Coffee Grinder',
+                 'Phone Case', 'Cutting Board', 'Sunglasses', 'Watch Band', 'Notebook', 'Pet Bed']
+MATCH_TYPES = ['Exact', 'Phrase', 'Broad']
+RETURN_REASONS = ['Defective', 'Not as described', 'No longer needed', 'Wrong item sent',
+                  'Arrived damaged', 'Better price available', 'Size or fit issue']
+RETURN_REASON_WEIGHTS = [0.22, 0.18, 0.2, 0.08, 0.12, 0.08, 0.12]
+RETURN_STATUSES = ['Completed', 'Approved', 'Pending', 'Rejected']
+RETURN_STATUS_WEIGHTS = [0.6, 0.2, 0.15, 0.05]
+RETURN_CENTER_WEIGHTS = [0.7, 0.1, 0.1, 0.1]
+
+
+def resolve_scale(scale: str) -> int:
+    """Rows per report type for a named scale or a plain row count.
+
+    Raises:
+        ValueError: If the scale is neither a known name nor a positive integer
+    """
+    if scale.lower() in SYNTHETIC_SCALES:
+        return SYNTHETIC_SCALES[scale.lower()]
+    try:
+        rows = int(scale.replace('_', ''))
+    except ValueError:
+        rows = 0
+    if rows < 1:
+        raise ValueError(f"Invalid scale: {scale}. Valid values: {', '.join(SYNTHETIC_SCALES)} or a row count")
+    return rows
+
+
+def catalog_size(rows: int, stores: int, days: int) -> int:
+    """Catalog items per store so that one row per item and day gives about ``rows`` rows."""
+    return max(1, round(rows / (stores * days)))
+
+
+def build_catalog(store_index: int, size: int, seed: int) -> pd.DataFrame:
+    """Products of one store, best seller first.
+
+    Args:
+        store_index: Position of the store in the generated dataset
+        size: Number of products
+        seed: Dataset seed
+
+    Returns:
+        pd.DataFrame: sku, asin, title, price, popularity, sessions (mean
+        per day), conversion, return_rate, fba, volume and restock columns
+    """
+    rng = np.random.default_rng([seed, store_index, 0])
+    index = np.arange(size)
+    popularity = (index + 1.0) ** -ZIPF_EXPONENT
+    store_scale = rng.lognormal(0, 0.4)
+
+    words = rng.integers(len(PRODUCT_WORDS), size=size)
+    nouns = rng.integers(len(PRODUCT_NOUNS), size=size)
+    catalog = pd.DataFrame({
+        'sku': [f"SYN-{store_index:02d}-{i:07d}" for i in index],
+        'asin': [f"B{store_index % 100:02d}{i:07d}" for i in index],
+        'title': [f"{PRODUCT_WORDS[w]} {PRODUCT_NOUNS[n]} {i}" for w, n, i in zip(words, nouns, index)],
+        'price': rng.lognormal(np.log(25), 0.8, size).clip(3, 2000).round(2),
+        'popularity': popularity,
+        'sessions': TOP_DAILY_SESSIONS * store_scale * popularity,
+        'conversion': rng.beta(2, 18, size),
+        'return_rate': rng.beta(2, 38, size),
+        'fba': rng.random(size) < 0.85,
+        'volume': rng.lognormal(np.log(0.12), 0.7, size).clip(0.01, 20).round(4),
+        # Inventory cycle: days between restocks, position in the cycle and
+        # how many days of demand a restock covers (some SKUs run out, some pile up)
+        'restock_days': rng.integers(21, 91, size),
+        'restock_phase': rng.integers(0, 90, size),
+        'cover': rng.choice([0.6, 1.3, 4.0], size, p=[0.1, 0.8, 0.1]),
+    })
+    return catalog
+
+
+def seasonality(days: Sequence[date]) -> np.ndarray:
+    """Demand multiplier per day from calendar flags and the growth trend."""
+    start = days[0]
+    lift = np.ones(len(days))
+    for i, day in enumerate(days):
+        row = build_calendar_row(day)
+        for flag, multiplier in SEASONAL_LIFT.items():
+            if row[flag]:
+                lift[i] *= multiplier
+        if day.month == 1:
+            lift[i] *= JANUARY_LIFT
+        lift[i] *= (1 + ANNUAL_GROWTH) ** ((day - start).days / 365)
+    return lift
+
+
+def generate_frames(
+    report_type: str,
+    store_ids: Sequence[int],
+    rows: int,
+    end_date: date,
+    days: int = 365,
+    seed: int = 0,
+    batch_size: int = SYNTHETIC_BATCH_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Yield synthetic report rows in upload CSV column order.
+
+    Args:
+        report_type: Key in SYNTHETIC_REPORTS
+        store_ids: Stores to generate, their order determines the data
+        rows: Target rows per report type across all stores. Returns hit it
+            exactly; the daily reports round it to whole catalogs per day.
+        end_date: Last day of the range
+        days: Number of days in the range
+        seed: Dataset seed
+        batch_size: Rows per DataFrame, rounded to whole days for daily reports
+
+    Raises:
+        ValueError: If the report type is unknown or a count is not positive
+    """
+    if report_type not in SYNTHETIC_REPORTS:
+        raise ValueError(f"Invalid report type: {report_type}")
+    if rows < 1 or days < 1 or batch_size < 1 or not store_ids:
+        raise ValueError("rows, days, batch_size and store_ids must be positive")
+
+    dates = [end_date - timedelta(days=days - 1 - i) for i in range(days)]
+    lift = seasonality(dates)
+    size = catalog_size(rows, len(store_ids), days)
+    stream = SYNTHETIC_REPORTS[report_type][2]
+
+    for store_index, store_id in enumerate(store_ids):
+        catalog = build_catalog(store_index, size, seed)
+
+        if report_type == 'returns':
+            store_rows = rows // len(store_ids) + (store_index < rows % len(store_ids))
+            blocks = [(start, min(batch_size, store_rows - start)) for start in range(0, store_rows, batch_size)]
+        else:
+            days_per_block = max(1, batch_size // size)
+            blocks = [(start, min(days_per_block, days - start)) for start in range(0, days, days_per_block)]
+
+        keywords = _keywords(catalog, store_index, seed) if report_type == 'advertising' else None
+
+        for block, (start, count) in enumerate(blocks):
+            if report_type == 'returns':
+                rng = np.random.default_rng([seed, store_index, stream, block])
+                frame = _returns(rng, catalog, dates, lift, count)
+            else:
+                frame = pd.concat([
+                    _daily_rows(report_type, np.random.default_rng([seed, store_index, stream, day]),
+                                catalog, keywords, np.datetime64(dates[day], 'ns'), lift[day], day)
+                    for day in range(start, start + count)
+                ], ignore_index=True)
+
+            frame.insert(0, 'store_id', store_id)
+            yield frame[CSV_COLUMNS[SYNTHETIC_REPORTS[report_type][0]]['required']]
+
+
+def load_frame(report_type: str, frame: pd.DataFrame, dimension_ids: Optional[Dict] = None) -> int:
+    """Bulk insert one frame into its report table.
+
+    Args:
+        report_type: Key in SYNTHETIC_REPORTS
+        frame: Rows from generate_frames
+        dimension_ids: Advertising only; (store_id, campaign, ad group, term)
+            -> dimension ids, filled as new names are resolved
+
+    Returns:
+        int: Rows inserted
+    """
+    frame = frame.copy()
+    if report_type == 'advertising':
+        frame = _with_dimension_ids(frame, {} if dimension_ids is None else dimension_ids)
+    elif report_type == 'returns':
+        frame['date'] = frame['return_date']
+
+    model = SYNTHETIC_REPORTS[report_type][1]
+    db.session.execute(insert(model), frame.to_dict(orient='records'))
+    return len(frame)
+
+
+def generate_dataset(
+    reports: Sequence[str],
+    store_ids: Sequence[int],
+    rows: int,
+    end_date: date,
+    days: int = 365,
+    seed: int = 0,
+    output_dir: Optional[str] = None,
+    load: bool = False,
+    batch_size: int = SYNTHETIC_BATCH_SIZE
+) -> Dict[str, int]:
+    """Generate reports into CSV files, the database or both.
+
+    CSV files are named ``<report>_report.csv`` and can be uploaded as they
+    are. Database loads commit every batch, then rebuild current inventory
+    and return rate facts for the stores and bump their data versions.
+
+    Args:
+        reports: Keys in SYNTHETIC_REPORTS
+        store_ids: Stores to generate
+        rows: Target rows per report type, see generate_frames
+        end_date: Last day of the range
+        days: Number of days in the range
+        seed: Dataset seed
+        output_dir: Folder for the CSV files, None to skip them
+        load: Insert the rows into the report tables
+        batch_size: Rows per batch and per commit
+
+    Returns:
+        Dict[str, int]: Rows generated per report type
+    """
+    if output_dir is None and not load:
+        raise ValueError("Choose an output directory, a database load or both")
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    counts = {}
+    for report_type in reports:
+        frames = generate_frames(report_type, store_ids, rows, end_date, days, seed, batch_size)
+        output = None
+        if output_dir:
+            output = open(os.path.join(output_dir, f"{report_type}_report.csv"), 'w', newline='')
+
+        counts[report_type] = 0
+        dimension_ids = {}
+        try:
+            for frame in frames:
+                if output:
+                    frame.to_csv(output, index=False, header=counts[report_type] == 0, date_format='%Y-%m-%d')
+                if load:
+                    load_frame(report_type, frame, dimension_ids)
+                    db.session.commit()
+                counts[report_type] += len(frame)
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            if output:
+                output.close()
+
+    if load:
+        for store_id in store_ids:
+            if 'inventory' in reports:
+                refresh_inventory_snapshots(store_id)
+            if 'business' in reports or 'returns' in reports:
+                refresh_return_rates(store_id)
+            bump_data_version(store_id)
+            db.session.commit()
+
+    return counts
+
+
+def create_synthetic_stores(user_id: int, count: int, marketplace: str = 'US') -> List[int]:
+    """IDs of ``count`` synthetic stores owned by a user, created if missing."""
+    names = [f"Synthetic Store {n}" for n in range(1, count + 1)]
+    existing = {
+        store.name: store.id
+        for store in Store.query.filter(Store.user_id == user_id, Store.name.in_(names))
+    }
+    for name in names:
+        if name not in existing:
+            store = Store(name=name, marketplace=marketplace, user_id=user_id)
+            db.session.add(store)
+            db.session.flush()
+            existing[name] = store.id
+    db.session.commit()
+    return [existing[name] for name in names]
+
+
+def _daily_rows(report_type: str, rng: np.random.Generator, catalog: pd.DataFrame,
+                keywords: Optional[pd.DataFrame], day: np.datetime64, lift: float, day_index: int) -> pd.DataFrame:
+    """One store's rows of a daily report for one day."""
+    if report_type == 'business':
+        return _business(rng, catalog, day, lift)
+    if report_type == 'advertising':
+        return _advertising(rng, keywords, day, lift)
+    return _inventory(rng, catalog, day, day_index)
+
+
+def _business(rng: np.random.Generator, catalog: pd.DataFrame, day: np.datetime64, lift: float) -> pd.DataFrame:
+    """Sessions, units and sales per product for one day."""
+    sessions = rng.poisson(catalog['sessions'].to_numpy() * lift)
+    units = rng.binomial(sessions, catalog['conversion'].to_numpy())
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        conversion = np.where(sessions > 0, units / sessions, 0.0)
+
+    return pd.DataFrame({
+        'date': day,
+        'sku': catalog['sku'],
+        'asin': catalog['asin'],
+        'title': catalog['title'],
+        'sessions': sessions,
+        'units_ordered': units,
+        'ordered_product_sales': (units * catalog['price'].to_numpy()).round(2),
+        'total_order_items': units + rng.binomial(units, 0.08),
+        'conversion_rate': conversion.round(2),
+    })
+
+
+def _keywords(catalog: pd.DataFrame, store_index: int, seed: int) -> pd.DataFrame:
+    """Advertised keywords of a store, one per catalog item, biased to best sellers."""
+    rng = np.random.default_rng([seed, store_index, 5])
+    size = len(catalog)
+    slot = np.arange(size)
+    product = rng.choice(size, size, p=catalog['popularity'].to_numpy() / catalog['popularity'].sum())
+
+    ad_group = slot // KEYWORDS_PER_AD_GROUP
+    campaign = ad_group // AD_GROUPS_PER_CAMPAIGN
+    automatic = campaign % 3 == 0
+    words = rng.integers(len(PRODUCT_WORDS), size=size)
+    nouns = rng.integers(len(PRODUCT_NOUNS), size=size)
+
+    return pd.DataFrame({
+        'campaign_name': [f"SYN Campaign {c:04d} - {'Auto' if a else 'Manual'}" for c, a in zip(campaign, automatic)],
+        'ad_group_name': [f"Ad Group {g % AD_GROUPS_PER_CAMPAIGN:02d}" for g in ad_group],
+        'targeting_type': np.where(automatic, 'Automatic', 'Manual'),
+        'match_type': np.where(automatic, 'Broad', np.array(MATCH_TYPES)[rng.integers(len(MATCH_TYPES), size=size)]),
+        'search_term': [f"{PRODUCT_WORDS[w]} {PRODUCT_NOUNS[n]} {s}".lower() for w, n, s in zip(words, nouns, slot)],
+        'impressions': 4000 * np.sqrt(catalog['popularity'].to_numpy()[product]) + 20,
+        'ctr': rng.beta(2, 180, size),
+        'cpc': rng.lognormal(np.log(0.9), 0.4, size).round(2).clip(0.05),
+        'conversion': catalog['conversion'].to_numpy()[product],
+        'price': catalog['price'].to_numpy()[product],
+    })
+
+
+def _advertising(rng: np.random.Generator, keywords: pd.DataFrame, day: np.datetime64, lift: float) -> pd.DataFrame:
+    """Impressions, clicks, spend and attributed sales per keyword for one day."""
+    impressions = rng.poisson(keywords['impressions'].to_numpy() * lift)
+    clicks = rng.binomial(impressions, keywords['ctr'].to_numpy())
+    orders = rng.binomial(clicks, keywords['conversion'].to_numpy())
+    units = orders + rng.binomial(orders, 0.1)
+    cpc = np.where(clicks > 0, keywords['cpc'].to_numpy(), 0.0)
+    spend = (clicks * cpc).round(2)
+    sales = (units * keywords['price'].to_numpy()).round(2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ctr = np.where(impressions > 0, clicks / impressions * 100, 0.0)
+        acos = np.where(sales > 0, spend / sales * 100, 0.0)
+        conversion = np.where(clicks > 0, orders / clicks, 0.0)
+
+    return pd.DataFrame({
+        'date': day,
+        **{column: keywords[column] for column in
+           ('campaign_name', 'ad_group_name', 'targeting_type', 'match_type', 'search_term')},
+        'impressions': impressions,
+        'clicks': clicks,
+        'ctr': ctr.round(4),
+        'cpc': cpc,
+        'spend': spend,
+        'total_sales': sales,
+        'acos': acos.clip(max=999).round(4),
+        'total_orders': orders,
+        'total_units': units,
+        'conversion_rate': conversion.round(4),
+    })
+
+
+def _inventory(rng: np.random.Generator, catalog: pd.DataFrame, day: np.datetime64, day_index: int) -> pd.DataFrame:
+    """Stock snapshot for one day, following a restock cycle per product."""
+    cycle = catalog['restock_days'].to_numpy()
+    daily_units = catalog['sessions'].to_numpy() * catalog['conversion'].to_numpy()
+    peak = np.ceil(daily_units * cycle * catalog['cover'].to_numpy())
+    level = peak * (1 - (day_index + catalog['restock_phase'].to_numpy()) % cycle / cycle)
+
+    fulfillable = rng.poisson(level)
+    fba = catalog['fba'].to_numpy()
+    afn_fulfillable = np.where(fba, fulfillable, 0)
+    unsellable = np.where(fba, rng.poisson(level * 0.01), 0)
+    reserved = np.where(fba, rng.poisson(level * 0.04), 0)
+    warehouse = afn_fulfillable + unsellable + reserved
+
+    return pd.DataFrame({
+        'date': day,
+        'sku': catalog['sku'],
+        'asin': catalog['asin'],
+        'product_name': catalog['title'],
+        'condition': 'New',
+        'price': catalog['price'],
+        'mfn_listing_exists': ~fba,
+        'mfn_fulfillable_quantity': np.where(fba, 0, fulfillable),
+        'afn_listing_exists': fba,
+        'afn_warehouse_quantity': warehouse,
+        'afn_fulfillable_quantity': afn_fulfillable,
+        'afn_unsellable_quantity': unsellable,
+        'afn_reserved_quantity': reserved,
+        # The upload validator defines the AFN total as the sum of the other AFN columns
+        'afn_total_quantity': warehouse + afn_fulfillable + unsellable + reserved,
+        'per_unit_volume': catalog['volume'],
+    })
+
+
+def _returns(rng: np.random.Generator, catalog: pd.DataFrame, dates: List[date],
+             lift: np.ndarray, count: int) -> pd.DataFrame:
+    """Return events sampled from demand a few days earlier."""
+    lagged = np.concatenate([np.full(RETURN_LAG_DAYS, lift[0]), lift])[:len(lift)]
+    day = np.sort(rng.choice(len(dates), count, p=lagged / lagged.sum()))
+    weight = catalog['sessions'].to_numpy() * catalog['conversion'].to_numpy() * catalog['return_rate'].to_numpy()
+    product = rng.choice(len(catalog), count, p=weight / weight.sum())
+
+    quantity = 1 + rng.binomial(2, 0.05, count)
+    status = np.array(RETURN_STATUSES)[rng.choice(len(RETURN_STATUSES), count, p=RETURN_STATUS_WEIGHTS)]
+    refund = np.where(status == 'Rejected', 0.0, (catalog['price'].to_numpy()[product] * quantity).round(2))
+    carrier = rng.integers(len(VALID_RETURN_CARRIERS), size=count)
+    order_parts = [rng.integers(low, high, count).tolist() for low, high in ((100, 1000), (10 ** 6, 10 ** 7), (10 ** 6, 10 ** 7))]
+
+    return pd.DataFrame({
+        'return_date': np.array(dates, dtype='datetime64[ns]')[day],
+        'order_id': [f"{a}-{b}-{c}" for a, b, c in zip(*order_parts)],
+        'sku': catalog['sku'].to_numpy()[product],
+        'asin': catalog['asin'].to_numpy()[product],
+        'title': catalog['title'].to_numpy()[product],
+        'quantity': quantity,
+        'return_reason': np.array(RETURN_REASONS)[rng.choice(len(RETURN_REASONS), count, p=RETURN_REASON_WEIGHTS)],
+        'status': status,
+        'refund_amount': refund,
+        'return_center': np.array(VALID_RETURN_CENTERS)[rng.choice(len(VALID_RETURN_CENTERS), count, p=RETURN_CENTER_WEIGHTS)],
+        'return_carrier': np.array(VALID_RETURN_CARRIERS)[carrier],
+        'tracking_number': [
+            f"{VALID_TRACKING_PREFIXES[c]}{n:012d}"
+            for c, n in zip(carrier.tolist(), rng.integers(10 ** 11, 10 ** 12, count).tolist())
+        ],
+    })
+
+
+def _with_dimension_ids(frame: pd.DataFrame, dimension_ids: Dict) -> pd.DataFrame:
+    """Replace advertising dimension names with ids, resolving unseen names once."""
+    names = ['store_id', 'campaign_name', 'ad_group_name', 'search_term']
+    keys = list(zip(*(frame[column] for column in names)))
+
+    missing = pd.DataFrame(sorted(set(keys) - dimension_ids.keys()), columns=names)
+    if len(missing):
+        resolved = resolve_dimensions(missing)
+        dimension_ids.update(zip(
+            zip(*(resolved[column] for column in names)),
+            zip(resolved['campaign_id'], resolved['ad_group_id'], resolved['search_term_id'])
+        ))
+
+    ids = np.array([dimension_ids[key] for key in keys]).reshape(-1, 3)
+    frame['campaign_id'], frame['ad_group_id'], frame['search_term_id'] = ids.T.tolist()
+    return frame.drop(columns=names[1:])
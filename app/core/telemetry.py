@@ -0,0 +1,479 @@
+"""Prometheus-compatible operational metrics.
+
+Counters, gauges and histograms live in a small local registry and are
+served at ``/metrics`` in the Prometheus text format. The instrumented
+code updates the metrics defined at the bottom of this module:
+
+- request latency and counts per endpoint (request hooks below)
+- ingest rows, time and chunk durations (``BaseCSVProcessor``)
+- cache lookups and expiry evictions per key namespace (``app.core.cache``;
+  the metric engine's entries use the ``metric`` namespace)
+- database connections in use and pool sizes (pool events below)
+- queued, running and finished background jobs (``app.core.jobs``)
+
+With several worker processes, set ``METRICS_DIR`` to a directory shared
+by the workers. Each process then writes its values to its own file there
+from a background thread, within ``METRICS_FLUSH_INTERVAL`` seconds of a
+change, and a scrape adds up the files of all processes. A scrape folds
+the counters and histograms of processes that have exited into a retained
+file and removes their files; their gauges are dropped. Files are named
+by PID and a per-process token, so a process that reuses the PID of an
+exited one folds that file instead of overwriting it.
+
+Config:
+    METRICS_ENABLED: Serve /metrics and time requests (default True)
+    METRICS_DIR: Directory shared by worker processes (default: unset,
+        single process)
+    METRICS_TOKEN: Bearer token required by /metrics. When unset, /metrics
+        is open in debug and testing and refused (403) everywhere else
+"""
+
+import atexit
+import glob
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from flask import Flask, Response, current_app, g, request
+from sqlalchemy import event
+
+try:
+    import fcntl
+except ImportError:  # Windows: folding is not serialized across processes
+    fcntl = None
+
+METRICS_FLUSH_INTERVAL = 1.0
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Counters and histograms of exited processes, in the shared directory
+RETAINED_FILE = 'retained.json'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    """A named metric with one value per label combination."""
+
+    type = 'untyped'
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str,
+                 labelnames: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _add(self, amount: float, labels: Dict[str, Any]) -> None:
+        key = self._key(labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+        self.registry.changed()
+
+    def merge(self, total: Any, value: Any) -> Any:
+        """Combine the values of two processes."""
+        return value if total is None else total + value
+
+    def samples(self, key: Tuple[str, ...], value: Any) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError('Counters can only increase')
+        self._add(amount, labels)
+
+
+class Gauge(Metric):
+    """A value that goes up and down."""
+
+    type = 'gauge'
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        self._add(amount, labels)
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self._add(-amount, labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self.registry.lock:
+            self.values[key] = float(value)
+        self.registry.changed()
+
+
+class Histogram(Metric):
+    """Observations counted into buckets, with their sum.
+
+    Values are stored as the count per bucket (not cumulative), the count
+    above the last bucket and the sum of all observations.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str,
+                 labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self.registry.lock:
+            counts = self.values.get(key)
+            if counts is None:
+                counts = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += value
+        self.registry.changed()
+
+    def merge(self, total: Any, value: Any) -> Any:
+        if total is None:
+            return list(value)
+        return [a + b for a, b in zip(total, value)]
+
+    def samples(self, key: Tuple[str, ...], value: Any) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        labels = dict(zip(self.labelnames, key))
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), value[:-1]):
+            cumulative += count
+            yield f'{self.name}_bucket', {**labels, 'le': _format_value(bound)}, cumulative
+        yield f'{self.name}_sum', labels, value[-1]
+        yield f'{self.name}_count', labels, cumulative
+
+
+class MetricsRegistry:
+    """The metrics of this process, optionally shared through a directory."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.metrics: Dict[str, Metric] = {}
+        self.lock = threading.Lock()
+        self.directory = directory
+        self._start_process()
+
+    def _start_process(self) -> None:
+        self._token = uuid.uuid4().hex[:12]
+        self._dirty = False
+        self._flusher: Optional[threading.Thread] = None
+        self._claimed = False
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def _register(self, metric: Metric) -> Any:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def changed(self) -> None:
+        """Have the background thread write this process's file."""
+        if not self.directory:
+            return
+        self._dirty = True
+        if self._flusher is None:
+            with self.lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_periodically, name='metrics-flush', daemon=True
+                    )
+                    self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(METRICS_FLUSH_INTERVAL)
+            if self._dirty:
+                try:
+                    self.flush()
+                except OSError:
+                    pass  # Retried after the next change
+
+    @property
+    def path(self) -> str:
+        """This process's file in the shared directory."""
+        return os.path.join(self.directory, f'metrics-{os.getpid()}-{self._token}.json')
+
+    def flush(self) -> None:
+        """Write this process's values to its file in the shared directory."""
+        if not self.directory:
+            return
+        self._dirty = False
+        with self.lock:
+            data = json.dumps({
+                'pid': os.getpid(),
+                'metrics': {
+                    name: [[list(key), value] for key, value in metric.values.items()]
+                    for name, metric in self.metrics.items() if metric.values
+                },
+            })
+        os.makedirs(self.directory, exist_ok=True)
+        if not self._claimed:
+            # Files left with this PID belong to an exited process that had it
+            self._fold(lambda path, pid: pid == os.getpid() and path != self.path)
+            self._claimed = True
+        _write_file(self.path, data)
+
+    def reset(self) -> None:
+        """Drop all values, e.g. in a freshly forked worker."""
+        # A lock held by another thread at fork time is never released
+        self.lock = threading.Lock()
+        with self.lock:
+            for metric in self.metrics.values():
+                metric.values.clear()
+        # The parent's flush thread does not exist in the child
+        self._start_process()
+
+    def _fold(self, stale) -> None:
+        """Add the counters and histograms of stale files to the retained file.
+
+        ``stale`` is called with the path and PID of every process file; the
+        files it selects are removed once their values are retained.
+        """
+        with _directory_lock(self.directory):
+            previous = (_read_metrics(os.path.join(self.directory, RETAINED_FILE)) or {}).get('metrics', {})
+            retained = self._merge({}, {'metrics': previous})
+            folded = []
+            for path in glob.glob(os.path.join(self.directory, 'metrics-*.json')):
+                data = _read_metrics(path)
+                if data is None or not stale(path, data['pid']):
+                    continue
+                self._merge(retained, data, gauges=False)
+                folded.append(path)
+            if not folded:
+                return
+            _write_file(os.path.join(self.directory, RETAINED_FILE), json.dumps({
+                'metrics': {
+                    # Metrics this process does not define are kept as they were
+                    **{name: samples for name, samples in previous.items() if name not in self.metrics},
+                    **{name: [[list(key), value] for key, value in values.items()]
+                       for name, values in retained.items() if values},
+                },
+            }))
+            for path in folded:
+                os.remove(path)
+
+    def _merge(self, merged: Dict[str, Dict[Tuple[str, ...], Any]], data: Optional[Dict[str, Any]],
+               gauges: bool = True) -> Dict[str, Dict[Tuple[str, ...], Any]]:
+        """Add the values of one file to ``merged``."""
+        for name, samples in (data or {}).get('metrics', {}).items():
+            metric = self.metrics.get(name)
+            if metric is None or (metric.type == 'gauge' and not gauges):
+                continue
+            values = merged.setdefault(name, {})
+            for key, value in samples:
+                key = tuple(key)
+                values[key] = metric.merge(values.get(key), value)
+        return merged
+
+    def collect(self) -> Dict[str, Dict[Tuple[str, ...], Any]]:
+        """Values by metric and labels, summed over all worker processes."""
+        if not self.directory:
+            with self.lock:
+                return {name: {key: metric.merge(None, value) for key, value in metric.values.items()}
+                        for name, metric in self.metrics.items()}
+
+        self.flush()
+        self._fold(lambda path, pid: not _process_alive(pid))
+        merged: Dict[str, Dict[Tuple[str, ...], Any]] = {name: {} for name in self.metrics}
+        with _directory_lock(self.directory):
+            self._merge(merged, _read_metrics(os.path.join(self.directory, RETAINED_FILE)))
+            for path in glob.glob(os.path.join(self.directory, 'metrics-*.json')):
+                self._merge(merged, _read_metrics(path))
+        return merged
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        values = self.collect()
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.append(f'# HELP {name} {_escape(metric.documentation)}')
+            lines.append(f'# TYPE {name} {metric.type}')
+            for key in sorted(values.get(name, {})):
+                for sample, labels, value in metric.samples(key, values[name][key]):
+                    lines.append(f'{sample}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def _directory_lock(directory: str):
+    """Serialize folding and reading the shared directory across processes."""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(directory, '.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_metrics(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None  # Removed, or not written yet
+
+
+def _write_file(path: str, data: str) -> None:
+    with open(f'{path}.tmp', 'w') as f:
+        f.write(data)
+    os.replace(f'{path}.tmp', path)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _escape(value: str, quote: bool = False) -> str:
+    value = value.replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value, quote=True)}"' for name, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    return '+Inf' if value == math.inf else repr(float(value))
+
+
+def _start_request() -> None:
+    g.metrics_request_start = time.perf_counter()
+
+
+def _record_request(response):
+    start = g.pop('metrics_request_start', None)
+    if start is not None:
+        endpoint = request.endpoint or 'unmatched'
+        REQUEST_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint, method=request.method)
+        REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+    return response
+
+
+def metrics_view():
+    """Serve the metrics to a Prometheus scrape."""
+    token = current_app.config.get('METRICS_TOKEN')
+    if not token:
+        if not (current_app.debug or current_app.testing):
+            return Response('Set METRICS_TOKEN to enable /metrics\n', status=403, mimetype='text/plain')
+    elif request.headers.get('Authorization') != f'Bearer {token}':
+        return Response('Unauthorized\n', status=401, mimetype='text/plain')
+    return Response(registry.render(), content_type=METRICS_CONTENT_TYPE)
+
+
+def _watch_pool(bind: Optional[str], pool) -> None:
+    """Count a pool's checked out connections and report its size."""
+    label = bind or 'default'
+    # Only queue pools have a fixed size
+    size = getattr(pool, 'size', None)
+
+    def checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        DB_CONNECTIONS_IN_USE.inc()
+        # Set on first use rather than at startup, so that forked workers,
+        # whose values start from zero, report the size too
+        if callable(size) and (label,) not in DB_POOL_SIZE.values:
+            DB_POOL_SIZE.set(size(), bind=label)
+
+    event.listen(pool, 'checkout', checkout)
+    event.listen(pool, 'checkin', _pool_checkin)
+
+
+def _pool_checkin(dbapi_connection, connection_record) -> None:
+    DB_CONNECTIONS_IN_USE.dec()
+
+
+def init_app(app: Flask) -> None:
+    """Serve /metrics, time requests and watch the database pool."""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    registry.directory = app.config.get('METRICS_DIR')
+
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+
+    from app.extensions import db
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            _watch_pool(bind, engine.pool)
+
+
+registry = MetricsRegistry()
+
+# A forked worker starts from zero instead of repeating its parent's counts
+os.register_at_fork(after_in_child=registry.reset)
+atexit.register(registry.flush)
+
+REQUEST_LATENCY = registry.histogram(
+    'http_request_duration_seconds', 'Request latency by endpoint', ['endpoint', 'method']
+)
+REQUESTS = registry.counter(
+    'http_requests_total', 'Requests by endpoint and status', ['endpoint', 'method', 'status']
+)
+INGEST_ROWS = registry.counter(
+    'ingest_rows_total', 'CSV rows saved by report type', ['report_type']
+)
+INGEST_SECONDS = registry.counter(
+    'ingest_seconds_total', 'Time spent saving CSV chunks by report type', ['report_type']
+)
+INGEST_CHUNK_DURATION = registry.histogram(
+    'ingest_chunk_duration_seconds', 'Time to save one CSV chunk by report type', ['report_type'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+INGEST_FILES = registry.counter(
+    'ingest_files_total', 'Processed CSV files by report type and outcome', ['report_type', 'status']
+)
+CACHE_LOOKUPS = registry.counter(
+    'cache_lookups_total', 'Cache lookups by key namespace and result (hit or miss)', ['namespace', 'result']
+)
+CACHE_EVICTIONS = registry.counter(
+    'cache_evictions_total', 'Expired or least recently used cache entries removed by key namespace', ['namespace']
+)
+DB_CONNECTIONS_IN_USE = registry.gauge(
+    'db_pool_connections_in_use', 'Database connections checked out of the pool'
+)
+DB_POOL_SIZE = registry.gauge(
+    'db_pool_size', 'Configured database pool size by bind', ['bind']
+)
+JOBS_QUEUED = registry.gauge(
+    'jobs_queued', 'Background jobs waiting for a worker'
+)
+JOBS_RUNNING = registry.gauge(
+    'jobs_running', 'Background jobs running'
+)
+JOBS = registry.counter(
+    'jobs_total', 'Finished background jobs by outcome', ['status']
+)
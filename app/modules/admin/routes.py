@@ -1,7 +1,8 @@
 """Admin routes for Amazon Seller Support."""
 
 from typing import Dict, Any
-from flask import Blueprint, render_template, jsonify, request
+from flask import Blueprint, current_app, render_template, jsonify, request
+from app.core.slow_queries import SLOW_QUERY_PAGE_SIZE, get_slow_query_log
 from app.decorators import admin_required
 from app.models import User
 from app.modules.category.services.category_service import CategoryService
@@ -23,6 +24,22 @@ def user_management():
     users = User.query.all()
     return render_template('user-management.html', users=users)
 
+@bp.route('/slow-queries', methods=['GET'])
+@admin_required
+def slow_queries():
+    """Admin slow-query log page."""
+    limit = request.args.get('limit', SLOW_QUERY_PAGE_SIZE, type=int)
+    records = get_slow_query_log(current_app).records(limit)
+    return render_template('slow-queries.html', records=records,
+                           threshold=current_app.config.get('SLOW_QUERY_MS'))
+
+@bp.route('/api/slow-queries', methods=['GET'])
+@admin_required
+def slow_queries_api():
+    """Get the newest slow-query records."""
+    limit = request.args.get('limit', SLOW_QUERY_PAGE_SIZE, type=int)
+    return jsonify({'records': get_slow_query_log(current_app).records(limit)})
+
 @bp.route('/categories/bulk-update', methods=['POST'])
 @admin_required
 def bulk_update_categories():
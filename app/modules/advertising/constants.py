@@ -20,5 +20,16 @@ ERROR_MESSAGES = {
     'MISSING_COLUMNS': 'Missing required columns',
     'INVALID_NUMERIC': 'Invalid numeric value',
     'NO_STORE_ACCESS': 'No access to the specified store',
-    'UNKNOWN_ERROR': 'An unknown error occurred'
-} 
\ No newline at end of file
+    'UNKNOWN_ERROR': 'An unknown error occurred',
+    'INVALID_DIMENSION': 'Invalid leaderboard dimension',
+    'INVALID_METRIC': 'Invalid leaderboard metric'
+}
+
+# Leaderboard options
+LEADERBOARD_DIMENSIONS = ['search_term', 'campaign', 'ad_group']
+LEADERBOARD_METRICS = [
+    'spend', 'sales', 'impressions', 'clicks', 'orders',
+    'acos', 'roas', 'ctr', 'cpc', 'conversion_rate'
+]
+LEADERBOARD_DEFAULT_LIMIT = 50
+LEADERBOARD_MAX_LIMIT = 500 
\ No newline at end of file
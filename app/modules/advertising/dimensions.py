@@ -0,0 +1,82 @@
+"""Bulk resolution of advertising dimension names to ids."""
+
+from typing import Dict, Iterable, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import insert, tuple_
+
+from app.extensions import db
+from app.modules.advertising.models import AdCampaign, AdGroup, AdSearchTerm
+
+# Keys per IN (...) lookup, well below SQLite's bound parameter limit
+LOOKUP_BATCH_SIZE = 500
+
+def resolve_dimensions(df: pd.DataFrame) -> pd.DataFrame:
+    """Add dimension id columns to an advertising report DataFrame.
+
+    Campaign, ad group and search term names are looked up with a few
+    batched queries; names that do not exist yet are inserted in bulk.
+
+    Args:
+        df: DataFrame with store_id, campaign_name, ad_group_name and search_term
+
+    Returns:
+        pd.DataFrame: The same DataFrame with campaign_id, ad_group_id and
+        search_term_id columns added
+    """
+    campaign_keys = list(zip(df['store_id'].astype(int), df['campaign_name']))
+    campaign_ids = _get_or_create_ids(AdCampaign, ('store_id', 'name'), campaign_keys)
+    df['campaign_id'] = [campaign_ids[key] for key in campaign_keys]
+
+    ad_group_keys = list(zip(df['campaign_id'], df['ad_group_name']))
+    ad_group_ids = _get_or_create_ids(AdGroup, ('campaign_id', 'name'), ad_group_keys)
+    df['ad_group_id'] = [ad_group_ids[key] for key in ad_group_keys]
+
+    term_keys = [(term,) for term in df['search_term']]
+    term_ids = _get_or_create_ids(AdSearchTerm, ('term',), term_keys)
+    df['search_term_id'] = [term_ids[key] for key in term_keys]
+
+    return df
+
+def _get_or_create_ids(model, columns: Sequence[str], keys: Iterable[Tuple]) -> Dict[Tuple, int]:
+    """Map natural keys to ids, inserting the missing rows.
+
+    Args:
+        model: Dimension model
+        columns: Natural key column names
+        keys: Natural key tuples, duplicates allowed
+
+    Returns:
+        Dict[Tuple, int]: Natural key -> id
+    """
+    wanted = {tuple(_plain(value) for value in key) for key in keys}
+    ids = _lookup_ids(model, columns, wanted)
+
+    missing = wanted - ids.keys()
+    if missing:
+        db.session.execute(insert(model), [dict(zip(columns, key)) for key in missing])
+        ids.update(_lookup_ids(model, columns, missing))
+
+    return ids
+
+def _lookup_ids(model, columns: Sequence[str], keys: set) -> Dict[Tuple, int]:
+    """Fetch ids for existing natural keys in batches."""
+    key_columns = [getattr(model, column) for column in columns]
+    keys = list(keys)
+    ids = {}
+
+    for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+        batch = keys[start:start + LOOKUP_BATCH_SIZE]
+        if len(key_columns) == 1:
+            condition = key_columns[0].in_([key[0] for key in batch])
+        else:
+            condition = tuple_(*key_columns).in_(batch)
+
+        rows = db.session.query(model.id, *key_columns).filter(condition).all()
+        ids.update({tuple(row[1:]): row[0] for row in rows})
+
+    return ids
+
+def _plain(value):
+    """Convert numpy scalars to Python values for binding and dict keys."""
+    return value.item() if hasattr(value, 'item') else value
@@ -1,5 +1,6 @@
 """Advertising module models."""
 
+from .dimensions import AdCampaign, AdGroup, AdSearchTerm
 from .report import AdvertisingReport
 
-__all__ = ['AdvertisingReport']
+__all__ = ['AdvertisingReport', 'AdCampaign', 'AdGroup', 'AdSearchTerm']
@@ -0,0 +1,55 @@
+"""Advertising dimension models.
+
+Campaign, ad group and search term names are stored once in these tables
+and referenced from ``advertising_reports`` by integer keys.
+"""
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app import db
+
+class AdCampaign(db.Model):
+    """Advertising campaign of a store."""
+    __tablename__ = 'ad_campaigns'
+
+    id = db.Column(db.Integer, primary_key=True)
+    store_id = db.Column(db.Integer, ForeignKey('stores.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+
+    # Relationships
+    ad_groups = relationship('AdGroup', back_populates='campaign', lazy=True)
+
+    __table_args__ = (
+        Index('uq_ad_campaign_store_name', 'store_id', 'name', unique=True),
+    )
+
+    def __repr__(self):
+        return f'<AdCampaign {self.id} {self.name}>'
+
+class AdGroup(db.Model):
+    """Ad group within a campaign."""
+    __tablename__ = 'ad_groups'
+
+    id = db.Column(db.Integer, primary_key=True)
+    campaign_id = db.Column(db.Integer, ForeignKey('ad_campaigns.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+
+    # Relationships
+    campaign = relationship('AdCampaign', back_populates='ad_groups')
+
+    __table_args__ = (
+        Index('uq_ad_group_campaign_name', 'campaign_id', 'name', unique=True),
+    )
+
+    def __repr__(self):
+        return f'<AdGroup {self.id} {self.name}>'
+
+class AdSearchTerm(db.Model):
+    """Customer search term, shared by all stores."""
+    __tablename__ = 'ad_search_terms'
+
+    id = db.Column(db.Integer, primary_key=True)
+    term = db.Column(db.String(200), nullable=False, unique=True)
+
+    def __repr__(self):
+        return f'<AdSearchTerm {self.id} {self.term}>'
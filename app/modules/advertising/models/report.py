@@ -1,10 +1,12 @@
 """Advertising report model for storing Amazon seller advertising data."""
 
 from decimal import Decimal
-from sqlalchemy import Index
+from sqlalchemy import ForeignKey, Index, select
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from app.core.models.base_report import BaseReport
 from app import db
+from .dimensions import AdCampaign, AdGroup, AdSearchTerm
 
 class AdvertisingReport(BaseReport):
     """Advertising report model for storing Amazon seller advertising data.
@@ -15,12 +17,12 @@ class AdvertisingReport(BaseReport):
     """
     __tablename__ = 'advertising_reports'
     
-    # Campaign Structure
-    campaign_name = db.Column(db.String(100), nullable=False)
-    ad_group_name = db.Column(db.String(100), nullable=False)
+    # Campaign Structure (names live in the dimension tables)
+    campaign_id = db.Column(db.Integer, ForeignKey('ad_campaigns.id'), nullable=False)
+    ad_group_id = db.Column(db.Integer, ForeignKey('ad_groups.id'), nullable=False)
+    search_term_id = db.Column(db.Integer, ForeignKey('ad_search_terms.id'), nullable=False)
     targeting_type = db.Column(db.String(50), nullable=False)
     match_type = db.Column(db.String(50), nullable=False)
-    search_term = db.Column(db.String(200), nullable=False)
     
     # Performance Metrics
     impressions = db.Column(db.Integer, nullable=False, default=0)
@@ -36,12 +38,44 @@ class AdvertisingReport(BaseReport):
     
     # Relationships
     store = relationship('Store', back_populates='advertising_reports')
+    campaign = relationship('AdCampaign', lazy='joined')
+    ad_group = relationship('AdGroup', lazy='joined')
+    term = relationship('AdSearchTerm', lazy='joined')
     
     # Indexes for performance
     __table_args__ = (
         Index('idx_advertising_store_date', 'store_id', 'date'),
-        Index('idx_advertising_campaign', 'campaign_name'),
+        Index('idx_advertising_campaign', 'campaign_id'),
+        Index('uq_advertising_upsert', 'store_id', 'date', 'campaign_id', 'ad_group_id',
+              'targeting_type', 'search_term_id', unique=True),
     )
+
+    @hybrid_property
+    def campaign_name(self):
+        """Campaign name from the campaign dimension."""
+        return self.campaign.name if self.campaign else None
+
+    @campaign_name.expression
+    def campaign_name(cls):
+        return select(AdCampaign.name).where(AdCampaign.id == cls.campaign_id).scalar_subquery()
+
+    @hybrid_property
+    def ad_group_name(self):
+        """Ad group name from the ad group dimension."""
+        return self.ad_group.name if self.ad_group else None
+
+    @ad_group_name.expression
+    def ad_group_name(cls):
+        return select(AdGroup.name).where(AdGroup.id == cls.ad_group_id).scalar_subquery()
+
+    @hybrid_property
+    def search_term(self):
+        """Search term text from the search term dimension."""
+        return self.term.term if self.term else None
+
+    @search_term.expression
+    def search_term(cls):
+        return select(AdSearchTerm.term).where(AdSearchTerm.id == cls.search_term_id).scalar_subquery()
     
     def __repr__(self):
         return f'<AdvertisingReport {self.id} for {self.campaign_name}>'
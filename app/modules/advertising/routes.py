@@ -1,18 +1,14 @@
 """Advertising module routes."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from flask import Blueprint, jsonify, request, render_template, flash, redirect, url_for, current_app, send_file
 from app.utils.decorators import login_required, admin_required, store_required
 from flask_login import current_user
-from app.utils.analytics_engine import AnalyticsEngine
 from app.core.models import Store
 from app.modules.advertising.models import AdvertisingReport
-from app.utils.constants import get_category_by_asin, ASIN_CATEGORIES
-from app.modules.upload_csv.processors.advertising import AdvertisingCSVProcessor
 import logging
 import os
-import pandas as pd
-from app.modules.advertising.constants import ERROR_MESSAGES
+from app.modules.advertising.constants import ERROR_MESSAGES, LEADERBOARD_DEFAULT_LIMIT
 from app.modules.upload_csv.exceptions import CSVError
 from app.modules.advertising.services import AdvertisingReportService
 
@@ -47,6 +43,9 @@ def upload():
 @store_required
 def process_csv():
     """Advertising report CSV processing endpoint."""
+    import pandas as pd
+    from app.modules.upload_csv.processors.advertising import AdvertisingCSVProcessor
+
     try:
         # Get DataFrame from request
         df = pd.DataFrame(request.json['data'])
@@ -198,4 +197,43 @@ def get_trends():
         
     except Exception as e:
         logger.exception(f"Error getting trends: {str(e)}")
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/leaderboard')
+@store_required
+def get_leaderboard():
+    """Get top or bottom search terms, campaigns or ad groups by a metric."""
+    try:
+        store_id = current_user.active_store_id
+        start_date, end_date = _parse_date_range(request.args)
+        service = AdvertisingReportService(store_id)
+        leaderboard = service.get_leaderboard(
+            dimension=request.args.get('dimension', 'search_term'),
+            metric=request.args.get('metric', 'spend'),
+            order='asc' if request.args.get('order') == 'asc' else 'desc',
+            limit=request.args.get('limit', LEADERBOARD_DEFAULT_LIMIT, type=int),
+            page=request.args.get('page', 1, type=int),
+            start_date=start_date,
+            end_date=end_date,
+            min_impressions=request.args.get('min_impressions', 0, type=int),
+            campaign=request.args.get('campaign')
+        )
+        return jsonify(leaderboard)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception(f"Error getting leaderboard: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def _parse_date_range(args):
+    """Parse start_date/end_date (YYYY-MM-DD) into an inclusive datetime range."""
+    start_date = args.get('start_date')
+    end_date = args.get('end_date')
+
+    if start_date:
+        start_date = datetime.strptime(start_date, '%Y-%m-%d')
+    if end_date:
+        end_date = datetime.combine(datetime.strptime(end_date, '%Y-%m-%d'), time.max)
+
+    return start_date or None, end_date or None
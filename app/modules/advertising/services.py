@@ -2,70 +2,65 @@
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
-from sqlalchemy import func, and_
-from app.modules.advertising.models import AdvertisingReport
-import pandas as pd
+from sqlalchemy import func, and_, select
+from app.modules.advertising.models import AdvertisingReport, AdCampaign, AdGroup, AdSearchTerm
 
+from app.core.analytics.kpis import advertising_kpis
 from app.extensions import db
-from .constants import ERROR_MESSAGES
+from app.utils.pagination import paginate_query
+from .constants import (
+    ERROR_MESSAGES, LEADERBOARD_DIMENSIONS, LEADERBOARD_METRICS,
+    LEADERBOARD_DEFAULT_LIMIT, LEADERBOARD_MAX_LIMIT
+)
 
 def get_advertising_trends(
     store_id: int,
     start_date: str,
     end_date: str,
     group_by: str = 'daily',
-    campaign_id: str = None
+    campaign: str = None
 ) -> dict:
-    """Get advertising trends for the specified period."""
+    """Get advertising trends for the specified period.
+
+    Daily totals and previous-period totals are aggregated in SQL over the
+    (store_id, date) index; only one row per day reaches Python.
+    """
     try:
         # Convert dates to datetime objects
         start_date = datetime.strptime(start_date, '%Y-%m-%d')
         end_date = datetime.strptime(end_date, '%Y-%m-%d')
 
-        # Build base query
-        query = AdvertisingReport.query.filter(
+        # Daily totals for the current period
+        day = func.date(AdvertisingReport.date).label('day')
+        query = db.session.query(
+            day,
+            func.sum(AdvertisingReport.impressions).label('impressions'),
+            func.sum(AdvertisingReport.clicks).label('clicks'),
+            func.sum(AdvertisingReport.spend).label('spend'),
+            func.sum(AdvertisingReport.total_sales).label('sales'),
+            func.sum(AdvertisingReport.total_orders).label('orders'),
+            func.sum(AdvertisingReport.total_units).label('units')
+        ).filter(
             AdvertisingReport.store_id == store_id,
             AdvertisingReport.date.between(start_date, end_date)
         )
 
-        # Apply campaign filter if provided
-        if campaign_id:
-            query = query.filter(AdvertisingReport.campaign_id == campaign_id)
+        # Campaigns are identified by name
+        if campaign:
+            query = query.filter(_campaign_filter(store_id, campaign))
 
-        # Execute query
-        reports = query.order_by(AdvertisingReport.date).all()
+        rows = query.group_by(day).order_by(day).all()
 
-        if not reports:
+        if not rows:
             return _get_empty_trend_data()
 
-        # Group data by date
-        data = {}
-        for report in reports:
-            date_key = report.date.strftime('%Y-%m-%d')
-            if date_key not in data:
-                data[date_key] = {
-                    'impressions': 0,
-                    'clicks': 0,
-                    'spend': 0,
-                    'sales': 0,
-                    'orders': 0,
-                    'units': 0
-                }
-            data[date_key]['impressions'] += report.impressions
-            data[date_key]['clicks'] += report.clicks
-            data[date_key]['spend'] += float(report.spend)
-            data[date_key]['sales'] += float(report.total_sales)
-            data[date_key]['orders'] += report.orders
-            data[date_key]['units'] += report.units
-
-        # Calculate metrics
-        labels = sorted(data.keys())
-        impressions = [data[date]['impressions'] for date in labels]
-        clicks = [data[date]['clicks'] for date in labels]
-        spend = [data[date]['spend'] for date in labels]
-        sales = [data[date]['sales'] for date in labels]
-        orders = [data[date]['orders'] for date in labels]
-        units = [data[date]['units'] for date in labels]
+        labels = [_format_date(row.day) for row in rows]
+        impressions = [int(row.impressions or 0) for row in rows]
+        clicks = [int(row.clicks or 0) for row in rows]
+        spend = [float(row.spend or 0) for row in rows]
+        sales = [float(row.sales or 0) for row in rows]
+        orders = [int(row.orders or 0) for row in rows]
+        units = [int(row.units or 0) for row in rows]
         
         # Calculate derived metrics
         ctr = [
@@ -93,17 +88,20 @@ def get_advertising_trends(
         prev_start = start_date - timedelta(days=period_length)
         prev_end = start_date - timedelta(days=1)
 
-        prev_query = AdvertisingReport.query.filter(
+        prev_query = db.session.query(
+            func.coalesce(func.sum(AdvertisingReport.spend), 0).label('spend'),
+            func.coalesce(func.sum(AdvertisingReport.total_sales), 0).label('sales')
+        ).filter(
             AdvertisingReport.store_id == store_id,
             AdvertisingReport.date.between(prev_start, prev_end)
         )
 
-        if campaign_id:
-            prev_query = prev_query.filter(AdvertisingReport.campaign_id == campaign_id)
+        if campaign:
+            prev_query = prev_query.filter(_campaign_filter(store_id, campaign))
 
-        prev_reports = prev_query.all()
-        previous_spend = sum(float(r.spend) for r in prev_reports)
-        previous_sales = sum(float(r.total_sales) for r in prev_reports)
+        previous = prev_query.one()
+        previous_spend = float(previous.spend)
+        previous_sales = float(previous.sales)
 
         spend_growth = ((total_spend - previous_spend) / previous_spend * 100) if previous_spend > 0 else 0
         sales_growth = ((total_sales - previous_sales) / previous_sales * 100) if previous_sales > 0 else 0
@@ -138,17 +136,44 @@ def get_advertising_trends(
 def get_campaigns(store_id: int) -> List[Dict]:
     """Get available campaigns for the store."""
     try:
-        # Get all campaigns and their IDs for the store
-        campaigns = AdvertisingReport.query.with_entities(
-            AdvertisingReport.campaign_id,
-            AdvertisingReport.campaign_name
-        ).distinct().filter_by(store_id=store_id).all()
+        # Campaigns are identified by name
+        campaigns = AdCampaign.query.with_entities(
+            AdCampaign.name
+        ).filter_by(store_id=store_id).order_by(AdCampaign.name).all()
         
-        return [{'id': cid, 'name': name} for cid, name in campaigns]
+        return [{'id': name, 'name': name} for (name,) in campaigns]
     except Exception as e:
         print(f"Error in get_campaigns: {str(e)}")
         return []
 
+def _campaign_filter(store_id: int, campaign: str):
+    """Filter reports by campaign name through the campaign dimension."""
+    return AdvertisingReport.campaign_id.in_(
+        select(AdCampaign.id).where(
+            AdCampaign.store_id == store_id,
+            AdCampaign.name == campaign
+        )
+    )
+
+def _ad_group_filter(store_id: int, ad_group: str):
+    """Filter reports by ad group name through the ad group dimension."""
+    return AdvertisingReport.ad_group_id.in_(
+        select(AdGroup.id).join(AdCampaign).where(
+            AdCampaign.store_id == store_id,
+            AdGroup.name == ad_group
+        )
+    )
+
+def _ratio(numerator: float, denominator: float) -> Optional[float]:
+    """Round a ratio to two decimals, or None when the denominator is zero."""
+    return round(numerator / denominator, 2) if denominator else None
+
+def _format_date(value) -> str:
+    """Format a SQL DATE() result; SQLite returns strings, others dates."""
+    if isinstance(value, str):
+        return value[:10]
+    return value.strftime('%Y-%m-%d')
+
 def _get_empty_trend_data() -> Dict:
     """Return empty trend data structure."""
     return {
@@ -182,9 +207,21 @@ class AdvertisingReportService:
         self.store_id = store_id
 
     def get_advertising_data(self, start_date=None, end_date=None, campaign=None, ad_group=None):
-        """Get advertising data based on filters."""
-        # Build base query
-        query = AdvertisingReport.query.filter(AdvertisingReport.store_id == self.store_id)
+        """Get advertising data based on filters.
+
+        All four sections are built from one grouped query with a row per
+        (day, campaign), so memory follows the number of days and campaigns
+        rather than the number of search-term rows.
+        """
+        day = func.date(AdvertisingReport.date).label('day')
+        query = db.session.query(
+            day,
+            AdvertisingReport.campaign_id,
+            func.sum(AdvertisingReport.impressions).label('impressions'),
+            func.sum(AdvertisingReport.clicks).label('clicks'),
+            func.sum(AdvertisingReport.spend).label('spend'),
+            func.sum(AdvertisingReport.total_sales).label('sales')
+        ).filter(AdvertisingReport.store_id == self.store_id)
 
         # Apply date filters
         if start_date:
@@ -194,52 +231,56 @@ class AdvertisingReportService:
 
         # Apply campaign and ad group filters
         if campaign:
-            query = query.filter(AdvertisingReport.campaign_name == campaign)
+            query = query.filter(_campaign_filter(self.store_id, campaign))
         if ad_group:
-            query = query.filter(AdvertisingReport.ad_group_name == ad_group)
+            query = query.filter(_ad_group_filter(self.store_id, ad_group))
 
-        # Get reports
-        reports = query.order_by(AdvertisingReport.date).all()
+        rows = query.group_by(day, AdvertisingReport.campaign_id).order_by(day).all()
 
-        # Process data for charts and metrics
-        performance_data = self._process_performance_data(reports)
-        metrics_data = self._process_metrics_data(reports)
-        summary_metrics = self._calculate_summary_metrics(reports)
-        campaigns_data = self._process_campaigns_data(reports)
+        # Roll the grouped rows up into daily and per-campaign totals
+        daily, campaigns = self._rollup(rows)
+        campaigns = self._name_campaigns(campaigns)
 
         return {
-            'performance': performance_data,
-            'metrics': metrics_data,
-            'summary': summary_metrics,
-            'campaigns': campaigns_data
+            'performance': self._process_performance_data(daily),
+            'metrics': self._process_metrics_data(daily),
+            'summary': self._calculate_summary_metrics(daily),
+            'campaigns': self._process_campaigns_data(campaigns)
         }
 
     def get_campaigns(self):
         """Get list of unique campaign names for the store."""
         campaigns = db.session.query(
-            AdvertisingReport.campaign_name,
+            AdCampaign.name,
             func.count(AdvertisingReport.id).label('ad_count')
+        ).join(
+            AdvertisingReport, AdvertisingReport.campaign_id == AdCampaign.id
         ).filter(
-            AdvertisingReport.store_id == self.store_id
+            AdCampaign.store_id == self.store_id
         ).group_by(
-            AdvertisingReport.campaign_name
+            AdCampaign.id, AdCampaign.name
         ).all()
 
-        return [{'name': c.campaign_name, 'ad_count': c.ad_count} for c in campaigns]
+        return [{'name': c.name, 'ad_count': c.ad_count} for c in campaigns]
 
     def get_ad_groups(self, campaign=None):
         """Get list of unique ad group names for the store and campaign."""
         query = db.session.query(
-            AdvertisingReport.ad_group_name,
+            AdGroup.name,
             func.count(AdvertisingReport.id).label('ad_count')
-        ).filter(AdvertisingReport.store_id == self.store_id)
+        ).join(
+            AdCampaign, AdGroup.campaign_id == AdCampaign.id
+        ).join(
+            AdvertisingReport, AdvertisingReport.ad_group_id == AdGroup.id
+        ).filter(AdCampaign.store_id == self.store_id)
 
         if campaign:
-            query = query.filter(AdvertisingReport.campaign_name == campaign)
+            query = query.filter(AdCampaign.name == campaign)
 
-        ad_groups = query.group_by(AdvertisingReport.ad_group_name).all()
+        # Same-named ad groups in different campaigns are listed once
+        ad_groups = query.group_by(AdGroup.name).all()
 
-        return [{'name': g.ad_group_name, 'ad_count': g.ad_count} for g in ad_groups]
+        return [{'name': g.name, 'ad_count': g.ad_count} for g in ad_groups]
 
     def get_trends(self, start_date=None, end_date=None, campaign=None):
         """Get advertising trends data."""
@@ -258,7 +299,7 @@ class AdvertisingReportService:
         if end_date:
             query = query.filter(AdvertisingReport.date <= end_date)
         if campaign:
-            query = query.filter(AdvertisingReport.campaign_name == campaign)
+            query = query.filter(_campaign_filter(self.store_id, campaign))
 
         # Group by date and get results
         trends = query.group_by(func.date(AdvertisingReport.date)).order_by('date').all()
@@ -266,17 +307,186 @@ class AdvertisingReportService:
         # Process trends data
         return self._process_trends_data(trends)
 
-    def _process_performance_data(self, reports):
-        """Process reports data for performance chart."""
-        dates = []
+    def get_leaderboard(self, dimension='search_term', metric='spend', order='desc',
+                        limit=LEADERBOARD_DEFAULT_LIMIT, page=1, start_date=None,
+                        end_date=None, min_impressions=0, campaign=None):
+        """Get the top or bottom search terms, campaigns or ad groups by a metric.
+
+        Rows are rolled up per dimension key and ranked in SQL with
+        ORDER BY ... LIMIT, so only one page of results is loaded.
+
+        Args:
+            dimension: One of LEADERBOARD_DIMENSIONS
+            metric: One of LEADERBOARD_METRICS
+            order: 'desc' for top-N, 'asc' for bottom-N
+            limit: Page size (capped at LEADERBOARD_MAX_LIMIT)
+            page: Page number, starting at 1
+            start_date: Optional start datetime of the range
+            end_date: Optional end datetime of the range, inclusive
+            min_impressions: Skip keys with fewer impressions in the range
+            campaign: Optional campaign name filter
+
+        Returns:
+            Dict with ranked items and pagination info
+
+        Raises:
+            ValueError: If the dimension or metric is not supported
+        """
+        if dimension not in LEADERBOARD_DIMENSIONS:
+            raise ValueError(ERROR_MESSAGES['INVALID_DIMENSION'])
+        if metric not in LEADERBOARD_METRICS:
+            raise ValueError(ERROR_MESSAGES['INVALID_METRIC'])
+
+        limit = max(1, min(int(limit), LEADERBOARD_MAX_LIMIT))
+        page = max(1, int(page))
+
+        key_column, name_model, name_column = {
+            'search_term': (AdvertisingReport.search_term_id, AdSearchTerm, AdSearchTerm.term),
+            'campaign': (AdvertisingReport.campaign_id, AdCampaign, AdCampaign.name),
+            'ad_group': (AdvertisingReport.ad_group_id, AdGroup, AdGroup.name)
+        }[dimension]
+
+        impressions = func.sum(AdvertisingReport.impressions)
+        clicks = func.sum(AdvertisingReport.clicks)
+        spend = func.sum(AdvertisingReport.spend)
+        sales = func.sum(AdvertisingReport.total_sales)
+        orders = func.sum(AdvertisingReport.total_orders)
+
+        # Ratios are NULL when the denominator is zero and sort last
+        metrics = {
+            'spend': spend,
+            'sales': sales,
+            'impressions': impressions,
+            'clicks': clicks,
+            'orders': orders,
+            'acos': spend * 100.0 / func.nullif(sales, 0),
+            'roas': sales * 1.0 / func.nullif(spend, 0),
+            'ctr': clicks * 100.0 / func.nullif(impressions, 0),
+            'cpc': spend * 1.0 / func.nullif(clicks, 0),
+            'conversion_rate': orders * 100.0 / func.nullif(clicks, 0)
+        }
+
+        query = db.session.query(
+            key_column.label('key'),
+            impressions.label('impressions'),
+            clicks.label('clicks'),
+            spend.label('spend'),
+            sales.label('sales'),
+            orders.label('orders')
+        ).filter(AdvertisingReport.store_id == self.store_id)
+
+        if start_date:
+            query = query.filter(AdvertisingReport.date >= start_date)
+        if end_date:
+            query = query.filter(AdvertisingReport.date <= end_date)
+        if campaign:
+            query = query.filter(_campaign_filter(self.store_id, campaign))
+
+        query = query.group_by(key_column)
+        if min_impressions:
+            query = query.having(impressions >= min_impressions)
+
+        # Ranks are positional, so pages are numbered rather than keyset; the
+        # total is counted once per data version instead of on every page
+        sort = metrics[metric]
+        result = paginate_query(
+            query.order_by(
+                sort.is_(None),
+                sort.desc() if order == 'desc' else sort.asc(),
+                key_column
+            ),
+            page=page,
+            per_page=limit,
+            count='cached',
+            store_id=self.store_id
+        )
+        rows = result['items']
+
+        names = {}
+        if rows:
+            names = dict(
+                db.session.query(name_model.id, name_column)
+                .filter(name_model.id.in_([row.key for row in rows]))
+                .all()
+            )
+
+        items = []
+        for rank, row in enumerate(rows, start=(page - 1) * limit + 1):
+            totals = {
+                'impressions': int(row.impressions or 0),
+                'clicks': int(row.clicks or 0),
+                'spend': round(float(row.spend or 0), 2),
+                'sales': round(float(row.sales or 0), 2),
+                'orders': int(row.orders or 0)
+            }
+            items.append({
+                'rank': rank,
+                'id': row.key,
+                'name': names.get(row.key),
+                **totals,
+                'acos': _ratio(totals['spend'] * 100, totals['sales']),
+                'roas': _ratio(totals['sales'], totals['spend']),
+                'ctr': _ratio(totals['clicks'] * 100, totals['impressions']),
+                'cpc': _ratio(totals['spend'], totals['clicks']),
+                'conversion_rate': _ratio(totals['orders'] * 100, totals['clicks'])
+            })
+
+        return {
+            'dimension': dimension,
+            'metric': metric,
+            'order': order,
+            'items': items,
+            'page': page,
+            'per_page': limit,
+            'has_more': result['has_more'],
+            'total': result['total'],
+            'pages': result['pages']
+        }
+
+    @staticmethod
+    def _rollup(rows):
+        """Sum (day, campaign) rows into per-day and per-campaign totals."""
+        daily = {}
+        campaigns = {}
+
+        for row in rows:
+            values = {
+                'impressions': int(row.impressions or 0),
+                'clicks': int(row.clicks or 0),
+                'spend': float(row.spend or 0),
+                'sales': float(row.sales or 0)
+            }
+            for totals in (
+                daily.setdefault(_format_date(row.day), dict.fromkeys(values, 0)),
+                campaigns.setdefault(row.campaign_id, dict.fromkeys(values, 0))
+            ):
+                for key, value in values.items():
+                    totals[key] += value
+
+        return daily, campaigns
+
+    @staticmethod
+    def _name_campaigns(campaigns):
+        """Re-key per-campaign totals from campaign id to campaign name."""
+        if not campaigns:
+            return {}
+        names = dict(
+            db.session.query(AdCampaign.id, AdCampaign.name)
+            .filter(AdCampaign.id.in_(list(campaigns)))
+            .all()
+        )
+        return {names[campaign_id]: totals for campaign_id, totals in campaigns.items()}
+
+    def _process_performance_data(self, daily):
+        """Process daily totals for performance chart."""
+        dates = list(daily)
         acos_data = []
         spend_data = []
 
-        for report in reports:
-            dates.append(report.date.strftime('%Y-%m-%d'))
-            acos = (report.spend / report.total_sales * 100) if report.total_sales > 0 else 0
+        for totals in daily.values():
+            acos = (totals['spend'] / totals['sales'] * 100) if totals['sales'] > 0 else 0
             acos_data.append(round(acos, 2))
-            spend_data.append(round(report.spend, 2))
+            spend_data.append(round(totals['spend'], 2))
 
         return {
             'labels': dates,
@@ -284,29 +494,20 @@ class AdvertisingReportService:
             'spend': spend_data
         }
 
-    def _process_metrics_data(self, reports):
-        """Process reports data for metrics chart."""
-        dates = []
-        impressions_data = []
-        clicks_data = []
-
-        for report in reports:
-            dates.append(report.date.strftime('%Y-%m-%d'))
-            impressions_data.append(report.impressions)
-            clicks_data.append(report.clicks)
-
+    def _process_metrics_data(self, daily):
+        """Process daily totals for metrics chart."""
         return {
-            'labels': dates,
-            'impressions': impressions_data,
-            'clicks': clicks_data
+            'labels': list(daily),
+            'impressions': [totals['impressions'] for totals in daily.values()],
+            'clicks': [totals['clicks'] for totals in daily.values()]
         }
 
-    def _calculate_summary_metrics(self, reports):
-        """Calculate summary metrics from reports."""
-        total_spend = sum(r.spend for r in reports)
-        total_sales = sum(r.total_sales for r in reports)
-        total_impressions = sum(r.impressions for r in reports)
-        total_clicks = sum(r.clicks for r in reports)
+    def _calculate_summary_metrics(self, daily):
+        """Calculate summary metrics from daily totals."""
+        total_spend = sum(t['spend'] for t in daily.values())
+        total_sales = sum(t['sales'] for t in daily.values())
+        total_impressions = sum(t['impressions'] for t in daily.values())
+        total_clicks = sum(t['clicks'] for t in daily.values())
 
         acos = (total_spend / total_sales * 100) if total_sales > 0 else 0
         roas = total_sales / total_spend if total_spend > 0 else 0
@@ -322,35 +523,24 @@ class AdvertisingReportService:
             'ctr': round(ctr, 2)
         }
 
-    def _process_campaigns_data(self, reports):
-        """Process reports data for campaigns table."""
-        # Group reports by campaign
-        campaigns = {}
-        for report in reports:
-            if report.campaign_name not in campaigns:
-                campaigns[report.campaign_name] = {
-                    'name': report.campaign_name,
-                    'status': report.campaign_status,
-                    'impressions': 0,
-                    'clicks': 0,
-                    'spend': 0,
-                    'sales': 0
-                }
-            
-            camp = campaigns[report.campaign_name]
-            camp['impressions'] += report.impressions
-            camp['clicks'] += report.clicks
-            camp['spend'] += report.spend
-            camp['sales'] += report.total_sales
-
-        # Calculate metrics for each campaign
-        for camp in campaigns.values():
-            camp['ctr'] = round((camp['clicks'] / camp['impressions'] * 100), 2) if camp['impressions'] > 0 else 0
-            camp['acos'] = round((camp['spend'] / camp['sales'] * 100), 2) if camp['sales'] > 0 else 0
-            camp['spend'] = round(camp['spend'], 2)
-            camp['sales'] = round(camp['sales'], 2)
-
-        return list(campaigns.values())
+    def _process_campaigns_data(self, campaigns):
+        """Process per-campaign totals for campaigns table."""
+        result = []
+        for name, camp in campaigns.items():
+            result.append({
+                'name': name,
+                # Reports carry no campaign status; a campaign with
+                # impressions in the window is shown as active
+                'status': 'Active' if camp['impressions'] > 0 else 'Inactive',
+                'impressions': camp['impressions'],
+                'clicks': camp['clicks'],
+                'spend': round(camp['spend'], 2),
+                'sales': round(camp['sales'], 2),
+                'ctr': round((camp['clicks'] / camp['impressions'] * 100), 2) if camp['impressions'] > 0 else 0,
+                'acos': round((camp['spend'] / camp['sales'] * 100), 2) if camp['sales'] > 0 else 0
+            })
+
+        return result
 
     def _process_trends_data(self, trends):
         """Process trends data."""
@@ -389,7 +579,10 @@ class AdvertisingReportService:
     @staticmethod
     def get_performance_metrics(store_id: int, days: int = 30) -> Dict:
         """Get key performance metrics for the dashboard.
-        
+
+        Totals and ratios come from a single SUM query; report rows are
+        not loaded.
+
         Args:
             store_id: Store ID to get metrics for
             days: Number of days to look back
@@ -400,35 +593,16 @@ class AdvertisingReportService:
         try:
             # Get date range
             end_date = datetime.now()
-            start_date = end_date - pd.Timedelta(days=days)
-
-            # Get data
-            reports = AdvertisingReport.query.filter(
-                AdvertisingReport.store_id == store_id,
-                AdvertisingReport.date.between(start_date, end_date)
-            ).all()
+            start_date = end_date - timedelta(days=days)
 
-            if not reports:
+            kpis = advertising_kpis(store_id, start_date, end_date)
+            if not kpis['rows']:
                 return {'error': ERROR_MESSAGES['NO_DATA']}
 
-            # Convert to DataFrame
-            df = pd.DataFrame([r.to_dict() for r in reports])
-
-            # Calculate metrics
-            total_spend = float(df['spend'].sum())
-            total_sales = float(df['total_sales'].sum())
-            total_impressions = int(df['impressions'].sum())
-            total_clicks = int(df['clicks'].sum())
-
             return {
-                'total_spend': total_spend,
-                'total_sales': total_sales,
-                'total_impressions': total_impressions,
-                'total_clicks': total_clicks,
-                'roas': float(total_sales / total_spend) if total_spend > 0 else 0,
-                'acos': float((total_spend / total_sales) * 100) if total_sales > 0 else 0,
-                'ctr': float((total_clicks / total_impressions) * 100) if total_impressions > 0 else 0,
-                'cpc': float(total_spend / total_clicks) if total_clicks > 0 else 0
+                key: kpis[key]
+                for key in ('total_spend', 'total_sales', 'total_impressions', 'total_clicks',
+                            'roas', 'acos', 'ctr', 'cpc')
             }
 
         except Exception as e:
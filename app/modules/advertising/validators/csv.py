@@ -72,7 +72,7 @@ class AdvertisingCSVValidator(BaseCSVValidator):
                 raise InvalidStoreError()
 
             # Check if user has access to store
-            if not any(s.id == store_id for s in self.user.stores):
+            if not self.user.has_store_access(store_id):
                 raise UnauthorizedError()
 
             return True, None
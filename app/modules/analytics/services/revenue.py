@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from app.core.calendar import ensure_calendar
 from app.core.database import get_db
 
 def get_revenue_trends(store_id, start_date=None, end_date=None, category=None, asin=None):
@@ -17,20 +18,19 @@ def get_revenue_trends(store_id, start_date=None, end_date=None, category=None,
     """
     try:
         query = """
-            WITH RECURSIVE dates(date) AS (
-                SELECT DATE(:start_date)
-                UNION ALL
-                SELECT DATE(date, '+1 day')
-                FROM dates
-                WHERE date < DATE(:end_date)
+            WITH dates AS (
+                SELECT date
+                FROM calendar_dates
+                WHERE date BETWEEN DATE(:start_date) AND DATE(:end_date)
             ),
             daily_revenue AS (
                 SELECT 
                     DATE(date) as sale_date,
-                    SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue
+                    SUM(ordered_product_sales) as revenue
                 FROM business_report
                 WHERE store_id = :store_id
-                    AND DATE(date) BETWEEN DATE(:start_date) AND DATE(:end_date)
+                    AND date >= DATE(:start_date)
+                    AND date < DATE(:end_date, '+1 day')
                     AND (:category IS NULL OR category = :category)
                     AND (:asin IS NULL OR asin = :asin)
                 GROUP BY DATE(date)
@@ -47,6 +47,11 @@ def get_revenue_trends(store_id, start_date=None, end_date=None, category=None,
             start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
         if not end_date:
             end_date = datetime.now().strftime('%Y-%m-%d')
+
+        ensure_calendar(
+            datetime.strptime(start_date, '%Y-%m-%d').date(),
+            datetime.strptime(end_date, '%Y-%m-%d').date()
+        )
             
         params = {
             'store_id': store_id,
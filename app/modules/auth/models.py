@@ -1,6 +1,6 @@
 """Authentication models."""
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 from flask_login import UserMixin
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -47,6 +47,15 @@ class User(UserMixin, db.Model):
     active_store: Mapped[Optional["Store"]] = relationship("Store", foreign_keys=[active_store_id])
     csv_files: Mapped[List["CSVFile"]] = relationship("CSVFile", back_populates="user", lazy=True)
 
+    @property
+    def store_ids(self) -> FrozenSet[int]:
+        """IDs of the stores this user can access, loaded once per request."""
+        store_ids = self.__dict__.get('_store_ids')
+        if store_ids is None:
+            from app.modules.stores.access import get_store_ids
+            store_ids = self._store_ids = get_store_ids(self.id)
+        return store_ids
+
     def has_store_access(self, store_id: int) -> bool:
         """Check if user has access to a specific store.
         
@@ -56,7 +65,10 @@ class User(UserMixin, db.Model):
         Returns:
             bool: True if user has access, False otherwise
         """
-        return any(store.id == store_id for store in self.stores)
+        try:
+            return int(store_id) in self.store_ids
+        except (TypeError, ValueError):
+            return False
 
     @property
     def preferences(self) -> Dict[str, Any]:
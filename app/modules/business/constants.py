@@ -50,7 +50,11 @@ ERROR_MESSAGES = {
     'TITLE_TOO_LONG': f'Title length exceeds maximum of {MAX_TITLE_LENGTH} characters',
     'INVALID_NUMERIC': 'Invalid numeric value for field: {}',
     'NEGATIVE_VALUE': 'Negative value not allowed for field: {}',
-    'INVALID_CONVERSION_RATE': 'Conversion rate must be between 0 and 100'
+    'INVALID_CONVERSION_RATE': 'Conversion rate must be between 0 and 100',
+    'NO_DATA': 'No data found for the specified period',
+    'MISSING_PARAMS': 'Missing required parameters',
+    'NO_STORE_ACCESS': 'No access to the specified store',
+    'UNKNOWN_ERROR': 'An unknown error occurred'
 }
 
 # Time-based grouping options
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional, List
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from app.extensions import db
 from app.modules.category.models.category import Category
 
@@ -10,6 +10,13 @@ class BusinessReport(db.Model):
     """Business report model for storing Amazon seller business data."""
     __tablename__ = 'business_reports'
 
+    # Upsert key and covering index for (store_id, date) aggregate scans
+    __table_args__ = (
+        Index('uq_business_store_date_sku_asin', 'store_id', 'date', 'sku', 'asin', unique=True),
+        Index('idx_business_store_date_metrics', 'store_id', 'date', 'asin',
+              'ordered_product_sales', 'units_ordered', 'sessions'),
+    )
+
     id: Mapped[int] = mapped_column(db.Integer, primary_key=True)
     store_id: Mapped[int] = mapped_column(db.Integer, ForeignKey('stores.id'), nullable=False)
     date: Mapped[datetime] = mapped_column(db.DateTime, nullable=False)
@@ -2,12 +2,14 @@
 
 from datetime import datetime, timedelta
 from typing import Optional
-from flask import Blueprint, jsonify, request, render_template, flash, redirect, url_for, current_app, send_file
+from flask import Blueprint, Response, jsonify, request, render_template, flash, redirect, url_for, current_app, stream_with_context
 from flask_login import login_required, current_user
 from app.modules.stores.models import Store
-from app.modules.business.models import BusinessReport
 from app.utils.decorators import store_required
 from app.modules.business.services import BusinessReportService, BusinessAnalytics
+from app.modules.business.constants import ERROR_MESSAGES
+from app.modules.uploaded_data.export import EXPORT_FORMATS, has_report_data, negotiate_format, stream_export
+from app.modules.uploaded_data.listing import LISTING_DEFAULT_LIMIT, list_reports, serialize_report
 from app.modules.business.metrics import BUSINESS_METRICS
 from app.core.metrics.engine import metric_engine
 import logging
@@ -259,35 +261,24 @@ def export():
         if not current_user.has_store_access(store_id):
             return jsonify({'success': False, 'message': ERROR_MESSAGES['NO_STORE_ACCESS']}), 403
 
-        # Verileri dışa aktar
-        processor = BusinessCSVProcessor()
-        success, message, df = processor.export_data(store_id, start_date, end_date)
-
-        if not success:
-            return jsonify({'success': False, 'message': message}), 404
-
-        # CSV dosyası oluştur
-        filename = f"business_report_{store_id}_{start_date.date()}_{end_date.date()}.csv"
-        filepath = os.path.join(current_app.config['TEMP_FOLDER'], filename)
-        df.to_csv(filepath, index=False)
-
-        # Dosyayı gönder ve temizle
-        return_data = send_file(
-            filepath,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=filename
+        # Format: JSON 'format' alanı ya da Accept başlığı (varsayılan CSV)
+        fmt = negotiate_format(data.get('format'), request.accept_mimetypes)
+        try:
+            chunks = stream_export('business', store_id, start_date, end_date, fmt)
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+
+        if not has_report_data('business', store_id, start_date, end_date):
+            return jsonify({'success': False, 'message': ERROR_MESSAGES['NO_DATA']}), 404
+
+        # Dosyayı parça parça akıt
+        mimetype, extension = EXPORT_FORMATS[fmt]
+        filename = f"business_report_{store_id}_{start_date.date()}_{end_date.date()}.{extension}"
+        return Response(
+            stream_with_context(chunks),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
-        
-        @return_data.call_on_close
-        def cleanup():
-            """Geçici dosyayı temizle."""
-            try:
-                os.remove(filepath)
-            except Exception as e:
-                current_app.logger.error(f"Geçici dosya silme hatası: {str(e)}")
-
-        return return_data
 
     except Exception as e:
         current_app.logger.error(f"Dışa aktarma hatası: {str(e)}")
@@ -362,13 +353,25 @@ def revenue_trends():
 @login_required
 @store_required
 def list_business_reports():
-    """List all business reports."""
+    """List one page of the active store's business reports, newest first.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to get the
+    following page.
+    """
     try:
-        reports = BusinessReport.query.all()
-        return render_template(
-            'business/reports.html',
-            reports=reports
+        page = list_reports(
+            'business',
+            current_user.active_store_id,
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', LISTING_DEFAULT_LIMIT, type=int)
         )
+        return jsonify({
+            'reports': [serialize_report('business', report) for report in page['items']],
+            'next_cursor': page['next_cursor'],
+            'has_more': page['has_more']
+        })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
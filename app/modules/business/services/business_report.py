@@ -25,6 +25,26 @@ class BusinessReportService:
         self.analytics = BusinessAnalytics(store_id)
         logger.debug(f"Initialized BusinessReportService for store_id: {store_id}")
     
+    def period_query(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        category_id: Optional[int] = None
+    ):
+        """Query the store's report rows dated within a period.
+
+        The plain range on ``date`` keeps the query on the store/date indexes;
+        the index audit checks its plan.
+        """
+        query = BusinessReport.query.filter(
+            BusinessReport.store_id == self.store_id,
+            BusinessReport.date.between(start_date, end_date)
+        )
+        if category_id:
+            query = query.join(BusinessReport.categories)\
+                .filter(BusinessReport.categories.any(id=category_id))
+        return query
+
     def get_trends(
         self,
         start_date: datetime,
@@ -58,30 +78,14 @@ class BusinessReportService:
             logger.debug(f"Fetching trends for store {self.store_id} from {start_date} to {end_date}")
             
             # Get current period data
-            query = BusinessReport.query.filter(
-                BusinessReport.store_id == self.store_id,
-                BusinessReport.date.between(start_date, end_date)
-            )
-            
-            if category_id:
-                query = query.join(BusinessReport.categories)\
-                    .filter(BusinessReport.categories.any(id=category_id))
-            
+            query = self.period_query(start_date, end_date, category_id)
             current_data = [report.to_dict() for report in query.all()]
             
             # Get previous period data
             prev_start = start_date - (end_date - start_date)
             prev_end = start_date
             
-            prev_query = BusinessReport.query.filter(
-                BusinessReport.store_id == self.store_id,
-                BusinessReport.date.between(prev_start, prev_end)
-            )
-            
-            if category_id:
-                prev_query = prev_query.join(BusinessReport.categories)\
-                    .filter(BusinessReport.categories.any(id=category_id))
-            
+            prev_query = self.period_query(prev_start, prev_end, category_id)
             previous_data = [report.to_dict() for report in prev_query.all()]
             
             # Calculate metrics for both periods
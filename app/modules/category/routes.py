@@ -3,6 +3,7 @@
 from typing import Dict, Any
 from flask import Blueprint, jsonify, request, current_app
 from flask_login import login_required
+from sqlalchemy.orm import Query
 from werkzeug.exceptions import BadRequest, Unauthorized, Forbidden
 from app.modules.category.services.category_service import CategoryService
 from app.decorators import admin_required
@@ -11,17 +12,22 @@ from app.utils.validation import validate_request_data
 
 bp = Blueprint('category', __name__, url_prefix='/api/v1/categories')
 
-def paginate_results(query, page=1, per_page=50):
-    """Simple pagination helper."""
-    page = int(page)
+def paginate_results(results, page=1, per_page=50):
+    """Paginate a query or an already loaded list the same way."""
+    if isinstance(results, Query):
+        return paginate_query(results, page, per_page)
+
+    page = max(1, int(page))
     per_page = int(per_page)
-    paginated = query.paginate(page=page, per_page=per_page)
+    start = (page - 1) * per_page
+    total = len(results)
     return {
-        'items': paginated.items,
+        'items': results[start:start + per_page],
         'page': page,
         'per_page': per_page,
-        'total': paginated.total,
-        'pages': paginated.pages
+        'has_more': start + per_page < total,
+        'total': total,
+        'pages': (total + per_page - 1) // per_page
     }
 
 @bp.route('/', methods=['GET'])
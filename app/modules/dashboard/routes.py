@@ -2,6 +2,7 @@
 
 from flask import render_template, redirect, url_for, flash
 from flask_login import login_required, current_user
+from app.core.analytics.kpis import dashboard_kpis
 from app.modules.business.models import BusinessReport
 from . import bp
 
@@ -25,4 +26,8 @@ def index():
         store_id=current_user.active_store_id
     ).order_by(BusinessReport.date.desc()).limit(10).all()
     
-    return render_template('dashboard/dashboard.html', business_reports=business_reports)
\ No newline at end of file
+    return render_template(
+        'dashboard/dashboard.html',
+        business_reports=business_reports,
+        kpis=dashboard_kpis(current_user.active_store_id)
+    )
\ No newline at end of file
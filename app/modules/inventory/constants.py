@@ -15,6 +15,20 @@ REQUIRED_COLUMNS = [
     'inbound_quantity'
 ]
 
+# Inventory health defaults
+HEALTH_VELOCITY_DAYS = 30   # Trailing sales window for units/day
+HEALTH_LEAD_TIME_DAYS = 14  # Days from reorder to stock arriving
+HEALTH_SAFETY_DAYS = 7      # Extra cover kept on top of the lead time
+HEALTH_TARGET_DAYS = 60     # Cover a reorder should bring the SKU up to
+HEALTH_OVERSTOCK_DAYS = 180 # Cover above which a SKU counts as overstocked
+
+# Current inventory and change list page size
+INVENTORY_ITEMS_DEFAULT_LIMIT = 50
+INVENTORY_ITEMS_MAX_LIMIT = 500
+
+# Inventory health statuses
+HEALTH_STATUSES = ['out_of_stock', 'reorder', 'healthy', 'overstock', 'no_sales']
+
 # Error messages
 ERROR_MESSAGES = {
     'NO_DATA': 'No data found for the specified period',
@@ -0,0 +1,190 @@
+"""Batch inventory health: days of cover, stock-out dates and reorder flags.
+
+Every SKU of a store is scored in one vectorized pandas/NumPy pass over two
+query results: the current inventory rows and the trailing units ordered
+per SKU. No per-row ORM objects or Decimal arithmetic are involved.
+pandas and NumPy are imported by the functions that need them so that
+registering the CLI command does not load them.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Optional
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.models import CurrentInventory
+from .constants import (
+    HEALTH_VELOCITY_DAYS, HEALTH_LEAD_TIME_DAYS, HEALTH_SAFETY_DAYS,
+    HEALTH_TARGET_DAYS, HEALTH_OVERSTOCK_DAYS, HEALTH_STATUSES
+)
+from .snapshots import inventory_cli
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+INVENTORY_COLUMNS = [
+    'sku', 'asin', 'product_name', 'price', 'mfn_fulfillable_quantity',
+    'afn_fulfillable_quantity', 'afn_warehouse_quantity', 'afn_unsellable_quantity',
+    'afn_reserved_quantity'
+]
+
+
+def compute_inventory_health(
+    inventory: pd.DataFrame,
+    sales: pd.DataFrame,
+    as_of: date,
+    velocity_days: int = HEALTH_VELOCITY_DAYS,
+    lead_time_days: int = HEALTH_LEAD_TIME_DAYS,
+    safety_days: int = HEALTH_SAFETY_DAYS,
+    target_days: int = HEALTH_TARGET_DAYS,
+    overstock_days: int = HEALTH_OVERSTOCK_DAYS
+) -> pd.DataFrame:
+    """Score every SKU in one vectorized pass.
+
+    Args:
+        inventory: One row per SKU with the INVENTORY_COLUMNS
+        sales: Columns sku and units, units ordered in the velocity window
+        as_of: Date the stock-out projection starts from
+        velocity_days: Length of the sales window in days
+        lead_time_days: Days from reorder to stock arriving
+        safety_days: Extra days of cover to keep
+        target_days: Days of cover a reorder should reach
+        overstock_days: Days of cover above which stock is excess
+
+    Returns:
+        pd.DataFrame: The inventory rows with fulfillable_quantity,
+        inventory_value, afn_utilization_rate, daily_velocity, days_of_cover,
+        stockout_date, reorder, reorder_quantity and status columns
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = inventory.merge(sales, on='sku', how='left')
+    df['units'] = df['units'].fillna(0).astype('int64')
+
+    fulfillable = (df['mfn_fulfillable_quantity'] + df['afn_fulfillable_quantity']).to_numpy(dtype='int64')
+    warehouse = df['afn_warehouse_quantity'].to_numpy(dtype='float64')
+    velocity = df['units'].to_numpy(dtype='float64') / velocity_days
+    selling = velocity > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cover = np.where(selling, fulfillable / velocity, np.inf)
+        utilization = np.where(warehouse > 0, df['afn_fulfillable_quantity'].to_numpy() / warehouse * 100, 0.0)
+
+    reorder = selling & (cover <= lead_time_days + safety_days)
+    reorder_quantity = np.where(reorder, np.ceil(velocity * target_days - fulfillable), 0).clip(min=0)
+
+    df['fulfillable_quantity'] = fulfillable
+    df['inventory_value'] = df['price'].astype('float64').to_numpy() * fulfillable
+    df['afn_utilization_rate'] = utilization.round(2)
+    df['daily_velocity'] = velocity.round(3)
+    df['days_of_cover'] = np.where(selling, cover.round(1), np.nan)
+    df['stockout_date'] = pd.Timestamp(as_of) + pd.to_timedelta(np.where(selling, np.floor(cover), np.nan), unit='D')
+    df['reorder'] = reorder
+    df['reorder_quantity'] = reorder_quantity.astype('int64')
+    df['status'] = np.select(
+        [fulfillable == 0, reorder, ~selling, cover > overstock_days],
+        ['out_of_stock', 'reorder', 'no_sales', 'overstock'],
+        default='healthy'
+    )
+
+    return df.drop(columns='units')
+
+
+def get_inventory_health(store_id: int, as_of: Optional[date] = None,
+                         velocity_days: int = HEALTH_VELOCITY_DAYS, **options) -> pd.DataFrame:
+    """Load a store's current inventory and sales velocity and score them.
+
+    Args:
+        store_id: Store ID
+        as_of: End of the sales window, defaults to the latest snapshot date
+        velocity_days: Length of the sales window in days
+        **options: Thresholds passed to compute_inventory_health
+
+    Returns:
+        pd.DataFrame: One scored row per SKU, see compute_inventory_health
+    """
+    import pandas as pd
+
+    if velocity_days < 1:
+        raise ValueError("velocity_days must be at least 1")
+
+    rows = db.session.execute(
+        select(*(getattr(CurrentInventory, column) for column in INVENTORY_COLUMNS), CurrentInventory.date)
+        .where(CurrentInventory.store_id == store_id)
+        .order_by(CurrentInventory.sku)
+    ).all()
+    inventory = pd.DataFrame(rows, columns=INVENTORY_COLUMNS + ['date'])
+
+    if as_of is None:
+        as_of = inventory['date'].max().date() if len(inventory) else date.today()
+    inventory = inventory.drop(columns='date')
+
+    end = datetime.combine(as_of, datetime.min.time()) + timedelta(days=1)
+    sales = pd.DataFrame(
+        db.session.query(
+            BusinessReport.sku,
+            func.sum(BusinessReport.units_ordered)
+        ).filter(
+            BusinessReport.store_id == store_id,
+            BusinessReport.date >= end - timedelta(days=velocity_days),
+            BusinessReport.date < end
+        ).group_by(BusinessReport.sku).all(),
+        columns=['sku', 'units']
+    )
+
+    return compute_inventory_health(inventory, sales, as_of, velocity_days=velocity_days, **options)
+
+
+def summarize_health(health: pd.DataFrame) -> Dict:
+    """Count SKUs per status and total the stock value and reorder units."""
+    counts = health['status'].value_counts()
+    return {
+        'skus': int(len(health)),
+        'statuses': {status: int(counts.get(status, 0)) for status in HEALTH_STATUSES},
+        'inventory_value': round(float(health['inventory_value'].sum()), 2),
+        'reorder_quantity': int(health['reorder_quantity'].sum())
+    }
+
+
+def health_records(health: pd.DataFrame) -> list:
+    """Convert a health frame to JSON-ready dicts."""
+    out = health.copy()
+    out['price'] = out['price'].astype('float64')
+    out['stockout_date'] = out['stockout_date'].dt.strftime('%Y-%m-%d')
+    out = out.astype(object).where(out.notna(), None)
+    return out.to_dict(orient='records')
+
+
+@click.command('health')
+@click.option('--store-id', type=int, required=True, help='Store to score')
+@click.option('--velocity-days', default=HEALTH_VELOCITY_DAYS, show_default=True, help='Sales window in days')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write every SKU to this CSV file')
+@with_appcontext
+def health_command(store_id: int, velocity_days: int, output: Optional[str]):
+    """Score days of cover and reorder needs for every SKU of a store."""
+    try:
+        health = get_inventory_health(store_id, velocity_days=velocity_days)
+        summary = summarize_health(health)
+
+        click.echo(f"Scored {summary['skus']} SKUs.")
+        for status, count in summary['statuses'].items():
+            click.echo(f"  {status}: {count}")
+        click.echo(f"Units to reorder: {summary['reorder_quantity']}")
+
+        if output:
+            health.to_csv(output, index=False)
+            click.echo(f"Wrote {output}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+
+
+def init_app(app):
+    """Register CLI commands with the app."""
+    inventory_cli.add_command(health_command)
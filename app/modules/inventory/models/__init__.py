@@ -1,5 +1,6 @@
 """Inventory module models."""
 
 from .report import InventoryReport
+from .snapshot import CurrentInventory, InventoryChange
 
-__all__ = ['InventoryReport']
+__all__ = ['InventoryReport', 'CurrentInventory', 'InventoryChange']
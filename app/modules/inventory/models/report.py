@@ -73,7 +73,7 @@ class InventoryReport(BaseReport):
             'afn_total_quantity': self.afn_total_quantity,
             'per_unit_volume': float(self.per_unit_volume),
             'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
     
     @property
@@ -0,0 +1,106 @@
+"""Current inventory and snapshot change models."""
+
+from sqlalchemy import ForeignKey, Index
+from app import db
+
+class CurrentInventory(db.Model):
+    """Latest inventory snapshot row per store and SKU.
+
+    Maintained by ``app.modules.inventory.snapshots`` on inventory ingest so
+    "what is in stock now" reads one row per SKU instead of scanning every
+    snapshot.
+    """
+    __tablename__ = 'current_inventory'
+
+    store_id = db.Column(db.Integer, ForeignKey('stores.id'), primary_key=True)
+    sku = db.Column(db.String(50), primary_key=True)
+    report_id = db.Column(db.Integer, ForeignKey('inventory_reports.id'), nullable=False)
+    date = db.Column(db.DateTime, nullable=False)  # Snapshot date of the row
+
+    # Product Information
+    asin = db.Column(db.String(50), nullable=False)
+    product_name = db.Column(db.String(200), nullable=False)
+    condition = db.Column(db.String(50), nullable=False)
+    price = db.Column(db.Numeric(10, 2), nullable=False)
+
+    # Quantities
+    mfn_fulfillable_quantity = db.Column(db.Integer, nullable=False)
+    afn_warehouse_quantity = db.Column(db.Integer, nullable=False)
+    afn_fulfillable_quantity = db.Column(db.Integer, nullable=False)
+    afn_unsellable_quantity = db.Column(db.Integer, nullable=False)
+    afn_reserved_quantity = db.Column(db.Integer, nullable=False)
+    afn_total_quantity = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        Index('idx_current_inventory_store_asin', 'store_id', 'asin'),
+    )
+
+    def __repr__(self):
+        return f'<CurrentInventory {self.store_id} {self.sku}>'
+
+    def to_dict(self) -> dict:
+        """Convert row to dictionary format."""
+        return {
+            'store_id': self.store_id,
+            'sku': self.sku,
+            'date': self.date.strftime('%Y-%m-%d'),
+            'asin': self.asin,
+            'product_name': self.product_name,
+            'condition': self.condition,
+            'price': float(self.price),
+            'mfn_fulfillable_quantity': self.mfn_fulfillable_quantity,
+            'afn_warehouse_quantity': self.afn_warehouse_quantity,
+            'afn_fulfillable_quantity': self.afn_fulfillable_quantity,
+            'afn_unsellable_quantity': self.afn_unsellable_quantity,
+            'afn_reserved_quantity': self.afn_reserved_quantity,
+            'afn_total_quantity': self.afn_total_quantity,
+            'total_fulfillable_quantity': self.total_fulfillable_quantity
+        }
+
+    @property
+    def total_fulfillable_quantity(self) -> int:
+        """Total fulfillable quantity across MFN and AFN."""
+        return self.mfn_fulfillable_quantity + self.afn_fulfillable_quantity
+
+class InventoryChange(db.Model):
+    """Difference between consecutive inventory snapshots of a SKU.
+
+    A row is written for the first snapshot of a SKU and for every later
+    snapshot whose fulfillable, unsellable or reserved quantity changed.
+    """
+    __tablename__ = 'inventory_changes'
+
+    id = db.Column(db.Integer, primary_key=True)
+    store_id = db.Column(db.Integer, ForeignKey('stores.id'), nullable=False)
+    sku = db.Column(db.String(50), nullable=False)
+    date = db.Column(db.DateTime, nullable=False)
+    previous_date = db.Column(db.DateTime)  # None for the first snapshot
+
+    fulfillable_quantity = db.Column(db.Integer, nullable=False)
+    fulfillable_change = db.Column(db.Integer, nullable=False)
+    unsellable_quantity = db.Column(db.Integer, nullable=False)
+    unsellable_change = db.Column(db.Integer, nullable=False)
+    reserved_quantity = db.Column(db.Integer, nullable=False)
+    reserved_change = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        Index('idx_inventory_change_store_date', 'store_id', 'date'),
+        Index('idx_inventory_change_store_sku_date', 'store_id', 'sku', 'date'),
+    )
+
+    def __repr__(self):
+        return f'<InventoryChange {self.store_id} {self.sku} {self.date}>'
+
+    def to_dict(self) -> dict:
+        """Convert change to dictionary format."""
+        return {
+            'sku': self.sku,
+            'date': self.date.strftime('%Y-%m-%d'),
+            'previous_date': self.previous_date.strftime('%Y-%m-%d') if self.previous_date else None,
+            'fulfillable_quantity': self.fulfillable_quantity,
+            'fulfillable_change': self.fulfillable_change,
+            'unsellable_quantity': self.unsellable_quantity,
+            'unsellable_change': self.unsellable_change,
+            'reserved_quantity': self.reserved_quantity,
+            'reserved_change': self.reserved_change
+        }
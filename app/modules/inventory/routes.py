@@ -1,13 +1,13 @@
 """Inventory module routes."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from flask import Blueprint, jsonify, request, render_template, flash, redirect, url_for, current_app
 from flask_login import login_required, current_user
-from app.utils.analytics_engine import AnalyticsEngine
 from app.core.models import Store
 from app.modules.inventory.models import InventoryReport
 from app.utils.decorators import store_required
 from app.modules.inventory.services import InventoryReportService
+from app.modules.inventory.constants import HEALTH_VELOCITY_DAYS, INVENTORY_ITEMS_DEFAULT_LIMIT
 import logging
 
 logger = logging.getLogger(__name__)
@@ -66,34 +66,119 @@ def inventory_report():
 @bp.route('/data')
 @store_required
 def get_inventory_data():
-    """Get inventory data for the specified store."""
+    """Get one page of inventory snapshot rows, newest first.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to get the
+    following page.
+    """
     try:
         store_id = current_user.active_store_id
         logger.debug(f"Getting inventory data for store_id: {store_id}")
-        
-        # Get query parameters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        category = request.args.get('category')
-        asin = request.args.get('asin')
+        start_date, end_date = _parse_date_range(request.args)
         
         # Initialize service
         service = InventoryReportService(store_id)
         
         # Get data
-        data = service.get_data(
+        page = service.get_data(
             start_date=start_date,
             end_date=end_date,
-            category=category,
-            asin=asin
+            sku=request.args.get('sku'),
+            asin=request.args.get('asin'),
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', INVENTORY_ITEMS_DEFAULT_LIMIT, type=int)
         )
         
-        return jsonify(data)
+        return jsonify(page)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.exception(f"Error getting inventory data: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/current')
+@store_required
+def get_current_inventory():
+    """Get one page of the latest inventory row of every SKU.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to get the
+    following page.
+    """
+    try:
+        store_id = current_user.active_store_id
+        service = InventoryReportService(store_id)
+        page = service.get_current(
+            sku=request.args.get('sku'),
+            asin=request.args.get('asin'),
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', INVENTORY_ITEMS_DEFAULT_LIMIT, type=int)
+        )
+        return jsonify(page)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception(f"Error getting current inventory: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/changes')
+@store_required
+def get_inventory_changes():
+    """Get one page of quantity changes between inventory snapshots.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to get the
+    following page.
+    """
+    try:
+        store_id = current_user.active_store_id
+        start_date, end_date = _parse_date_range(request.args)
+        service = InventoryReportService(store_id)
+        page = service.get_changes(
+            start_date=start_date,
+            end_date=end_date,
+            sku=request.args.get('sku'),
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', INVENTORY_ITEMS_DEFAULT_LIMIT, type=int)
+        )
+        return jsonify(page)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception(f"Error getting inventory changes: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def _parse_date_range(args):
+    """Parse start_date/end_date (YYYY-MM-DD) into an inclusive datetime range."""
+    start_date = args.get('start_date')
+    end_date = args.get('end_date')
+
+    if start_date:
+        start_date = datetime.strptime(start_date, '%Y-%m-%d')
+    if end_date:
+        end_date = datetime.combine(datetime.strptime(end_date, '%Y-%m-%d'), time.max)
+
+    return start_date or None, end_date or None
+
+@bp.route('/health')
+@store_required
+def get_inventory_health():
+    """Get days of cover and reorder flags for every SKU."""
+    try:
+        store_id = current_user.active_store_id
+        as_of = request.args.get('as_of')
+        service = InventoryReportService(store_id)
+        health = service.get_health(
+            as_of=datetime.strptime(as_of, '%Y-%m-%d').date() if as_of else None,
+            status=request.args.get('status'),
+            velocity_days=request.args.get('velocity_days', HEALTH_VELOCITY_DAYS, type=int)
+        )
+        return jsonify(health)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception(f"Error getting inventory health: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/asins')
 @store_required
 def get_asins():
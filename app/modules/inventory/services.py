@@ -3,15 +3,32 @@
 from datetime import datetime, timedelta
 from sqlalchemy import func, and_
 from app.extensions import db
-from app.modules.inventory.models.report import InventoryReport
+from app.modules.inventory.models import CurrentInventory, InventoryChange, InventoryReport
+from app.modules.inventory.health import get_inventory_health, health_records, summarize_health
+from app.utils.pagination import keyset_paginate
+from .constants import INVENTORY_ITEMS_DEFAULT_LIMIT, INVENTORY_ITEMS_MAX_LIMIT
 
 class InventoryReportService:
     def __init__(self, store_id):
         """Initialize service with store_id."""
         self.store_id = store_id
 
-    def get_data(self, start_date=None, end_date=None, sku=None, asin=None):
-        """Get inventory data based on filters."""
+    def get_data(self, start_date=None, end_date=None, sku=None, asin=None, cursor=None,
+                 limit=INVENTORY_ITEMS_DEFAULT_LIMIT):
+        """Get one page of inventory snapshot rows, newest first.
+
+        Args:
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (inclusive)
+            sku: Optional SKU filter
+            asin: Optional ASIN filter
+            cursor: ``next_cursor`` of the previous page
+            limit: Items per page, capped at INVENTORY_ITEMS_MAX_LIMIT
+
+        Returns:
+            Dict with the page items, the cursor of the next page and whether
+            more items exist
+        """
         query = InventoryReport.query.filter(InventoryReport.store_id == self.store_id)
         
         if start_date:
@@ -22,20 +39,105 @@ class InventoryReportService:
             query = query.filter(InventoryReport.sku == sku)
         if asin:
             query = query.filter(InventoryReport.asin == asin)
-            
-        return query.all()
+
+        page = keyset_paginate(
+            query,
+            (InventoryReport.date, InventoryReport.id),
+            cursor=cursor,
+            limit=max(1, min(int(limit), INVENTORY_ITEMS_MAX_LIMIT)),
+            descending=True
+        )
+        page['items'] = [report.to_dict() for report in page['items']]
+        return page
 
     def get_skus(self):
-        """Get list of SKUs for the store."""
+        """Get list of SKUs for the store from current inventory."""
         skus = db.session.query(
-            InventoryReport.sku,
-            InventoryReport.product_name
+            CurrentInventory.sku,
+            CurrentInventory.product_name
         ).filter(
-            InventoryReport.store_id == self.store_id
-        ).distinct().all()
+            CurrentInventory.store_id == self.store_id
+        ).order_by(CurrentInventory.sku).all()
         
         return [{'sku': s.sku, 'name': s.product_name} for s in skus]
 
+    def get_current(self, sku=None, asin=None, cursor=None, limit=INVENTORY_ITEMS_DEFAULT_LIMIT):
+        """Get one page of the latest snapshot rows, one per SKU, by SKU.
+
+        Args:
+            sku: Optional SKU filter
+            asin: Optional ASIN filter
+            cursor: ``next_cursor`` of the previous page
+            limit: Items per page, capped at INVENTORY_ITEMS_MAX_LIMIT
+
+        Returns:
+            Dict with the page items, the cursor of the next page and whether
+            more items exist
+        """
+        query = CurrentInventory.query.filter(CurrentInventory.store_id == self.store_id)
+
+        if sku:
+            query = query.filter(CurrentInventory.sku == sku)
+        if asin:
+            query = query.filter(CurrentInventory.asin == asin)
+
+        # SKUs are unique within a store, so they key the page on their own
+        page = keyset_paginate(
+            query,
+            (CurrentInventory.sku,),
+            cursor=cursor,
+            limit=max(1, min(int(limit), INVENTORY_ITEMS_MAX_LIMIT))
+        )
+        page['items'] = [row.to_dict() for row in page['items']]
+        return page
+
+    def get_changes(self, start_date=None, end_date=None, sku=None, cursor=None,
+                    limit=INVENTORY_ITEMS_DEFAULT_LIMIT):
+        """Get one page of snapshot-to-snapshot quantity changes, newest first.
+
+        Args:
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (inclusive)
+            sku: Optional SKU filter
+            cursor: ``next_cursor`` of the previous page
+            limit: Items per page, capped at INVENTORY_ITEMS_MAX_LIMIT
+
+        Returns:
+            Dict with the page items, the cursor of the next page and whether
+            more items exist
+        """
+        query = InventoryChange.query.filter(InventoryChange.store_id == self.store_id)
+
+        if start_date:
+            query = query.filter(InventoryChange.date >= start_date)
+        if end_date:
+            query = query.filter(InventoryChange.date <= end_date)
+        if sku:
+            query = query.filter(InventoryChange.sku == sku)
+
+        page = keyset_paginate(
+            query,
+            (InventoryChange.date, InventoryChange.id),
+            cursor=cursor,
+            limit=max(1, min(int(limit), INVENTORY_ITEMS_MAX_LIMIT)),
+            descending=True
+        )
+        page['items'] = [change.to_dict() for change in page['items']]
+        return page
+
+    def get_health(self, as_of=None, status=None, **options):
+        """Get days of cover, stock-out dates and reorder flags for every SKU."""
+        health = get_inventory_health(self.store_id, as_of=as_of, **options)
+        summary = summarize_health(health)
+
+        if status:
+            health = health[health['status'] == status]
+
+        return {
+            'summary': summary,
+            'items': health_records(health)
+        }
+
     def get_trends(self, start_date=None, end_date=None, sku=None):
         """Get inventory trends data."""
         query = db.session.query(
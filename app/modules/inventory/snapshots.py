@@ -0,0 +1,190 @@
+"""Incremental maintenance of current inventory and snapshot changes.
+
+Inventory reports are point-in-time snapshots. After each ingest the SKUs it
+touched are refreshed in ``current_inventory`` (latest row per SKU) and
+``inventory_changes`` (diff against the previous snapshot of the SKU). Both
+are rebuilt with ``INSERT ... SELECT`` window queries, so report rows are not
+loaded into Python.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func, insert, or_, select
+
+from app.extensions import db
+from app.modules.inventory.models import CurrentInventory, InventoryChange, InventoryReport
+
+# SKUs per IN (...) batch, well below SQLite's bound parameter limit
+SKU_BATCH_SIZE = 500
+
+CURRENT_COLUMNS = [
+    'store_id', 'sku', 'report_id', 'date', 'asin', 'product_name', 'condition', 'price',
+    'mfn_fulfillable_quantity', 'afn_warehouse_quantity', 'afn_fulfillable_quantity',
+    'afn_unsellable_quantity', 'afn_reserved_quantity', 'afn_total_quantity'
+]
+
+CHANGE_COLUMNS = [
+    'store_id', 'sku', 'date', 'previous_date',
+    'fulfillable_quantity', 'fulfillable_change',
+    'unsellable_quantity', 'unsellable_change',
+    'reserved_quantity', 'reserved_change'
+]
+
+
+def refresh_inventory_snapshots(
+    store_id: int,
+    skus: Optional[Iterable[str]] = None,
+    since: Optional[datetime] = None
+) -> int:
+    """Refresh current inventory and snapshot changes for a store.
+
+    Args:
+        store_id: Store ID
+        skus: SKUs that changed, None for every SKU of the store
+        since: Earliest snapshot date that changed; changes before it are kept
+
+    Returns:
+        int: Number of SKUs refreshed
+    """
+    if skus is None:
+        batches = [None]
+        count = db.session.query(func.count(func.distinct(InventoryReport.sku))).filter(
+            InventoryReport.store_id == store_id
+        ).scalar()
+    else:
+        skus = sorted(set(skus))
+        batches = [skus[start:start + SKU_BATCH_SIZE] for start in range(0, len(skus), SKU_BATCH_SIZE)]
+        count = len(skus)
+
+    for batch in batches:
+        _refresh_current(store_id, batch)
+        _refresh_changes(store_id, batch, since)
+
+    return count
+
+
+def _report_filters(store_id: int, skus: Optional[List[str]]) -> list:
+    """Filters selecting a store's report rows for the given SKUs."""
+    filters = [InventoryReport.store_id == store_id]
+    if skus is not None:
+        filters.append(InventoryReport.sku.in_(skus))
+    return filters
+
+
+def _refresh_current(store_id: int, skus: Optional[List[str]]) -> None:
+    """Replace current inventory rows with each SKU's latest snapshot row."""
+    ranked = select(
+        InventoryReport.id,
+        func.row_number().over(
+            partition_by=InventoryReport.sku,
+            order_by=(InventoryReport.date.desc(), InventoryReport.id.desc())
+        ).label('rank')
+    ).where(*_report_filters(store_id, skus)).subquery()
+
+    latest = select(
+        InventoryReport.store_id,
+        InventoryReport.sku,
+        InventoryReport.id,
+        InventoryReport.date,
+        InventoryReport.asin,
+        InventoryReport.product_name,
+        InventoryReport.condition,
+        InventoryReport.price,
+        InventoryReport.mfn_fulfillable_quantity,
+        InventoryReport.afn_warehouse_quantity,
+        InventoryReport.afn_fulfillable_quantity,
+        InventoryReport.afn_unsellable_quantity,
+        InventoryReport.afn_reserved_quantity,
+        InventoryReport.afn_total_quantity
+    ).join(ranked, ranked.c.id == InventoryReport.id).where(ranked.c.rank == 1)
+
+    stale = CurrentInventory.query.filter(CurrentInventory.store_id == store_id)
+    if skus is not None:
+        stale = stale.filter(CurrentInventory.sku.in_(skus))
+    stale.delete(synchronize_session=False)
+
+    db.session.execute(insert(CurrentInventory).from_select(CURRENT_COLUMNS, latest))
+
+
+def _refresh_changes(store_id: int, skus: Optional[List[str]], since: Optional[datetime]) -> None:
+    """Rewrite snapshot changes from ``since`` on by diffing consecutive snapshots."""
+    fulfillable = InventoryReport.afn_fulfillable_quantity + InventoryReport.mfn_fulfillable_quantity
+    window = {
+        'partition_by': InventoryReport.sku,
+        'order_by': (InventoryReport.date, InventoryReport.id)
+    }
+
+    snapshots = select(
+        InventoryReport.store_id,
+        InventoryReport.sku,
+        InventoryReport.date,
+        func.lag(InventoryReport.date).over(**window).label('previous_date'),
+        fulfillable.label('fulfillable'),
+        func.lag(fulfillable).over(**window).label('previous_fulfillable'),
+        InventoryReport.afn_unsellable_quantity.label('unsellable'),
+        func.lag(InventoryReport.afn_unsellable_quantity).over(**window).label('previous_unsellable'),
+        InventoryReport.afn_reserved_quantity.label('reserved'),
+        func.lag(InventoryReport.afn_reserved_quantity).over(**window).label('previous_reserved')
+    ).where(*_report_filters(store_id, skus)).subquery()
+
+    s = snapshots.c
+    changes = select(
+        s.store_id,
+        s.sku,
+        s.date,
+        s.previous_date,
+        s.fulfillable,
+        s.fulfillable - func.coalesce(s.previous_fulfillable, 0),
+        s.unsellable,
+        s.unsellable - func.coalesce(s.previous_unsellable, 0),
+        s.reserved,
+        s.reserved - func.coalesce(s.previous_reserved, 0)
+    ).where(or_(
+        s.previous_date.is_(None),
+        s.fulfillable != s.previous_fulfillable,
+        s.unsellable != s.previous_unsellable,
+        s.reserved != s.previous_reserved
+    ))
+
+    stale = InventoryChange.query.filter(InventoryChange.store_id == store_id)
+    if skus is not None:
+        stale = stale.filter(InventoryChange.sku.in_(skus))
+    if since is not None:
+        changes = changes.where(s.date >= since)
+        stale = stale.filter(InventoryChange.date >= since)
+    stale.delete(synchronize_session=False)
+
+    db.session.execute(insert(InventoryChange).from_select(CHANGE_COLUMNS, changes))
+
+
+@click.group('inventory')
+def inventory_cli():
+    """Inventory snapshot commands."""
+    pass
+
+
+@inventory_cli.command('rebuild-current')
+@click.option('--store-id', type=int, help='Only rebuild this store')
+@with_appcontext
+def rebuild_current_command(store_id: Optional[int]):
+    """Rebuild current_inventory and inventory_changes from the report table."""
+    try:
+        if store_id is None:
+            store_ids = sorted(row[0] for row in db.session.query(InventoryReport.store_id).distinct())
+        else:
+            store_ids = [store_id]
+
+        count = sum(refresh_inventory_snapshots(sid) for sid in store_ids)
+        db.session.commit()
+        click.echo(f"Refreshed {count} SKUs for {len(store_ids)} stores.")
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"Error: {str(e)}", err=True)
+
+
+def init_app(app):
+    """Register CLI commands with the app."""
+    app.cli.add_command(inventory_cli)
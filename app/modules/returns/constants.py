@@ -40,6 +40,10 @@ VALID_TRACKING_PREFIXES = [
     '9'     # USPS
 ]
 
+# Return item list page size
+RETURN_ITEMS_DEFAULT_LIMIT = 50
+RETURN_ITEMS_MAX_LIMIT = 500
+
 # Error messages
 ERROR_MESSAGES = {
     'NO_DATA': 'No data found for the specified period',
@@ -1,5 +1,6 @@
 """Returns module models."""
 
 from .report import ReturnReport
+from .return_rate import ReturnRateFact
 
-__all__ = ['ReturnReport']
+__all__ = ['ReturnReport', 'ReturnRateFact']
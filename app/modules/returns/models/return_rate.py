@@ -0,0 +1,34 @@
+"""Return rate fact model."""
+
+from sqlalchemy import ForeignKey, Index
+from app import db
+
+class ReturnRateFact(db.Model):
+    """Returned and ordered units per store, ASIN and day.
+
+    Rows are kept in sync by ``app.modules.returns.return_rates`` whenever
+    return or business reports are ingested, so return rates for any window
+    or ASIN are read with a range scan instead of joining both report tables.
+    """
+    __tablename__ = 'return_rate_facts'
+
+    store_id = db.Column(db.Integer, ForeignKey('stores.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    asin = db.Column(db.String(50), primary_key=True)
+
+    returned_units = db.Column(db.Integer, nullable=False, default=0)
+    units_ordered = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('idx_return_rate_store_asin_date', 'store_id', 'asin', 'date'),
+    )
+
+    def __repr__(self):
+        return f'<ReturnRateFact {self.store_id} {self.asin} {self.date}>'
+
+    @property
+    def return_rate(self) -> float:
+        """Returned units as a percentage of units ordered."""
+        if not self.units_ordered:
+            return 0.0
+        return self.returned_units / self.units_ordered * 100
@@ -0,0 +1,159 @@
+"""Incremental maintenance of the return rate fact table.
+
+``return_rate_facts`` holds returned units (from return reports) and units
+ordered (from business reports) per store, ASIN and day. Ingest of either
+report type calls ``refresh_return_rates`` with the (date, ASIN) pairs it
+touched; only that slice is recomputed from the source tables.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import func
+
+from app.extensions import db
+from app.modules.business.models import BusinessReport
+from app.modules.returns.models import ReturnRateFact, ReturnReport
+
+
+def refresh_return_rates(store_id: int, keys: Optional[Iterable[Tuple]] = None) -> int:
+    """Recompute return rate facts for a store.
+
+    Args:
+        store_id: Store ID
+        keys: (date, asin) pairs that changed. Every ASIN in the pairs is
+            recomputed across the pairs' date span; None rebuilds the store.
+
+    Returns:
+        int: Number of fact rows written
+    """
+    returned = db.session.query(
+        func.date(ReturnReport.return_date),
+        ReturnReport.asin,
+        func.sum(ReturnReport.quantity)
+    ).filter(ReturnReport.store_id == store_id)
+
+    ordered = db.session.query(
+        func.date(BusinessReport.date),
+        BusinessReport.asin,
+        func.sum(BusinessReport.units_ordered)
+    ).filter(BusinessReport.store_id == store_id)
+
+    stale = ReturnRateFact.query.filter(ReturnRateFact.store_id == store_id)
+
+    if keys is not None:
+        keys = {(_as_date(day), asin) for day, asin in keys}
+        if not keys:
+            return 0
+
+        days = [day for day, _ in keys]
+        start = datetime.combine(min(days), datetime.min.time())
+        end = datetime.combine(max(days) + timedelta(days=1), datetime.min.time())
+        asins = sorted({asin for _, asin in keys})
+
+        returned = returned.filter(
+            ReturnReport.return_date >= start,
+            ReturnReport.return_date < end,
+            ReturnReport.asin.in_(asins)
+        )
+        ordered = ordered.filter(
+            BusinessReport.date >= start,
+            BusinessReport.date < end,
+            BusinessReport.asin.in_(asins)
+        )
+        stale = stale.filter(
+            ReturnRateFact.date.between(min(days), max(days)),
+            ReturnRateFact.asin.in_(asins)
+        )
+
+    totals: Dict[Tuple[date, str], List[int]] = {}
+    for day, asin, quantity in returned.group_by(func.date(ReturnReport.return_date), ReturnReport.asin):
+        totals.setdefault((_as_date(day), asin), [0, 0])[0] += int(quantity or 0)
+    for day, asin, units in ordered.group_by(func.date(BusinessReport.date), BusinessReport.asin):
+        totals.setdefault((_as_date(day), asin), [0, 0])[1] += int(units or 0)
+
+    stale.delete(synchronize_session=False)
+    db.session.bulk_insert_mappings(ReturnRateFact, [
+        {
+            'store_id': store_id,
+            'date': day,
+            'asin': asin,
+            'returned_units': returned_units,
+            'units_ordered': units_ordered
+        }
+        for (day, asin), (returned_units, units_ordered) in totals.items()
+    ])
+
+    return len(totals)
+
+
+def get_daily_return_rates(store_id: int, start_date=None, end_date=None, asin: Optional[str] = None):
+    """Returned and ordered units per day from the fact table.
+
+    Args:
+        store_id: Store ID
+        start_date: Start of the range (inclusive)
+        end_date: End of the range (inclusive)
+        asin: Optional ASIN filter
+
+    Returns:
+        List of (date, returned_units, units_ordered) rows ordered by date
+    """
+    query = db.session.query(
+        ReturnRateFact.date,
+        func.sum(ReturnRateFact.returned_units).label('returned_units'),
+        func.sum(ReturnRateFact.units_ordered).label('units_ordered')
+    ).filter(ReturnRateFact.store_id == store_id)
+
+    if start_date:
+        query = query.filter(ReturnRateFact.date >= _as_date(start_date))
+    if end_date:
+        query = query.filter(ReturnRateFact.date <= _as_date(end_date))
+    if asin:
+        query = query.filter(ReturnRateFact.asin == asin)
+
+    return query.group_by(ReturnRateFact.date).order_by(ReturnRateFact.date).all()
+
+
+def _as_date(value) -> date:
+    """Normalize SQL date strings, datetimes and timestamps to a date."""
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    if hasattr(value, 'to_pydatetime'):
+        return value.to_pydatetime().date()
+    return value
+
+
+@click.group('return-rates')
+def return_rates_cli():
+    """Return rate fact commands."""
+    pass
+
+
+@return_rates_cli.command('rebuild')
+@click.option('--store-id', type=int, help='Only rebuild this store')
+@with_appcontext
+def rebuild_command(store_id: Optional[int]):
+    """Rebuild the return_rate_facts table from the report tables."""
+    try:
+        if store_id is None:
+            store_ids = {row[0] for row in db.session.query(ReturnReport.store_id).distinct()}
+            store_ids |= {row[0] for row in db.session.query(BusinessReport.store_id).distinct()}
+        else:
+            store_ids = {store_id}
+
+        count = sum(refresh_return_rates(sid) for sid in sorted(store_ids))
+        db.session.commit()
+        click.echo(f"Rebuilt {count} return rate facts for {len(store_ids)} stores.")
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"Error: {str(e)}", err=True)
+
+
+def init_app(app):
+    """Register CLI commands with the app."""
+    app.cli.add_command(return_rates_cli)
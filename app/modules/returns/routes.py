@@ -1,13 +1,13 @@
 """Returns module routes."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from flask import Blueprint, jsonify, request, render_template, flash, redirect, url_for, current_app
 from flask_login import login_required, current_user
-from app.utils.analytics_engine import AnalyticsEngine
 from app.core.models import Store
 from app.modules.returns.models import ReturnReport
 from app.utils.decorators import store_required
 from app.modules.returns.services import ReturnReportService
+from app.modules.returns.constants import RETURN_ITEMS_DEFAULT_LIMIT
 import logging
 
 logger = logging.getLogger(__name__)
@@ -71,34 +71,77 @@ def returns_report():
 @bp.route('/data')
 @store_required
 def get_returns_data():
-    """Get returns data for the specified store."""
+    """Get return rate, reasons and summary for the specified store."""
     try:
         store_id = current_user.active_store_id
         logger.debug(f"Getting returns data for store_id: {store_id}")
         
         # Get query parameters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        reason = request.args.get('reason')
+        start_date, end_date = _parse_date_range(request.args)
+        reason = request.args.get('return_reason')
         asin = request.args.get('asin')
         
         # Initialize service
         service = ReturnReportService(store_id)
         
         # Get data
-        data = service.get_data(
+        data = service.get_return_data(
             start_date=start_date,
             end_date=end_date,
-            reason=reason,
-            asin=asin
+            asin=asin,
+            return_reason=reason
         )
         
         return jsonify(data)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.exception(f"Error getting returns data: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/items')
+@store_required
+def get_return_items():
+    """Get one page of returned items, newest first.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to get the
+    following page.
+    """
+    try:
+        store_id = current_user.active_store_id
+        start_date, end_date = _parse_date_range(request.args)
+
+        service = ReturnReportService(store_id)
+        page = service.get_return_items(
+            start_date=start_date,
+            end_date=end_date,
+            asin=request.args.get('asin'),
+            return_reason=request.args.get('return_reason'),
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', RETURN_ITEMS_DEFAULT_LIMIT, type=int)
+        )
+
+        return jsonify(page)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception(f"Error getting return items: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def _parse_date_range(args):
+    """Parse start_date/end_date (YYYY-MM-DD) into an inclusive datetime range."""
+    start_date = args.get('start_date')
+    end_date = args.get('end_date')
+
+    if start_date:
+        start_date = datetime.strptime(start_date, '%Y-%m-%d')
+    if end_date:
+        end_date = datetime.combine(datetime.strptime(end_date, '%Y-%m-%d'), time.max)
+
+    return start_date or None, end_date or None
+
 @bp.route('/reasons')
 @store_required
 def get_return_reasons():
@@ -2,6 +2,9 @@ from datetime import datetime, timedelta
 from sqlalchemy import func, and_
 from app.extensions import db
 from app.modules.returns.models import ReturnReport
+from app.utils.pagination import keyset_paginate
+from .constants import RETURN_ITEMS_DEFAULT_LIMIT, RETURN_ITEMS_MAX_LIMIT
+from .return_rates import get_daily_return_rates
 
 class ReturnReportService:
     def __init__(self, store_id):
@@ -9,38 +12,81 @@ class ReturnReportService:
         self.store_id = store_id
 
     def get_return_data(self, start_date=None, end_date=None, asin=None, return_reason=None):
-        """Get return data based on filters."""
-        # Build base query
-        query = ReturnReport.query.filter(ReturnReport.store_id == self.store_id)
+        """Get return data based on filters.
 
-        # Apply date filters
-        if start_date:
-            query = query.filter(ReturnReport.return_date >= start_date)
-        if end_date:
-            query = query.filter(ReturnReport.return_date <= end_date)
+        Reason distribution and summary are aggregated in SQL over
+        idx_return_store_date, and return rates are read from the return rate
+        facts. Individual returns are served page by page by get_return_items.
+        """
+        # Returned and ordered units per day come from the return rate facts
+        daily = get_daily_return_rates(self.store_id, start_date, end_date, asin)
 
-        # Apply ASIN and return reason filters
-        if asin:
-            query = query.filter(ReturnReport.asin == asin)
+        # Facts are not split by reason, so a reason filter needs its own totals
+        returned = None
         if return_reason:
-            query = query.filter(ReturnReport.return_reason == return_reason)
-
-        # Get reports
-        reports = query.order_by(ReturnReport.return_date).all()
-
-        # Process data for charts and metrics
-        return_rate = self._process_return_rate(reports)
-        return_reasons = self._process_return_reasons(reports)
-        summary_metrics = self._calculate_summary_metrics(reports)
-        return_items = self._process_return_items(reports)
+            returned = {
+                str(day): quantity
+                for day, quantity in self._filter(
+                    db.session.query(
+                        func.date(ReturnReport.return_date),
+                        func.sum(ReturnReport.quantity)
+                    ),
+                    start_date, end_date, asin, return_reason
+                ).group_by(func.date(ReturnReport.return_date))
+            }
+
+        reasons = self._filter(
+            db.session.query(
+                ReturnReport.return_reason,
+                func.sum(ReturnReport.quantity).label('quantity')
+            ),
+            start_date, end_date, asin, return_reason
+        ).group_by(ReturnReport.return_reason).order_by(func.sum(ReturnReport.quantity).desc()).all()
+
+        totals = self._filter(
+            db.session.query(
+                func.count(ReturnReport.id).label('rows'),
+                func.coalesce(func.sum(ReturnReport.quantity), 0).label('returns'),
+                func.coalesce(func.sum(ReturnReport.refund_amount), 0).label('refund')
+            ),
+            start_date, end_date, asin, return_reason
+        ).one()
 
         return {
-            'return_rate': return_rate,
-            'return_reasons': return_reasons,
-            'summary': summary_metrics,
-            'return_items': return_items
+            'return_rate': self._process_return_rate(daily, returned),
+            'return_reasons': self._process_return_reasons(reasons),
+            'summary': self._calculate_summary_metrics(totals, sum(day.units_ordered for day in daily))
         }
 
+    def get_return_items(self, start_date=None, end_date=None, asin=None, return_reason=None,
+                         cursor=None, limit=RETURN_ITEMS_DEFAULT_LIMIT):
+        """Get one page of returned items, newest first.
+
+        Args:
+            start_date: Start of the range (inclusive)
+            end_date: End of the range (inclusive)
+            asin: Optional ASIN filter
+            return_reason: Optional return reason filter
+            cursor: ``next_cursor`` of the previous page
+            limit: Items per page, capped at RETURN_ITEMS_MAX_LIMIT
+
+        Returns:
+            Dict with the page items, the cursor of the next page and whether
+            more items exist
+        """
+        query = self._filter(
+            ReturnReport.query, start_date, end_date, asin, return_reason
+        )
+        page = keyset_paginate(
+            query,
+            (ReturnReport.return_date, ReturnReport.id),
+            cursor=cursor,
+            limit=max(1, min(int(limit), RETURN_ITEMS_MAX_LIMIT)),
+            descending=True
+        )
+        page['items'] = self._process_return_items(page['items'])
+        return page
+
     def get_asins(self):
         """Get list of unique ASINs for the store."""
         asins = db.session.query(
@@ -97,29 +143,48 @@ class ReturnReportService:
         # Group by date and get results
         trends = query.group_by(func.date(ReturnReport.return_date)).order_by('date').all()
 
+        # Units ordered per day for the daily return rate
+        units_ordered = {
+            str(day.date): day.units_ordered
+            for day in get_daily_return_rates(self.store_id, start_date, end_date, asin)
+        }
+
         # Process trends data
-        return self._process_trends_data(trends)
+        return self._process_trends_data(trends, units_ordered)
+
+    def _filter(self, query, start_date=None, end_date=None, asin=None, return_reason=None):
+        """Restrict a query to the store and the given filters."""
+        query = query.filter(ReturnReport.store_id == self.store_id)
 
-    def _process_return_rate(self, reports):
-        """Process reports data for return rate chart."""
+        # Apply date filters
+        if start_date:
+            query = query.filter(ReturnReport.return_date >= start_date)
+        if end_date:
+            query = query.filter(ReturnReport.return_date <= end_date)
+
+        # Apply ASIN and return reason filters
+        if asin:
+            query = query.filter(ReturnReport.asin == asin)
+        if return_reason:
+            query = query.filter(ReturnReport.return_reason == return_reason)
+
+        return query
+
+    def _process_return_rate(self, daily, returned=None):
+        """Process per-day return rate facts for the return rate chart.
+
+        Args:
+            daily: (date, returned_units, units_ordered) rows
+            returned: Optional returned units per date string overriding the facts
+        """
         dates = []
         rates = []
 
-        # Group reports by date
-        daily_returns = {}
-        for report in reports:
-            date_str = report.return_date.strftime('%Y-%m-%d')
-            if date_str not in daily_returns:
-                daily_returns[date_str] = {
-                    'returns': 0,
-                    'total_orders': report.total_orders if hasattr(report, 'total_orders') else 100  # Fallback value
-                }
-            daily_returns[date_str]['returns'] += report.quantity
-
-        # Calculate daily return rates
-        for date_str, data in sorted(daily_returns.items()):
-            dates.append(date_str)
-            rate = (data['returns'] / data['total_orders'] * 100) if data['total_orders'] > 0 else 0
+        for day in daily:
+            label = str(day.date)
+            returns = day.returned_units if returned is None else returned.get(label, 0)
+            dates.append(label)
+            rate = (returns / day.units_ordered * 100) if day.units_ordered else 0
             rates.append(round(rate, 2))
 
         return {
@@ -127,29 +192,22 @@ class ReturnReportService:
             'rates': rates
         }
 
-    def _process_return_reasons(self, reports):
-        """Process reports data for return reasons chart."""
-        reason_counts = {}
-        for report in reports:
-            if report.return_reason not in reason_counts:
-                reason_counts[report.return_reason] = 0
-            reason_counts[report.return_reason] += report.quantity
-
+    def _process_return_reasons(self, reasons):
+        """Process per-reason totals for the return reasons chart."""
         return {
-            'reasons': list(reason_counts.keys()),
-            'counts': list(reason_counts.values())
+            'reasons': [r.return_reason for r in reasons],
+            'counts': [int(r.quantity) for r in reasons]
         }
 
-    def _calculate_summary_metrics(self, reports):
-        """Calculate summary metrics from reports."""
-        total_returns = sum(r.quantity for r in reports)
-        total_refund = sum(r.refund_amount for r in reports)
-        total_orders = sum(r.total_orders if hasattr(r, 'total_orders') else 100 for r in reports)  # Fallback value
-        return_rate = (total_returns / total_orders * 100) if total_orders > 0 else 0
+    def _calculate_summary_metrics(self, totals, units_ordered):
+        """Calculate summary metrics from the aggregate row."""
+        total_returns = int(totals.returns)
+        units_ordered = int(units_ordered or 0)
+        return_rate = (total_returns / units_ordered * 100) if units_ordered > 0 else 0
 
         return {
             'total_returns': total_returns,
-            'total_refund': round(total_refund, 2),
+            'total_refund': round(float(totals.refund), 2),
             'return_rate': round(return_rate, 2)
         }
 
@@ -162,11 +220,11 @@ class ReturnReportService:
             'title': report.title,
             'quantity': report.quantity,
             'return_reason': report.return_reason,
-            'refund_amount': round(report.refund_amount, 2),
+            'refund_amount': float(round(report.refund_amount, 2)),
             'status': report.status
         } for report in reports]
 
-    def _process_trends_data(self, trends):
+    def _process_trends_data(self, trends, units_ordered):
         """Process trends data."""
         dates = []
         returns = []
@@ -175,13 +233,13 @@ class ReturnReportService:
         daily_rates = []
 
         for trend in trends:
-            dates.append(trend.date.strftime('%Y-%m-%d'))
+            dates.append(str(trend.date)[:10])
             returns.append(trend.returns)
             quantities.append(trend.quantity)
             refund_amounts.append(round(trend.refund_amount, 2))
             
-            # Calculate daily return rate (assuming we have total orders data)
-            total_orders = 100  # Fallback value if we don't have actual data
+            # Calculate daily return rate against units ordered that day
+            total_orders = units_ordered.get(dates[-1], 0)
             rate = (trend.quantity / total_orders * 100) if total_orders > 0 else 0
             daily_rates.append(round(rate, 2))
 
@@ -0,0 +1,35 @@
+"""Store-access sets for authorization checks.
+
+The IDs of the stores a user may access are loaded with one ID-only query
+and memoized on the User instance, which Flask-Login keeps for the whole
+request. There is deliberately no cache across requests: a process-local
+cache would let a store's old owner keep access in every other worker
+until it expired, and checking a shared version would cost a query per
+request just like loading the set. After each commit, Users loaded in the
+session drop their memo, so changes made earlier in the same request,
+including bulk ``Query.update()`` calls that skip mapper events, are seen
+by the next check.
+"""
+
+from typing import FrozenSet
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.modules.auth.models import User
+from .models import Store
+
+
+def get_store_ids(user_id: int) -> FrozenSet[int]:
+    """IDs of the stores a user owns."""
+    return frozenset(
+        row[0] for row in db.session.query(Store.id).filter(Store.user_id == user_id)
+    )
+
+
+@event.listens_for(Session, 'after_commit')
+def _forget_store_ids_after_commit(session: Session) -> None:
+    for user in list(session.identity_map.values()):
+        if isinstance(user, User):
+            user.__dict__.pop('_store_ids', None)
@@ -9,6 +9,8 @@ import logging
 from app import db
 from app.modules.advertising.models import AdvertisingReport
 from app.modules.advertising.constants import REQUIRED_COLUMNS, ERROR_MESSAGES
+from app.modules.advertising.dimensions import resolve_dimensions
+from app.utils.money import normalize_money_columns, MONEY_COLUMNS
 from .base import BaseCSVProcessor
 from ..validators.advertising import AdvertisingCSVValidator
 
@@ -35,6 +37,12 @@ ADVERTISING_REPORT_COLUMNS = {
     'conversion_rate': {'type': float, 'required': True, 'description': 'Dönüşüm oranı'}
 }
 
+# Model alanları: ad sütunları yerine boyut tablolarının id'leri
+REPORT_FIELDS = [
+    col for col in ADVERTISING_REPORT_COLUMNS
+    if col not in ('campaign_name', 'ad_group_name', 'search_term')
+] + ['campaign_id', 'ad_group_id', 'search_term_id']
+
 class AdvertisingCSVProcessor(BaseCSVProcessor):
     """CSV processor for advertising reports."""
     
@@ -54,6 +62,9 @@ class AdvertisingCSVProcessor(BaseCSVProcessor):
         """
         errors = []
         
+        # Para sütunlarını sayısal değerlere çevir ($1,234.50 -> 1234.50)
+        normalize_money_columns(df, MONEY_COLUMNS['advertising_reports'])
+        
         # Sütun kontrolü - sıra önemli
         expected_columns = list(ADVERTISING_REPORT_COLUMNS.keys())
         if list(df.columns) != expected_columns:
@@ -131,8 +142,11 @@ class AdvertisingCSVProcessor(BaseCSVProcessor):
             if not is_valid:
                 return False, "\n".join(errors)
             
+            # Kampanya, reklam grubu ve arama terimi adlarını toplu olarak id'lere çevir
+            resolve_dimensions(df)
+            
             # Define unique columns for advertising reports
-            unique_columns = ['store_id', 'date', 'campaign_name', 'ad_group_name', 'targeting_type', 'search_term']
+            unique_columns = ['store_id', 'date', 'campaign_id', 'ad_group_id', 'targeting_type', 'search_term_id']
             
             for _, row in df.iterrows():
                 # Create a filter dictionary based on unique columns
@@ -140,7 +154,7 @@ class AdvertisingCSVProcessor(BaseCSVProcessor):
                 existing_record = AdvertisingReport.query.filter_by(**filters).first()
                 
                 # CSV'den gelen sütunların modeldeki alanlarla eşleştiğinden emin ol
-                report_data = {col: row[col] for col in ADVERTISING_REPORT_COLUMNS.keys()}
+                report_data = {col: row[col] for col in REPORT_FIELDS}
                 
                 if existing_record:
                     # Update existing record
@@ -11,8 +11,11 @@ import logging
 from datetime import datetime, UTC
 import csv
 import shutil
+import time
 
 from app import db
+from app.core.cache import bump_data_version
+from app.core.telemetry import INGEST_CHUNK_DURATION, INGEST_FILES, INGEST_ROWS, INGEST_SECONDS
 from app.modules.stores.models import Store
 from ..validators.base import BaseCSVValidator
 from ..constants import CSV_COLUMNS, ERROR_MESSAGES
@@ -170,9 +173,18 @@ class BaseCSVProcessor(ABC):
                 
                 # Save chunk data
                 try:
+                    chunk_start = time.perf_counter()
                     self.save_data(chunk, user_id)
+                    chunk_duration = time.perf_counter() - chunk_start
+                    INGEST_CHUNK_DURATION.observe(chunk_duration, report_type=self.report_type)
+                    INGEST_SECONDS.inc(chunk_duration, report_type=self.report_type)
+                    INGEST_ROWS.inc(len(chunk), report_type=self.report_type)
                     total_rows += len(chunk)
                     
+                    # Invalidate cached analytics for the updated stores
+                    for store_id in chunk_store_ids:
+                        bump_data_version(int(store_id))
+                    
                     # Update upload history progress
                     if self.upload_history:
                         self.upload_history.rows_processed = total_rows
@@ -181,6 +193,7 @@ class BaseCSVProcessor(ABC):
                 except Exception as e:
                     error_msg = f"Error saving chunk {chunk_idx}: {str(e)}"
                     logger.exception(error_msg)
+                    INGEST_FILES.inc(report_type=self.report_type, status='failed')
                     
                     # Update history with error
                     upload_history.status = 'failed'
@@ -200,11 +213,13 @@ class BaseCSVProcessor(ABC):
             upload_history.rows_processed = total_rows
             db.session.commit()
             
+            INGEST_FILES.inc(report_type=self.report_type, status='completed')
             return True, "File processed successfully"
             
         except Exception as e:
             error_msg = f"Error processing file: {str(e)}"
             logger.exception(error_msg)
+            INGEST_FILES.inc(report_type=self.report_type, status='failed')
             
             if self.upload_history:
                 self.upload_history.status = 'failed'
@@ -9,6 +9,8 @@ import logging
 from app import db
 from app.modules.business.models import BusinessReport
 from app.modules.business.constants import REQUIRED_COLUMNS, ERROR_MESSAGES
+from app.utils.money import normalize_money_columns, MONEY_COLUMNS
+from app.modules.returns.return_rates import refresh_return_rates
 from .base import BaseCSVProcessor
 from ..validators.business import BusinessCSVValidator
 from app.modules.stores.models import Store  # Store modülünün doğru path'i
@@ -29,6 +31,15 @@ BUSINESS_REPORT_COLUMNS = {
     'conversion_rate': {'type': float, 'required': True, 'description': 'Dönüşüm oranı'}
 }
 
+# Columns identifying a business report row for upserts
+UPSERT_KEY = ['store_id', 'date', 'sku', 'asin']
+
+
+def existing_report_query(filters: Dict[str, Any]):
+    """Query for the stored row with the same upsert key values."""
+    return BusinessReport.query.filter_by(**{col: filters[col] for col in UPSERT_KEY})
+
+
 class BusinessCSVProcessor(BaseCSVProcessor):
     """CSV processor for business reports."""
     
@@ -48,6 +59,9 @@ class BusinessCSVProcessor(BaseCSVProcessor):
         """
         errors = []
         
+        # Para sütunlarını sayısal değerlere çevir ($1,234.50 -> 1234.50)
+        normalize_money_columns(df, MONEY_COLUMNS['business_reports'])
+        
         # Sütun kontrolü
         missing_columns = [col for col in BUSINESS_REPORT_COLUMNS if col not in df.columns]
         if missing_columns:
@@ -136,12 +150,20 @@ class BusinessCSVProcessor(BaseCSVProcessor):
                     return False, "\n".join(errors)
             
             # Define unique columns for business reports
-            unique_columns = ['store_id', 'date', 'sku', 'asin']
+            unique_columns = UPSERT_KEY
+            
+            # (date, asin) pairs per store whose return rate facts must be refreshed
+            touched = {}
             
             for _, row in df.iterrows():
                 # Create a filter dictionary based on unique columns
                 filters = {col: row[col] for col in unique_columns}
-                existing_record = BusinessReport.query.filter_by(**filters).first()
+                existing_record = existing_report_query(filters).first()
+                
+                keys = touched.setdefault(int(row['store_id']), set())
+                keys.add((row['date'], row['asin']))
+                if existing_record:
+                    keys.add((existing_record.date, existing_record.asin))
                 
                 # CSV'den gelen sütunların modeldeki alanlarla eşleştiğinden emin ol
                 report_data = {
@@ -168,6 +190,9 @@ class BusinessCSVProcessor(BaseCSVProcessor):
                     db.session.add(new_record)
                     records_processed += 1
                     
+            for store_id, keys in touched.items():
+                refresh_return_rates(store_id, keys)
+                    
             db.session.commit()
             return True, f"Processed {records_processed} new records and updated {records_updated} records"
             
@@ -9,6 +9,8 @@ import logging
 from app import db
 from app.modules.inventory.models import InventoryReport
 from app.modules.inventory.constants import REQUIRED_COLUMNS, ERROR_MESSAGES
+from app.utils.money import normalize_money_columns, MONEY_COLUMNS
+from app.modules.inventory.snapshots import refresh_inventory_snapshots
 from .base import BaseCSVProcessor
 from ..validators.inventory import InventoryCSVValidator
 
@@ -53,6 +55,9 @@ class InventoryCSVProcessor(BaseCSVProcessor):
         """
         errors = []
         
+        # Para sütunlarını sayısal değerlere çevir ($1,234.50 -> 1234.50)
+        normalize_money_columns(df, MONEY_COLUMNS['inventory_reports'])
+        
         # Sütun kontrolü - sıra önemli
         expected_columns = list(INVENTORY_REPORT_COLUMNS.keys())
         if list(df.columns) != expected_columns:
@@ -149,11 +154,18 @@ class InventoryCSVProcessor(BaseCSVProcessor):
             # Define unique columns for inventory reports
             unique_columns = ['store_id', 'date', 'sku', 'asin']
             
+            # SKUs and earliest snapshot date per store for current inventory refresh
+            touched = {}
+            
             for _, row in df.iterrows():
                 # Create a filter dictionary based on unique columns
                 filters = {col: row[col] for col in unique_columns}
                 existing_record = InventoryReport.query.filter_by(**filters).first()
                 
+                skus, since = touched.get(int(row['store_id']), (set(), row['date']))
+                skus.add(row['sku'])
+                touched[int(row['store_id'])] = (skus, min(since, row['date']))
+                
                 # CSV'den gelen sütunların modeldeki alanlarla eşleştiğinden emin ol
                 report_data = {col: row[col] for col in INVENTORY_REPORT_COLUMNS.keys()}
                 
@@ -168,6 +180,9 @@ class InventoryCSVProcessor(BaseCSVProcessor):
                     db.session.add(new_record)
                     records_processed += 1
                     
+            for store_id, (skus, since) in touched.items():
+                refresh_inventory_snapshots(store_id, skus, since=pd.Timestamp(since).to_pydatetime())
+                    
             db.session.commit()
             return True, f"Processed {records_processed} new records and updated {records_updated} records"
             
@@ -13,6 +13,8 @@ from app.modules.returns.constants import (
     VALID_RETURN_CENTERS, VALID_RETURN_CARRIERS,
     VALID_TRACKING_PREFIXES
 )
+from app.utils.money import normalize_money_columns, MONEY_COLUMNS
+from app.modules.returns.return_rates import refresh_return_rates
 from .base import BaseCSVProcessor
 from ..validators.returns import ReturnCSVValidator
 
@@ -54,6 +56,9 @@ class ReturnCSVProcessor(BaseCSVProcessor):
         """
         errors = []
         
+        # Normalize money columns to numeric values ($1,234.50 -> 1234.50)
+        normalize_money_columns(df, MONEY_COLUMNS['return_reports'])
+        
         # Column validation - order is important
         expected_columns = list(RETURN_REPORT_COLUMNS.keys())
         if list(df.columns) != expected_columns:
@@ -148,11 +153,19 @@ class ReturnCSVProcessor(BaseCSVProcessor):
             # Define unique columns for return reports
             unique_columns = ['store_id', 'return_date', 'order_id', 'sku']
             
+            # (date, asin) pairs per store whose return rate facts must be refreshed
+            touched = {}
+            
             for _, row in df.iterrows():
                 # Create a filter dictionary based on unique columns
                 filters = {col: row[col] for col in unique_columns}
                 existing_record = ReturnReport.query.filter_by(**filters).first()
                 
+                keys = touched.setdefault(int(row['store_id']), set())
+                keys.add((row['return_date'], row['asin']))
+                if existing_record:
+                    keys.add((existing_record.return_date, existing_record.asin))
+                
                 # CSV'den gelen sütunların modeldeki alanlarla eşleştiğinden emin ol
                 report_data = {col: row[col] for col in RETURN_REPORT_COLUMNS.keys()}
                 
@@ -167,6 +180,9 @@ class ReturnCSVProcessor(BaseCSVProcessor):
                     db.session.add(new_record)
                     records_processed += 1
                     
+            for store_id, keys in touched.items():
+                refresh_return_rates(store_id, keys)
+                    
             db.session.commit()
             return True, f"Processed {records_processed} new records and updated {records_updated} records"
             
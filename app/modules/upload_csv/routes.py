@@ -1,6 +1,7 @@
 """CSV upload routes."""
 from typing import List, Dict, Any
 from datetime import datetime, UTC
+from importlib import import_module
 
 from flask import Blueprint, render_template, request, jsonify, current_app, flash
 from flask_login import login_required, current_user
@@ -11,24 +12,27 @@ import logging
 from app.extensions import db
 from .models.csv_file import CSVFile
 from .models.upload_history import UploadHistory
-from .processors.business import BusinessCSVProcessor
-from .processors.advertising import AdvertisingCSVProcessor
-from .processors.inventory import InventoryCSVProcessor
-from .processors.returns import ReturnCSVProcessor
 from .utils import create_upload_folders
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('upload_csv', __name__, template_folder='templates')
 
-# Map report types to their processors
+# Map report types to their processors, as (module, class) so that pandas
+# is only imported when a file is actually processed
 PROCESSORS = {
-    'business_report': BusinessCSVProcessor,
-    'advertising_report': AdvertisingCSVProcessor,
-    'inventory_report': InventoryCSVProcessor,
-    'return_report': ReturnCSVProcessor
+    'business_report': ('.processors.business', 'BusinessCSVProcessor'),
+    'advertising_report': ('.processors.advertising', 'AdvertisingCSVProcessor'),
+    'inventory_report': ('.processors.inventory', 'InventoryCSVProcessor'),
+    'return_report': ('.processors.returns', 'ReturnCSVProcessor')
 }
 
+
+def get_processor_class(report_type: str) -> type:
+    """Import and return the processor class of a report type."""
+    module_name, class_name = PROCESSORS[report_type]
+    return getattr(import_module(module_name, __package__), class_name)
+
 @bp.route('/')
 @login_required
 def index() -> str:
@@ -82,7 +86,7 @@ def upload() -> tuple[Any, int]:
     try:
         # Debug: Log current user
         logger.info(f"Current user: ID={current_user.id}, Username={current_user.username}")
-        logger.info(f"User's stores: {[store.id for store in current_user.stores]}")
+        logger.info(f"User's stores: {sorted(current_user.store_ids)}")
         
         # Validate request
         if 'file' not in request.files:
@@ -106,7 +110,7 @@ def upload() -> tuple[Any, int]:
             }), 400
             
         # Get appropriate processor
-        processor_class = PROCESSORS[report_type]
+        processor_class = get_processor_class(report_type)
         processor = processor_class()
         
         # Process file
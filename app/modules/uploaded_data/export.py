@@ -0,0 +1,337 @@
+"""Streaming exports of uploaded report rows in row and columnar formats.
+
+Rows are read as plain column tuples through a server-side cursor in
+batches of EXPORT_BATCH_SIZE. Each batch is encoded and yielded before the
+next one is fetched, so memory stays flat for any range and the first bytes
+are sent before the last rows are read. Parquet and Arrow IPC are
+written with ``pyarrow``, imported on first use so that application
+startup does not pay for it.
+"""
+
+import csv
+import io
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import exists, select
+
+from app.extensions import db
+from app.utils.pagination import count_query
+from app.modules.advertising.models import AdCampaign, AdGroup, AdSearchTerm, AdvertisingReport
+from app.modules.business.constants import EXPORT_COLUMNS as BUSINESS_EXPORT_COLUMNS
+from app.modules.business.models import BusinessReport
+from app.modules.category.models import ASINCategory, Category
+from app.modules.inventory.models import InventoryReport
+from app.modules.returns.models import ReturnReport
+
+EXPORT_BATCH_SIZE = 10000
+
+# Format name -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'csv.gz': ('application/gzip', 'csv.gz'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrow')
+}
+
+
+def _business_category(top_level: bool):
+    """First category (or subcategory) name of a business row's ASIN."""
+    parent = Category.parent_id.is_(None) if top_level else Category.parent_id.isnot(None)
+    return select(Category.name).join(
+        ASINCategory, ASINCategory.category_id == Category.id
+    ).where(
+        ASINCategory.asin == BusinessReport.asin, parent
+    ).order_by(ASINCategory.id).limit(1).scalar_subquery()
+
+
+REPORT_EXPORTS = {
+    'business': {
+        'model': BusinessReport,
+        'date': 'date',
+        'daily': True,
+        'columns': BUSINESS_EXPORT_COLUMNS + ['category', 'subcategory'],
+        'expressions': {
+            'category': _business_category(top_level=True),
+            'subcategory': _business_category(top_level=False)
+        }
+    },
+    'advertising': {
+        'model': AdvertisingReport,
+        'date': 'date',
+        'daily': True,
+        'columns': [
+            'store_id', 'date', 'campaign_name', 'ad_group_name', 'search_term', 'targeting_type',
+            'match_type', 'impressions', 'clicks', 'ctr', 'cpc', 'spend', 'total_sales', 'acos',
+            'total_orders', 'total_units', 'conversion_rate'
+        ],
+        # Dimension names come from one join each instead of the models'
+        # per-row subqueries
+        'expressions': {
+            'campaign_name': AdCampaign.name,
+            'ad_group_name': AdGroup.name,
+            'search_term': AdSearchTerm.term
+        },
+        'joins': [
+            (AdCampaign, AdCampaign.id == AdvertisingReport.campaign_id),
+            (AdGroup, AdGroup.id == AdvertisingReport.ad_group_id),
+            (AdSearchTerm, AdSearchTerm.id == AdvertisingReport.search_term_id)
+        ]
+    },
+    'inventory': {
+        'model': InventoryReport,
+        'date': 'date',
+        'daily': True,
+        'columns': [
+            'store_id', 'date', 'sku', 'asin', 'product_name', 'condition', 'price',
+            'mfn_listing_exists', 'mfn_fulfillable_quantity', 'afn_listing_exists',
+            'afn_warehouse_quantity', 'afn_fulfillable_quantity', 'afn_unsellable_quantity',
+            'afn_reserved_quantity', 'afn_total_quantity', 'per_unit_volume'
+        ],
+        'expressions': {}
+    },
+    'returns': {
+        'model': ReturnReport,
+        'date': 'return_date',
+        'daily': False,
+        'columns': [
+            'store_id', 'return_date', 'order_id', 'sku', 'asin', 'title', 'quantity',
+            'return_reason', 'status', 'refund_amount', 'return_center', 'return_carrier',
+            'tracking_number'
+        ],
+        'expressions': {}
+    }
+}
+
+
+def negotiate_format(requested: Optional[str], accept_mimetypes) -> str:
+    """Pick the export format from an explicit name or the Accept header.
+
+    Args:
+        requested: Format name given by the client, if any
+        accept_mimetypes: The request's parsed Accept header
+
+    Returns:
+        str: Key in EXPORT_FORMATS, CSV when nothing better is accepted
+    """
+    if requested:
+        return requested
+    mimetypes = {mimetype: name for name, (mimetype, _) in EXPORT_FORMATS.items()}
+    best = accept_mimetypes.best_match(list(mimetypes), default='text/csv')
+    return mimetypes.get(best, 'csv')
+
+
+def has_report_data(report_type: str, store_id: int, start_date: Optional[datetime] = None,
+                    end_date: Optional[datetime] = None) -> bool:
+    """Whether a store has any rows in the range, without counting them."""
+    return db.session.query(
+        exists().where(*_filters(report_type, store_id, start_date, end_date))
+    ).scalar()
+
+
+def estimate_report_rows(report_type: str, store_id: int, start_date: Optional[datetime] = None,
+                         end_date: Optional[datetime] = None) -> int:
+    """Planner estimate (or cached count) of the rows an export will write."""
+    model = REPORT_EXPORTS[report_type]['model']
+    query = db.session.query(model.id).filter(*_filters(report_type, store_id, start_date, end_date))
+    return count_query(query, 'estimate', store_id=store_id)
+
+
+def stream_export(
+    report_type: str,
+    store_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    fmt: str = 'csv',
+    batch_size: int = EXPORT_BATCH_SIZE,
+    on_batch: Optional[Callable[[int], None]] = None
+) -> Iterator[bytes]:
+    """Yield a store's report rows in a date range as an encoded file.
+
+    Args:
+        report_type: Key in REPORT_EXPORTS
+        store_id: Store ID
+        start_date: Start of the range (inclusive), None for no lower bound
+        end_date: End of the range (inclusive), None for no upper bound
+        fmt: Key in EXPORT_FORMATS
+        batch_size: Rows fetched and encoded per chunk
+        on_batch: Called with the row count of each batch once it is read
+
+    Yields:
+        bytes: Consecutive pieces of the file
+
+    Raises:
+        ValueError: If the report type or format is not supported
+    """
+    if report_type not in REPORT_EXPORTS:
+        raise ValueError(f"Invalid report type: {report_type}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format: {fmt}. Valid values: {', '.join(EXPORT_FORMATS)}")
+
+    columns = _columns(report_type)
+    batches = _batches(report_type, store_id, start_date, end_date, columns, batch_size, on_batch)
+    names = [name for name, _ in columns]
+
+    if fmt == 'csv':
+        return _encode_csv(names, batches, REPORT_EXPORTS[report_type])
+    if fmt == 'csv.gz':
+        return _gzip(_encode_csv(names, batches, REPORT_EXPORTS[report_type]))
+    return _encode_arrow(columns, batches, parquet=fmt == 'parquet')
+
+
+def _columns(report_type: str) -> List[Tuple[str, Any]]:
+    """(name, SQL expression) pairs of a report type's export columns."""
+    export = REPORT_EXPORTS[report_type]
+    return [
+        (name, export['expressions'][name] if name in export['expressions'] else getattr(export['model'], name))
+        for name in export['columns']
+    ]
+
+
+def _filters(report_type: str, store_id: int, start_date: Optional[datetime],
+             end_date: Optional[datetime]) -> list:
+    """Filters selecting a store's rows in a date range."""
+    export = REPORT_EXPORTS[report_type]
+    model = export['model']
+    date_column = getattr(model, export['date'])
+
+    filters = [model.store_id == store_id]
+    if start_date is not None:
+        filters.append(date_column >= start_date)
+    if end_date is not None:
+        filters.append(date_column <= end_date)
+    return filters
+
+
+def _batches(report_type: str, store_id: int, start_date: Optional[datetime],
+             end_date: Optional[datetime], columns: List[Tuple[str, Any]],
+             batch_size: int, on_batch: Optional[Callable[[int], None]] = None) -> Iterator[list]:
+    """Row tuple batches read through a server-side cursor."""
+    export = REPORT_EXPORTS[report_type]
+    model = export['model']
+    statement = select(*(expression.label(name) for name, expression in columns)).select_from(model)
+    for target, onclause in export.get('joins', []):
+        statement = statement.outerjoin(target, onclause)
+    statement = statement.where(
+        *_filters(report_type, store_id, start_date, end_date)
+    ).order_by(getattr(model, export['date']), model.id)
+
+    result = db.session.execute(statement.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        if on_batch is not None:
+            on_batch(len(rows))
+        yield rows
+
+
+def _encode_csv(names: List[str], batches: Iterator[list], export: Dict) -> Iterator[bytes]:
+    """Encode batches as UTF-8 CSV, one chunk per batch after the header."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    yield buffer.getvalue().encode()
+
+    # Daily report dates are written as plain YYYY-MM-DD days
+    day_index = names.index(export['date']) if export['daily'] else None
+
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            row = list(row)
+            if day_index is not None:
+                row[day_index] = row[day_index].date().isoformat()
+            writer.writerow(row)
+        yield buffer.getvalue().encode()
+
+
+def _gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member as it is produced."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _encode_arrow(columns: List[Tuple[str, Any]], batches: Iterator[list], parquet: bool) -> Iterator[bytes]:
+    """Encode batches as a Parquet file or an Arrow IPC stream, one row group or record batch per batch."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, _arrow_type(pa, expression.type)) for name, expression in columns])
+    sink = _ChunkSink()
+
+    if parquet:
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode='w'), schema, compression='zstd')
+    else:
+        writer = pa.ipc.new_stream(pa.PythonFile(sink, mode='w'), schema)
+
+    for rows in batches:
+        arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        data = sink.drain()
+        if data:
+            yield data
+
+    writer.close()
+    yield sink.drain()
+
+
+def _arrow_type(pa, sql_type):
+    """Arrow type for a SQLAlchemy column type."""
+    python_type = sql_type.python_type
+    if python_type is Decimal:
+        return pa.decimal128(sql_type.precision or 18, sql_type.scale or 0)
+    if python_type is datetime:
+        return pa.timestamp('us')
+    if python_type is date:
+        return pa.date32()
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    return pa.string()
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back in chunks.
+
+    Writers record offsets with ``tell()``, so the position keeps counting
+    across drains even though drained bytes are released.
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
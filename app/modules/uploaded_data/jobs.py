@@ -0,0 +1,280 @@
+"""Background export jobs for large date ranges.
+
+A request enqueues an ExportJob and returns at once. The job runs through
+``app.core.jobs`` and streams the export chunk by chunk into a file under
+``UPLOAD_FOLDER/exports``. Status is recorded on the job row when it starts
+and when it ends. Rows written are saved to the job row every
+EXPORT_PROGRESS_BATCHES batches through a separate connection, so every
+worker sees the progress, the job's session is never committed behind its
+back and the export's server-side cursor stays open.
+
+``cleanup_export_jobs`` fails jobs whose worker died (no status change or
+progress save for EXPORT_JOB_STALE_AFTER) and deletes export files older
+than EXPORT_FILE_RETENTION. It runs in the background at most every
+EXPORT_CLEANUP_INTERVAL when jobs are created, and as ``flask exports
+cleanup``.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, Optional
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import func, update
+
+from app.core.jobs import submit_job
+from app.extensions import db
+from .export import (
+    EXPORT_FORMATS, REPORT_EXPORTS, estimate_report_rows, stream_export
+)
+from .models import ExportJob
+
+EXPORT_JOB_FOLDER = 'exports'
+
+# Batches read between saves of a running job's rows written
+EXPORT_PROGRESS_BATCHES = 5
+
+# Pending or running jobs not heard from for this long are failed
+EXPORT_JOB_STALE_AFTER = timedelta(minutes=30)
+
+# Completed exports are deleted this long after they finish
+EXPORT_FILE_RETENTION = timedelta(days=7)
+
+# Seconds between cleanups started by job creation in one process
+EXPORT_CLEANUP_INTERVAL = 15 * 60
+
+_last_cleanup = 0.0
+_last_cleanup_lock = threading.Lock()
+
+
+def create_export_job(
+    user_id: int,
+    store_id: int,
+    report_type: str,
+    fmt: str = 'csv',
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> ExportJob:
+    """Record an export job and hand it to the background executor.
+
+    Args:
+        user_id: Requesting user
+        store_id: Store to export
+        report_type: Key in REPORT_EXPORTS
+        fmt: Key in EXPORT_FORMATS
+        start_date: Start of the range (inclusive), None for no lower bound
+        end_date: End of the range (inclusive), None for no upper bound
+
+    Returns:
+        ExportJob: The pending job
+
+    Raises:
+        ValueError: If the report type or format is not supported
+    """
+    if report_type not in REPORT_EXPORTS:
+        raise ValueError(f"Invalid report type: {report_type}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format: {fmt}. Valid values: {', '.join(EXPORT_FORMATS)}")
+
+    job = ExportJob(
+        user_id=user_id,
+        store_id=store_id,
+        report_type=report_type,
+        format=fmt,
+        start_date=start_date,
+        end_date=end_date,
+        status='pending'
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    submit_job(run_export_job, job.id)
+    _schedule_cleanup()
+    return job
+
+
+def run_export_job(job_id: int) -> None:
+    """Write a pending job's export to disk and record the outcome."""
+    job = db.session.get(ExportJob, job_id)
+    if job is None or job.status != 'pending':
+        return
+
+    folder = os.path.join(current_app.config['UPLOAD_FOLDER'], EXPORT_JOB_FOLDER)
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"{job.report_type}_{job.store_id}_{job.id}.{EXPORT_FORMATS[job.format][1]}")
+    partial = f"{path}.part"
+
+    try:
+        job.status = 'running'
+        job.started_at = job.updated_at = datetime.now(UTC)
+        job.rows_total = estimate_report_rows(job.report_type, job.store_id, job.start_date, job.end_date)
+        db.session.commit()
+
+        written = 0
+        batches = 0
+
+        def on_batch(rows: int) -> None:
+            nonlocal written, batches
+            written += rows
+            batches += 1
+            if batches % EXPORT_PROGRESS_BATCHES == 0:
+                save_export_progress(job_id, written)
+
+        chunks = stream_export(job.report_type, job.store_id, job.start_date, job.end_date,
+                               job.format, on_batch=on_batch)
+        with open(partial, 'wb') as output:
+            for chunk in chunks:
+                output.write(chunk)
+        os.replace(partial, path)
+
+        job.status = 'completed'
+        job.rows_written = written
+        job.file_path = path
+        job.file_size = os.path.getsize(path)
+        job.completed_at = job.updated_at = datetime.now(UTC)
+        db.session.commit()
+    except Exception as e:
+        current_app.logger.exception(f"Export job {job_id} failed")
+        db.session.rollback()
+        if os.path.exists(partial):
+            os.remove(partial)
+
+        job = db.session.get(ExportJob, job_id)
+        job.status = 'failed'
+        job.error_message = str(e)
+        job.completed_at = job.updated_at = datetime.now(UTC)
+        db.session.commit()
+
+
+def save_export_progress(job_id: int, rows_written: int) -> None:
+    """Save a running job's rows written in a transaction of its own.
+
+    The update runs on a separate connection; on SQLite that relies on the
+    WAL journal set up by ``app.core.jobs``. Progress is advisory, so a
+    failed save is logged and the export goes on.
+    """
+    statement = update(ExportJob.__table__).where(
+        ExportJob.__table__.c.id == job_id
+    ).values(rows_written=rows_written, updated_at=datetime.now(UTC))
+
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(statement)
+    except Exception as e:
+        current_app.logger.warning(f"Could not save progress of export job {job_id}: {str(e)}")
+
+
+def cleanup_export_jobs(now: Optional[datetime] = None) -> Dict[str, int]:
+    """Fail abandoned jobs and delete expired or orphaned export files.
+
+    Args:
+        now: Current time, for tests
+
+    Returns:
+        Dict with the number of jobs failed, jobs expired and stray files
+        removed
+    """
+    now = now or datetime.now(UTC)
+    stale_before = (now - EXPORT_JOB_STALE_AFTER).replace(tzinfo=None)
+    expire_before = (now - EXPORT_FILE_RETENTION).replace(tzinfo=None)
+
+    failed = ExportJob.query.filter(
+        ExportJob.status.in_(('pending', 'running')),
+        func.coalesce(ExportJob.updated_at, ExportJob.created_at) < stale_before
+    ).update({
+        'status': 'failed',
+        'error_message': 'Export job stopped without finishing',
+        'completed_at': now,
+        'updated_at': now
+    }, synchronize_session=False)
+
+    expired = 0
+    for job in ExportJob.query.filter(
+        ExportJob.status == 'completed', ExportJob.completed_at < expire_before
+    ).all():
+        _remove_file(job.file_path)
+        job.status = 'expired'
+        job.file_path = None
+        job.updated_at = now
+        expired += 1
+    db.session.commit()
+
+    # Files no live job points to, e.g. partial files of dead workers
+    removed = 0
+    folder = os.path.join(current_app.config['UPLOAD_FOLDER'], EXPORT_JOB_FOLDER)
+    if os.path.isdir(folder):
+        live = {
+            path for (path,) in db.session.query(ExportJob.file_path).filter(
+                ExportJob.status == 'completed', ExportJob.file_path.isnot(None)
+            )
+        }
+        stale_mtime = (now - EXPORT_JOB_STALE_AFTER).timestamp()
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            if path not in live and os.path.getmtime(path) < stale_mtime:
+                _remove_file(path)
+                removed += 1
+
+    return {'failed': failed, 'expired': expired, 'removed': removed}
+
+
+def _remove_file(path: Optional[str]) -> None:
+    """Delete a file if it is still there."""
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def _schedule_cleanup() -> None:
+    """Queue a cleanup unless this process ran one recently."""
+    global _last_cleanup
+    with _last_cleanup_lock:
+        if time.monotonic() - _last_cleanup < EXPORT_CLEANUP_INTERVAL:
+            return
+        _last_cleanup = time.monotonic()
+    submit_job(cleanup_export_jobs)
+
+
+def get_export_job(job_id: int, user_id: int) -> Optional[ExportJob]:
+    """A user's export job, or None if it does not exist or is not theirs."""
+    return ExportJob.query.filter_by(id=job_id, user_id=user_id).first()
+
+
+def export_job_status(job: ExportJob) -> Dict[str, Any]:
+    """Job details with the progress last saved while it runs."""
+    status = job.to_dict()
+    status['progress'] = None
+    if job.status == 'completed':
+        status['progress'] = 100.0
+    elif job.rows_total:
+        status['progress'] = round(min(status['rows_written'] / job.rows_total, 1) * 100, 1)
+    return status
+
+
+@click.group('exports')
+def exports_cli():
+    """Export job commands."""
+    pass
+
+
+@exports_cli.command('cleanup')
+@with_appcontext
+def cleanup_command():
+    """Fail abandoned export jobs and delete expired export files."""
+    try:
+        counts = cleanup_export_jobs()
+        click.echo(
+            f"Failed {counts['failed']} abandoned jobs, expired {counts['expired']} exports "
+            f"and removed {counts['removed']} stray files."
+        )
+    except Exception as e:
+        db.session.rollback()
+        click.echo(f"Error: {str(e)}", err=True)
+
+
+def init_app(app):
+    """Register CLI commands with the app."""
+    app.cli.add_command(exports_cli)
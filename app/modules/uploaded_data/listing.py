@@ -0,0 +1,136 @@
+"""Keyset-paginated listings of uploaded report rows.
+
+Each report type declares which columns can be sorted and filtered. Sorting
+and filtering are pushed down to SQL and pages are fetched by seeking past
+the last (sort column, id) seen, carried between requests as an opaque
+cursor, so a page costs the same at any depth and only ``limit`` rows are
+ever loaded. Sortable columns must be NOT NULL, since rows with a NULL
+sort value can never be sought past.
+"""
+
+from datetime import datetime, time
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.models import InventoryReport
+from app.modules.returns.models import ReturnReport
+from app.utils.pagination import keyset_paginate
+
+LISTING_DEFAULT_LIMIT = 50
+LISTING_MAX_LIMIT = 500
+
+REPORT_LISTINGS = {
+    'business': {
+        'model': BusinessReport,
+        'date': 'date',
+        'sort': ['date', 'asin', 'sku', 'sessions', 'units_ordered', 'ordered_product_sales'],
+        'filters': ['asin', 'sku'],
+        'extra': []
+    },
+    'advertising': {
+        'model': AdvertisingReport,
+        'date': 'date',
+        'sort': ['date', 'impressions', 'clicks', 'spend', 'total_sales', 'total_orders'],
+        'filters': ['campaign_name', 'targeting_type', 'match_type'],
+        'extra': ['campaign_name', 'ad_group_name', 'search_term']
+    },
+    'inventory': {
+        'model': InventoryReport,
+        'date': 'date',
+        'sort': ['date', 'asin', 'sku', 'afn_fulfillable_quantity', 'afn_total_quantity'],
+        'filters': ['asin', 'sku', 'condition'],
+        'extra': []
+    },
+    'returns': {
+        'model': ReturnReport,
+        'date': 'return_date',
+        'sort': ['return_date', 'asin', 'sku', 'quantity', 'refund_amount'],
+        'filters': ['asin', 'sku', 'return_reason', 'status'],
+        'extra': []
+    }
+}
+
+
+def list_reports(
+    report_type: str,
+    store_id: int,
+    sort: Optional[str] = None,
+    order: str = 'desc',
+    cursor: Optional[str] = None,
+    limit: int = LISTING_DEFAULT_LIMIT,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    **filters: Any
+) -> Dict[str, Any]:
+    """Get one page of a store's report rows.
+
+    Args:
+        report_type: Key in REPORT_LISTINGS
+        store_id: Store ID
+        sort: Sort column, defaults to the report date
+        order: 'asc' or 'desc'
+        cursor: ``next_cursor`` of the previous page
+        limit: Rows per page, at most LISTING_MAX_LIMIT
+        start_date: First report date (YYYY-MM-DD)
+        end_date: Last report date (YYYY-MM-DD)
+        **filters: Equality filters on the report type's filter columns
+
+    Returns:
+        Dict with the page items, the next page's ``next_cursor`` (or None),
+        ``has_more`` and the applied sort and order
+
+    Raises:
+        ValueError: If the report type, sort, order, limit, cursor or a
+            filter is invalid
+    """
+    if report_type not in REPORT_LISTINGS:
+        raise ValueError(f"Invalid report type: {report_type}")
+    listing = REPORT_LISTINGS[report_type]
+    model = listing['model']
+
+    sort = sort or listing['date']
+    if sort not in listing['sort']:
+        raise ValueError(f"Invalid sort column: {sort}. Valid values: {', '.join(listing['sort'])}")
+    if order not in ('asc', 'desc'):
+        raise ValueError("Order must be 'asc' or 'desc'")
+    limit = int(limit)
+    if not 1 <= limit <= LISTING_MAX_LIMIT:
+        raise ValueError(f"Limit must be between 1 and {LISTING_MAX_LIMIT}")
+
+    query = model.query.filter(model.store_id == store_id)
+
+    date_column = getattr(model, listing['date'])
+    if start_date:
+        query = query.filter(date_column >= datetime.strptime(start_date, '%Y-%m-%d'))
+    if end_date:
+        query = query.filter(date_column <= datetime.combine(datetime.strptime(end_date, '%Y-%m-%d'), time.max))
+
+    for name, value in filters.items():
+        if value in (None, ''):
+            continue
+        if name not in listing['filters']:
+            raise ValueError(f"Invalid filter: {name}")
+        query = query.filter(getattr(model, name) == value)
+
+    page = keyset_paginate(query, (getattr(model, sort), model.id), cursor=cursor, limit=limit,
+                           descending=order == 'desc')
+
+    page.update({'report_type': report_type, 'sort': sort, 'order': order})
+    return page
+
+
+def serialize_report(report_type: str, report) -> Dict[str, Any]:
+    """Convert a report row to JSON-safe values without loading relationships."""
+    listing = REPORT_LISTINGS[report_type]
+    data = {column.key: report.__dict__.get(column.key) for column in listing['model'].__table__.columns}
+    for name in listing['extra']:
+        data[name] = getattr(report, name)
+    for name, value in data.items():
+        if isinstance(value, datetime):
+            data[name] = value.isoformat()
+        elif isinstance(value, Decimal):
+            data[name] = float(value)
+    return data
+
@@ -0,0 +1,57 @@
+"""Uploaded data models."""
+from datetime import datetime, UTC
+from typing import Optional
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.extensions import db
+
+class ExportJob(db.Model):
+    """Background export of one report type for a store and date range."""
+    __tablename__ = 'export_jobs'
+
+    id: Mapped[int] = mapped_column(db.Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    store_id: Mapped[int] = mapped_column(db.Integer, db.ForeignKey('stores.id'), nullable=False)
+    report_type: Mapped[str] = mapped_column(db.String(20), nullable=False)
+    format: Mapped[str] = mapped_column(db.String(20), nullable=False)
+    start_date: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
+    end_date: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
+    status: Mapped[str] = mapped_column(db.String(20), nullable=False, default='pending')  # pending, running, completed, failed, expired
+    rows_total: Mapped[Optional[int]] = mapped_column(db.Integer, nullable=True)  # estimate taken when the job starts
+    rows_written: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+    file_path: Mapped[Optional[str]] = mapped_column(db.String(512), nullable=True)
+    file_size: Mapped[Optional[int]] = mapped_column(db.Integer, nullable=True)  # in bytes
+    error_message: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(db.DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    updated_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)  # last status change or progress save
+
+    __table_args__ = (
+        db.Index('idx_export_jobs_user_created', 'user_id', 'created_at'),
+        db.Index('idx_export_jobs_status', 'status'),
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f'<ExportJob {self.id} {self.report_type} ({self.status})>'
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            'id': self.id,
+            'store_id': self.store_id,
+            'report_type': self.report_type,
+            'format': self.format,
+            'start_date': self.start_date.date().isoformat() if self.start_date else None,
+            'end_date': self.end_date.date().isoformat() if self.end_date else None,
+            'status': self.status,
+            'rows_total': self.rows_total,
+            'rows_written': self.rows_written,
+            'file_size': self.file_size,
+            'error_message': self.error_message,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'created_at': self.created_at.isoformat()
+        }
@@ -1,13 +1,16 @@
 """Uploaded data routes."""
 
-from flask import render_template
+import os
+from datetime import datetime, time
+
+from flask import (
+    Response, jsonify, render_template, request, send_file, stream_template, stream_with_context, url_for
+)
 from flask_login import login_required, current_user
-from app.modules.business.models import BusinessReport
-from app.modules.inventory.models import InventoryReport
-from app.modules.advertising.models import AdvertisingReport
-from app.modules.returns.models import ReturnReport
 from app.utils.constants import get_category_by_asin
-from app import db
+from .export import EXPORT_FORMATS, negotiate_format, stream_export
+from .jobs import create_export_job, export_job_status, get_export_job
+from .listing import LISTING_DEFAULT_LIMIT, REPORT_LISTINGS, list_reports, serialize_report
 from . import bp
 
 @bp.route('/')
@@ -20,29 +23,172 @@ def index():
 @login_required
 def business_reports():
     """Display business reports."""
-    reports = BusinessReport.query.filter_by(store_id=current_user.active_store_id).order_by(BusinessReport.date.desc()).all()
-    return render_template('uploaded_data/business_report_data.html', reports=reports, get_category=get_category_by_asin)
+    return _render_listing('business', 'uploaded_data/business_report_data.html')
 
 @bp.route('/advertising-reports')
 @login_required
 def advertising_reports():
     """Display advertising reports."""
-    reports = AdvertisingReport.query.filter_by(store_id=current_user.active_store_id).order_by(AdvertisingReport.date.desc()).all()
-    return render_template('uploaded_data/advertising_report_data.html', reports=reports, get_category=get_category_by_asin)
+    return _render_listing('advertising', 'uploaded_data/advertising_report_data.html')
 
 @bp.route('/inventory-reports')
 @login_required
 def inventory_reports():
     """Display inventory reports."""
-    reports = InventoryReport.query.filter_by(store_id=current_user.active_store_id).order_by(InventoryReport.date.desc()).all()
-    return render_template('uploaded_data/inventory_report_data.html', reports=reports, get_category=get_category_by_asin)
+    return _render_listing('inventory', 'uploaded_data/inventory_report_data.html')
 
 @bp.route('/return-reports')
 @login_required
 def return_reports():
     """Display return reports."""
-    reports = ReturnReport.query\
-        .filter_by(store_id=current_user.active_store_id)\
-        .order_by(ReturnReport.return_date.desc())\
-        .all()
-    return render_template('uploaded_data/return_report_data.html', reports=reports, get_category=get_category_by_asin)
\ No newline at end of file
+    return _render_listing('returns', 'uploaded_data/return_report_data.html')
+
+@bp.route('/api/<report_type>')
+@login_required
+def report_rows(report_type):
+    """Get one page of report rows for a data grid.
+
+    Query parameters: sort, order, limit, start_date, end_date, cursor
+    (the previous page's ``next_cursor``), plus the report type's filter
+    columns.
+    """
+    try:
+        page = list_reports(report_type, current_user.active_store_id, **_listing_args(report_type))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    page['items'] = [serialize_report(report_type, report) for report in page['items']]
+    return jsonify(page)
+
+@bp.route('/export/<report_type>')
+@login_required
+def export_reports(report_type):
+    """Stream a report type's rows as CSV, gzip CSV, Parquet or Arrow IPC.
+
+    Query parameters: start_date and end_date (YYYY-MM-DD, optional) and
+    format ('csv', 'csv.gz', 'parquet' or 'arrow'). Without a format the
+    Accept header decides, falling back to CSV.
+    """
+    try:
+        fmt = negotiate_format(request.args.get('format'), request.accept_mimetypes)
+        start_date, end_date = _export_range(request.args)
+        chunks = stream_export(report_type, current_user.active_store_id, start_date, end_date, fmt)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    mimetype, extension = EXPORT_FORMATS[fmt]
+    filename = f"{report_type}_report_{current_user.active_store_id}.{extension}"
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+@bp.route('/exports', methods=['POST'])
+@login_required
+def create_export():
+    """Queue a background export for ranges too large to stream inline.
+
+    Takes report_type, format (default 'csv'), start_date and end_date as
+    JSON or form fields. Poll the returned status_url until the job is
+    completed, then fetch download_url.
+    """
+    params = request.get_json(silent=True) or request.form
+    try:
+        start_date, end_date = _export_range(params)
+        job = create_export_job(
+            current_user.id,
+            current_user.active_store_id,
+            params.get('report_type'),
+            params.get('format') or 'csv',
+            start_date,
+            end_date
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify(_job_response(job)), 202
+
+@bp.route('/exports/<int:job_id>')
+@login_required
+def export_status(job_id):
+    """Get an export job's status and progress."""
+    job = get_export_job(job_id, current_user.id)
+    if job is None:
+        return jsonify({'error': 'Export job not found'}), 404
+    return jsonify(_job_response(job))
+
+@bp.route('/exports/<int:job_id>/download')
+@login_required
+def download_export(job_id):
+    """Download a completed export job's file."""
+    job = get_export_job(job_id, current_user.id)
+    if job is None:
+        return jsonify({'error': 'Export job not found'}), 404
+    if job.status != 'completed':
+        return jsonify({'error': f"Export job is {job.status}"}), 409
+
+    return send_file(
+        job.file_path,
+        mimetype=EXPORT_FORMATS[job.format][0],
+        as_attachment=True,
+        download_name=os.path.basename(job.file_path)
+    )
+
+def _job_response(job):
+    """Export job status with its polling and download URLs."""
+    data = export_job_status(job)
+    data['status_url'] = url_for('uploaded_data.export_status', job_id=job.id)
+    data['download_url'] = url_for('uploaded_data.download_export', job_id=job.id) if job.status == 'completed' else None
+    return data
+
+def _export_range(params):
+    """Parse optional start_date/end_date (YYYY-MM-DD) into an inclusive datetime range."""
+    start_date = params.get('start_date')
+    end_date = params.get('end_date')
+    if start_date:
+        start_date = datetime.strptime(start_date, '%Y-%m-%d')
+    if end_date:
+        end_date = datetime.combine(datetime.strptime(end_date, '%Y-%m-%d'), time.max)
+    return start_date or None, end_date or None
+
+def _listing_args(report_type):
+    """Read listing options and the report type's filters from the query string."""
+    if report_type not in REPORT_LISTINGS:
+        raise ValueError(f"Invalid report type: {report_type}")
+
+    args = {
+        'sort': request.args.get('sort'),
+        'order': request.args.get('order', 'desc'),
+        'cursor': request.args.get('cursor'),
+        'limit': request.args.get('limit', LISTING_DEFAULT_LIMIT, type=int),
+        'start_date': request.args.get('start_date'),
+        'end_date': request.args.get('end_date')
+    }
+    for name in REPORT_LISTINGS[report_type]['filters']:
+        args[name] = request.args.get(name)
+    return args
+
+def _render_listing(report_type, template):
+    """Stream one page of a report listing into its template."""
+    try:
+        page = list_reports(report_type, current_user.active_store_id, **_listing_args(report_type))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Categories once per ASIN on the page instead of once per row
+    categories = {
+        report.asin: get_category_by_asin(report.asin)
+        for report in page['items'] if getattr(report, 'asin', None)
+    }
+
+    # Current filters without the cursor, for next/first page links
+    filters = {key: value for key, value in request.args.items() if key != 'cursor'}
+
+    return stream_template(
+        template,
+        reports=page['items'],
+        page=page,
+        filters=filters,
+        categories=categories
+    )
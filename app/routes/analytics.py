@@ -4,6 +4,8 @@ from flask_login import login_required, current_user
 from app.utils.analytics_engine import AnalyticsEngine, TimeGrouping
 from app.models import Store, BusinessReport
 from app.utils.constants import get_category_by_asin
+from app.core.cache import cached_response
+from app.core.calendar import day_match_sql, ensure_calendar
 from sqlalchemy import text
 from app import db
 import pandas as pd
@@ -50,8 +52,36 @@ def revenue_trends():
             error=str(e)
         )
 
+# Cached revenue trend responses live for at most 5 minutes
+REVENUE_TRENDS_CACHE_TTL = 300
+
+def _revenue_trends_cache_params(args):
+    """Normalize revenue trends query parameters for the response cache."""
+    store_id = args.get('store_id', type=int)
+    if not store_id:
+        return None
+
+    start_date = args.get('start_date')
+    end_date = args.get('end_date')
+    if not start_date or not end_date:
+        end_date = datetime.now().strftime('%Y-%m-%d')
+        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+
+    category = args.get('category')
+    asin = args.get('asin')
+
+    return {
+        'store_id': store_id,
+        'start_date': start_date,
+        'end_date': end_date,
+        'group_by': args.get('group_by', 'daily'),
+        'category': None if category in (None, '', 'All Categories') else category,
+        'asin': None if asin in (None, '', 'All ASINs') else asin
+    }
+
 @bp.route('/api/revenue/trends')
 @login_required
+@cached_response(_revenue_trends_cache_params, ttl=REVENUE_TRENDS_CACHE_TTL)
 def get_revenue_trends():
     """Revenue trends API endpoint."""
     try:
@@ -91,104 +121,42 @@ def get_revenue_trends():
             
             print(f"Parsed dates - start: {start_date}, end: {end_date}")
 
+            ensure_calendar(start_datetime.date(), end_datetime.date())
         except ValueError as e:
             return jsonify({'error': f'Invalid date format: {str(e)}'}), 400
 
-        # Base query for revenue trends based on group_by
-        if group_by == 'daily':
-            date_format = "DATE(date)"
-            base_select = f"""
-                WITH RECURSIVE dates(date) AS (
-                    SELECT date(?)
-                    UNION ALL
-                    SELECT date(date, '+1 day')
-                    FROM dates
-                    WHERE date < date(?)
-                )
-                SELECT 
-                    dates.date as date_group,
-                    COALESCE(SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)), 0) as revenue,
-                    COALESCE(SUM(units_ordered), 0) as units,
-                    COALESCE(SUM(sessions), 0) as sessions,
-                    CASE 
-                        WHEN COALESCE(SUM(sessions), 0) = 0 THEN 0 
-                        ELSE CAST(COALESCE(SUM(units_ordered), 0) AS FLOAT) / COALESCE(SUM(sessions), 0) * 100 
-                    END as conversion_rate
-                FROM dates
-                LEFT JOIN business_report ON 
-                    DATE(business_report.date) = dates.date
-                    AND business_report.store_id = ?
-            """
-        elif group_by == 'weekly':
-            date_format = "strftime('%Y-W%W', date)"
-            base_select = f"""
-                SELECT 
-                    {date_format} as date_group,
-                    SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue,
-                    SUM(units_ordered) as units,
-                    SUM(sessions) as sessions,
-                    CASE 
-                        WHEN SUM(sessions) = 0 THEN 0 
-                        ELSE CAST(SUM(units_ordered) AS FLOAT) / SUM(sessions) * 100 
-                    END as conversion_rate
-                FROM business_report
-                WHERE date BETWEEN ? AND ?
-                AND store_id = ?
-            """
-        elif group_by == 'monthly':
-            date_format = "strftime('%Y-%m', date)"
-            base_select = f"""
-                SELECT 
-                    {date_format} as date_group,
-                    SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue,
-                    SUM(units_ordered) as units,
-                    SUM(sessions) as sessions,
-                    CASE 
-                        WHEN SUM(sessions) = 0 THEN 0 
-                        ELSE CAST(SUM(units_ordered) AS FLOAT) / SUM(sessions) * 100 
-                    END as conversion_rate
-                FROM business_report
-                WHERE date BETWEEN ? AND ?
-                AND store_id = ?
-            """
-        elif group_by == 'quarterly':
-            date_format = "strftime('%Y', date) || '-Q' || ((CAST(strftime('%m', date) AS INTEGER) + 2) / 3)"
-            base_select = f"""
-                SELECT 
-                    {date_format} as date_group,
-                    SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue,
-                    SUM(units_ordered) as units,
-                    SUM(sessions) as sessions,
-                    CASE 
-                        WHEN SUM(sessions) = 0 THEN 0 
-                        ELSE CAST(SUM(units_ordered) AS FLOAT) / SUM(sessions) * 100 
-                    END as conversion_rate
-                FROM business_report
-                WHERE date BETWEEN ? AND ?
-                AND store_id = ?
-            """
-        else:  # yearly
-            date_format = "strftime('%Y', date)"
-            base_select = f"""
-                SELECT 
-                    {date_format} as date_group,
-                    SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue,
-                    SUM(units_ordered) as units,
-                    SUM(sessions) as sessions,
-                    CASE 
-                        WHEN SUM(sessions) = 0 THEN 0 
-                        ELSE CAST(SUM(units_ordered) AS FLOAT) / SUM(sessions) * 100 
-                    END as conversion_rate
-                FROM business_report
-                WHERE date BETWEEN ? AND ?
-                AND store_id = ?
-            """
+        # Calendar column used as the group label; the calendar table
+        # provides one row per day so empty periods are returned as zeros
+        group_columns = {
+            'daily': 'date',
+            'weekly': 'week_label',
+            'monthly': 'month_label',
+            'quarterly': 'quarter_label',
+            'yearly': 'year_label'
+        }
+        group_column = group_columns.get(group_by, 'year_label')
+        day_match = day_match_sql('business_report.date', 'dates.date')
+        base_select = f"""
+            SELECT 
+                dates.{group_column} as date_group,
+                COALESCE(SUM(ordered_product_sales), 0) as revenue,
+                COALESCE(SUM(units_ordered), 0) as units,
+                COALESCE(SUM(sessions), 0) as sessions,
+                CASE 
+                    WHEN COALESCE(SUM(sessions), 0) = 0 THEN 0 
+                    ELSE CAST(COALESCE(SUM(units_ordered), 0) AS FLOAT) / COALESCE(SUM(sessions), 0) * 100 
+                END as conversion_rate
+            FROM (
+                SELECT date, {group_column}
+                FROM calendar_dates
+                WHERE date BETWEEN date(?) AND date(?)
+            ) AS dates
+            LEFT JOIN business_report ON 
+                {day_match}
+                AND business_report.store_id = ?
+        """
 
-        # Set base parameters based on group_by
-        if group_by == 'daily':
-            params = [start_date, end_date, store_id]
-        else:
-            params = [start_date, end_date, store_id]
+        params = [start_date, end_date, store_id]
 
         # Add category and ASIN filters
         if category and category != "All Categories":
@@ -307,7 +275,7 @@ def get_revenue_trends():
         # Query for previous period
         if category:
             prev_query = """
-                SELECT SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue
+                SELECT SUM(ordered_product_sales) as revenue
                 FROM business_report 
                 WHERE store_id = ?
                 AND date BETWEEN ? AND ?
@@ -318,7 +286,7 @@ def get_revenue_trends():
                          previous_end.strftime('%Y-%m-%d 23:59:59')] + category_asins
         else:
             prev_query = """
-                SELECT SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue
+                SELECT SUM(ordered_product_sales) as revenue
                 FROM business_report 
                 WHERE store_id = ?
                 AND date BETWEEN ? AND ?
@@ -416,16 +384,17 @@ def advertisement_report():
     try:
         # Get unique campaigns and ad groups for filters
         campaigns_query = text("""
-            SELECT DISTINCT campaign_name 
-            FROM advertising_report 
+            SELECT name 
+            FROM ad_campaigns 
             WHERE store_id = :store_id
-            ORDER BY campaign_name
+            ORDER BY name
         """)
         ad_groups_query = text("""
-            SELECT DISTINCT ad_group_name 
-            FROM advertising_report 
-            WHERE store_id = :store_id
-            ORDER BY ad_group_name
+            SELECT DISTINCT ad_groups.name 
+            FROM ad_groups 
+            JOIN ad_campaigns ON ad_campaigns.id = ad_groups.campaign_id
+            WHERE ad_campaigns.store_id = :store_id
+            ORDER BY ad_groups.name
         """)
         
         campaigns = db.session.execute(campaigns_query, {'store_id': 1}).scalars().all()
@@ -488,6 +457,7 @@ def get_advertisement_analytics():
             if DEBUG:
                 print(f"Parsed dates - start: {start_date}, end: {end_date}")
 
+            ensure_calendar(start_datetime.date(), end_datetime.date())
         except ValueError as e:
             return jsonify({'error': f'Invalid date format: {str(e)}'}), 400
 
@@ -501,17 +471,18 @@ def get_advertisement_analytics():
                 print("Cache hit! Returning cached data.")
             return jsonify(json.loads(cached_data))
 
-        # Base query for advertisement metrics (Tarih tablosu kullanılıyor)
-        base_query = """
+        # Base query for advertisement metrics (Takvim tablosu kullanılıyor)
+        day_match = day_match_sql('advertising_report.date', 'date_range.date')
+        base_query = f"""
             WITH date_range AS (
                 SELECT date
-                FROM date_table
-                WHERE date BETWEEN ? AND ?
+                FROM calendar_dates
+                WHERE date BETWEEN date(?) AND date(?)
             )
             SELECT 
                 date_range.date as date,
-                COALESCE(SUM(CAST(REPLACE(REPLACE(spend, '$', ''), ',', '') AS FLOAT)), 0) as spend,
-                COALESCE(SUM(CAST(REPLACE(REPLACE(total_sales, '$', ''), ',', '') AS FLOAT)), 0) as sales,
+                COALESCE(SUM(spend), 0) as spend,
+                COALESCE(SUM(total_sales), 0) as sales,
                 COALESCE(SUM(clicks), 0) as clicks,
                 COALESCE(SUM(impressions), 0) as impressions,
                 COALESCE(SUM(total_orders), 0) as orders,
@@ -522,20 +493,20 @@ def get_advertisement_analytics():
                 END as ctr,
                 CASE 
                     WHEN COALESCE(SUM(clicks), 0) = 0 THEN 0 
-                    ELSE CAST(COALESCE(SUM(CAST(REPLACE(REPLACE(spend, '$', ''), ',', '') AS FLOAT)), 0) AS FLOAT) / COALESCE(SUM(clicks), 0)
+                    ELSE CAST(COALESCE(SUM(spend), 0) AS FLOAT) / COALESCE(SUM(clicks), 0)
                 END as cpc,
                 CASE 
                     WHEN COALESCE(SUM(clicks), 0) = 0 THEN 0 
                     ELSE CAST(COALESCE(SUM(total_orders), 0) AS FLOAT) / COALESCE(SUM(clicks), 0) * 100 
                 END as conversion_rate,
                 CASE 
-                    WHEN COALESCE(SUM(CAST(REPLACE(REPLACE(total_sales, '$', ''), ',', '') AS FLOAT)), 0) = 0 THEN 0 
-                    ELSE CAST(COALESCE(SUM(CAST(REPLACE(REPLACE(spend, '$', ''), ',', '') AS FLOAT)), 0) AS FLOAT) / 
-                         COALESCE(SUM(CAST(REPLACE(REPLACE(total_sales, '$', ''), ',', '') AS FLOAT)), 0) * 100 
+                    WHEN COALESCE(SUM(total_sales), 0) = 0 THEN 0 
+                    ELSE CAST(COALESCE(SUM(spend), 0) AS FLOAT) / 
+                         COALESCE(SUM(total_sales), 0) * 100 
                 END as acos
             FROM date_range
             LEFT JOIN advertising_report ON 
-                DATE(advertising_report.date) = date_range.date
+                {day_match}
                 AND advertising_report.store_id = ?
         """
 
@@ -543,12 +514,16 @@ def get_advertisement_analytics():
 
         # Add filters
         if campaign:
-            base_query += " AND campaign_name = ?"
-            params.append(campaign)
+            base_query += """ AND campaign_id IN (
+                SELECT id FROM ad_campaigns WHERE store_id = ? AND name = ?)"""
+            params.extend([store_id, campaign])
         
         if ad_group:
-            base_query += " AND ad_group_name = ?"
-            params.append(ad_group)
+            base_query += """ AND ad_group_id IN (
+                SELECT ad_groups.id FROM ad_groups
+                JOIN ad_campaigns ON ad_campaigns.id = ad_groups.campaign_id
+                WHERE ad_campaigns.store_id = ? AND ad_groups.name = ?)"""
+            params.extend([store_id, ad_group])
         
         if targeting_type:
             base_query += " AND targeting_type = ?"
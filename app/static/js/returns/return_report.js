@@ -45,6 +45,11 @@ function initializeEventListeners() {
     document.getElementById('returnReason').addEventListener('change', function() {
         loadReturnData();
     });
+
+    // Next page of return items
+    document.getElementById('loadMoreReturns').addEventListener('click', function() {
+        loadReturnItems(nextReturnItems);
+    });
 }
 
 // Load return data from the server
@@ -55,12 +60,32 @@ function loadReturnData() {
         .then(response => response.json())
         .then(data => {
             updateCharts(data);
-            updateMetrics(data);
-            updateTable(data);
+            updateMetrics(data.summary);
         })
         .catch(error => {
             showToast('Error loading data: ' + error.message, 'error');
         });
+
+    loadReturnItems(null);
+}
+
+// Cursor of the next return items page, null when there are no more
+let nextReturnItems = null;
+
+// Load a page of return items; a null cursor starts a new table
+function loadReturnItems(cursor) {
+    const params = Object.assign(getFilters(), cursor ? { cursor: cursor } : {});
+
+    fetch('/returns/items?' + new URLSearchParams(params))
+        .then(response => response.json())
+        .then(page => {
+            updateTable(page.items, cursor === null);
+            nextReturnItems = page.next_cursor;
+            document.getElementById('loadMoreReturns').classList.toggle('hidden', !page.has_more);
+        })
+        .catch(error => {
+            showToast('Error loading returns: ' + error.message, 'error');
+        });
 }
 
 // Get current filter values
@@ -164,11 +189,13 @@ function updateMetrics(data) {
 }
 
 // Update table with new data
-function updateTable(data) {
+function updateTable(items, replace) {
     const tbody = document.getElementById('returnTableBody');
-    tbody.innerHTML = '';
+    if (replace) {
+        tbody.innerHTML = '';
+    }
     
-    data.return_items.forEach(item => {
+    items.forEach(item => {
         const row = document.createElement('tr');
         row.innerHTML = `
             <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900 dark:text-gray-200">${formatDate(item.return_date)}</td>
@@ -1,9 +1,8 @@
 """Utility modules."""
 
-from .analytics_engine import AnalyticsEngine
 from .constants import *
 from .data_validator import DataValidator
-from .pagination import paginate_query
+from .pagination import paginate_query, keyset_paginate, count_query
 from .validation import validate_request_data
 from .decorators import store_required, admin_required
 
@@ -11,7 +10,17 @@ __all__ = [
     'AnalyticsEngine',
     'DataValidator',
     'paginate_query',
+    'keyset_paginate',
+    'count_query',
     'validate_request_data',
     'store_required',
     'admin_required'
 ]
+
+
+def __getattr__(name):
+    """Import AnalyticsEngine on first use so importing app.utils skips pandas."""
+    if name == 'AnalyticsEngine':
+        from .analytics_engine import AnalyticsEngine
+        return AnalyticsEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
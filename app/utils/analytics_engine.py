@@ -32,7 +32,9 @@ class AnalyticsEngine:
         self.validator = DataValidator()
         # Lazy import to avoid circular dependency
         from app.modules.business.models import BusinessReport
+        from app.core.calendar import SPECIAL_PERIODS
         self.BusinessReport = BusinessReport
+        self.SPECIAL_PERIODS = SPECIAL_PERIODS
 
     def get_revenue_trends(
         self,
@@ -92,7 +94,7 @@ class AnalyticsEngine:
                 query = """
                     SELECT 
                         DATE(created_at) as date,
-                        SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue,
+                        SUM(ordered_product_sales) as revenue,
                         SUM(units_ordered) as units,
                         SUM(sessions) as sessions,
                         CAST(SUM(units_ordered) AS FLOAT) / NULLIF(SUM(sessions), 0) * 100 as conversion_rate
@@ -112,7 +114,7 @@ class AnalyticsEngine:
                 query = """
                     SELECT 
                         DATE(created_at) as date,
-                        SUM(CAST(REPLACE(REPLACE(ordered_product_sales, '$', ''), ',', '') AS FLOAT)) as revenue,
+                        SUM(ordered_product_sales) as revenue,
                         SUM(units_ordered) as units,
                         SUM(sessions) as sessions,
                         CAST(SUM(units_ordered) AS FLOAT) / NULLIF(SUM(sessions), 0) * 100 as conversion_rate
@@ -238,14 +240,15 @@ class AnalyticsEngine:
             prev_start_str = prev_start.strftime('%Y-%m-%d')
             prev_end_str = prev_end.strftime('%Y-%m-%d')
 
-            # Using raw SQL string instead of SQLAlchemy text
+            # Sum in SQL; ordered_product_sales is stored as a plain number
             sql = """
-                SELECT ordered_product_sales, asin
+                SELECT asin, SUM(ordered_product_sales) as revenue
                 FROM business_report
                 WHERE store_id = ?
                 AND created_at >= ?
                 AND created_at < ?
                 AND (? IS NULL OR asin = ?)
+                GROUP BY asin
             """
             
             # Get SQLite connection directly
@@ -263,7 +266,7 @@ class AnalyticsEngine:
                 df['category'] = df['asin'].apply(lambda x: get_category_by_asin(x)[0])
                 df = df[df['category'] == category]
 
-            result = df['ordered_product_sales'].sum()
+            result = df['revenue'].sum()
             
             # Close connection
             conn.close()
@@ -556,7 +559,7 @@ class AnalyticsEngine:
                 special_period_analysis[period_key] = self._analyze_special_period(
                     store_id,
                     base_year,
-                    period_info,
+                    {'key': period_key, **period_info},
                     comparison_years
                 )
 
@@ -580,64 +583,34 @@ class AnalyticsEngine:
         period_info: Dict,
         comparison_years: List[int]
     ) -> Dict:
-        """Analyze sales during a special period (holiday/event)."""
+        """Analyze sales during a special period (holiday/event).
+
+        Period windows come from the calendar table, so moving periods such
+        as Prime Day or Cyber Week line up with the actual dates each year.
+        """
+        from app.core.calendar import get_special_period_range
+
         all_years = [year] + comparison_years
         results = {}
 
         for analysis_year in all_years:
-            start_date = datetime(
-                analysis_year,
-                period_info['month'],
-                period_info['day_start']
-            )
-            end_date = datetime(
-                analysis_year,
-                period_info['month'],
-                period_info['day_end']
-            )
+            period_range = get_special_period_range(period_info['key'], analysis_year)
+            if period_range is None:
+                continue
+            start_date, end_date = period_range
 
             # Get period data
-            period_data = (
-                db.session.query(
-                    func.sum(self.BusinessReport.units_sold).label('total_units'),
-                    func.sum(self.BusinessReport.revenue).label('total_revenue'),
-                    func.avg(self.BusinessReport.conversion_rate).label('avg_conversion')
-                )
-                .filter(
-                    self.BusinessReport.store_id == store_id,
-                    self.BusinessReport.created_at.between(start_date, end_date)
-                )
-                .first()
-            )
+            period_data = self._get_period_totals(store_id, start_date, end_date)
 
             # Get comparison period (same period from previous year)
-            comparison_year = analysis_year - 1
-            comparison_start = datetime(
-                comparison_year,
-                period_info['month'],
-                period_info['day_start']
-            )
-            comparison_end = datetime(
-                comparison_year,
-                period_info['month'],
-                period_info['day_end']
-            )
-
-            comparison_data = (
-                db.session.query(
-                    func.sum(self.BusinessReport.units_sold).label('total_units'),
-                    func.sum(self.BusinessReport.revenue).label('total_revenue')
-                )
-                .filter(
-                    self.BusinessReport.store_id == store_id,
-                    self.BusinessReport.created_at.between(comparison_start, comparison_end)
-                )
-                .first()
-            )
+            comparison_range = get_special_period_range(period_info['key'], analysis_year - 1)
+            comparison_revenue = 0
+            if comparison_range is not None:
+                comparison_data = self._get_period_totals(store_id, *comparison_range)
+                comparison_revenue = float(comparison_data.total_revenue) if comparison_data.total_revenue else 0
 
             # Calculate growth rates
             period_revenue = float(period_data.total_revenue) if period_data.total_revenue else 0
-            comparison_revenue = float(comparison_data.total_revenue) if comparison_data.total_revenue else 0
             
             revenue_growth = (
                 ((period_revenue - comparison_revenue) / comparison_revenue * 100)
@@ -656,6 +629,22 @@ class AnalyticsEngine:
 
         return results
 
+    def _get_period_totals(self, store_id: int, start_date, end_date):
+        """Sum units and revenue for the days in [start_date, end_date]."""
+        return (
+            db.session.query(
+                func.sum(self.BusinessReport.units_ordered).label('total_units'),
+                func.sum(self.BusinessReport.ordered_product_sales).label('total_revenue'),
+                func.avg(self.BusinessReport.conversion_rate).label('avg_conversion')
+            )
+            .filter(
+                self.BusinessReport.store_id == store_id,
+                self.BusinessReport.date >= start_date,
+                self.BusinessReport.date < end_date + timedelta(days=1)
+            )
+            .first()
+        )
+
     def _calculate_growth_patterns(
         self,
         current_data: List[Dict],
@@ -1,6 +1,4 @@
 """Amazon kategori sabitleri."""
-import json
-import os
 
 AMAZON_CATEGORIES = {
     'FASHION': {
@@ -75,39 +73,6 @@ AMAZON_CATEGORIES = {
     }
 }
 
-def load_asin_categories():
-    """ASIN-kategori eşleştirmelerini JSON dosyasından yükler."""
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'asin_categories.json')
-    try:
-        with open(json_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
-
-# ASIN kategorilerini yükle
-ASIN_CATEGORIES = load_asin_categories()
-
-def get_category_by_asin(asin: str) -> tuple[str, str]:
-    """
-    ASIN'e göre kategori ve alt kategori kodunu döndürür.
-    
-    Args:
-        asin (str): Amazon ASIN kodu
-        
-    Returns:
-        tuple[str, str]: (ana_kategori_kodu, alt_kategori_kodu)
-    """
-    # ASIN kategorilerden bul
-    asin_data = ASIN_CATEGORIES.get(asin, None)
-    
-    if asin_data:
-        main_cat = asin_data['main_category']
-        sub_cat = asin_data['sub_category']
-        return (main_cat, sub_cat)
-    
-    # ASIN bulunamazsa None döndür
-    return None 
-
 # Error messages
 ERROR_MESSAGES = {
     'INVALID_DATE': 'Invalid date format. Expected format: YYYY-MM-DD',
@@ -19,7 +19,8 @@ def store_required(f):
     def decorated_function(*args, **kwargs):
         if not current_user.is_authenticated:
             return jsonify({"error": "Authentication required"}), 401
-        if not current_user.active_store:
+        store_id = current_user.active_store_id
+        if not store_id or not current_user.has_store_access(store_id):
             return jsonify({"error": "Active store required"}), 403
         return f(*args, **kwargs)
     return decorated_function
@@ -0,0 +1,209 @@
+"""Index audit utilities.
+
+Runs ``EXPLAIN`` on the hot report queries and reports whether they are
+served by the expected index or fall back to a full table scan. The test
+suite uses these helpers to catch index regressions.
+
+Queries issued through the ORM are audited as executed: the audit runs the
+application code, captures the statement it sends to the database and
+explains that statement with the same parameters.
+"""
+
+import re
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import event, text
+
+from app.extensions import db
+
+
+def _business_period_rows(params: Dict[str, Any]) -> None:
+    """Report rows of a period, as loaded by the business trends service."""
+    from app.modules.business.services import BusinessReportService
+
+    BusinessReportService(params['store_id']).period_query(
+        date.fromisoformat(params['start_date']),
+        date.fromisoformat(params['end_date'])
+    ).all()
+
+
+def _business_upsert_lookup(params: Dict[str, Any]) -> None:
+    """Existing-row lookup of the business report upsert."""
+    from app.modules.upload_csv.processors.business import existing_report_query
+
+    existing_report_query({**params, 'date': date.fromisoformat(params['date'])}).first()
+
+
+# Hot queries against business_reports and the index each one should use.
+# Entries with ``sql`` mirror raw SQL aggregates; entries with ``run`` call
+# the application code and audit the statement it executes.
+HOT_QUERIES = {
+    'business_daily_totals': {
+        'sql': """
+            SELECT date,
+                   SUM(ordered_product_sales) as revenue,
+                   SUM(units_ordered) as units,
+                   SUM(sessions) as sessions
+            FROM business_reports
+            WHERE store_id = :store_id
+              AND date BETWEEN :start_date AND :end_date
+            GROUP BY date
+        """,
+        'index': 'idx_business_store_date_metrics',
+    },
+    'business_asin_revenue': {
+        'sql': """
+            SELECT asin, SUM(ordered_product_sales) as revenue
+            FROM business_reports
+            WHERE store_id = :store_id
+              AND date BETWEEN :start_date AND :end_date
+            GROUP BY asin
+        """,
+        'index': 'idx_business_store_date_metrics',
+    },
+    'business_period_rows': {
+        # Loads whole rows, so either store/date index serves it
+        'run': _business_period_rows,
+        'index': ('idx_business_store_date_metrics', 'uq_business_store_date_sku_asin'),
+    },
+    'business_upsert_lookup': {
+        'run': _business_upsert_lookup,
+        'index': 'uq_business_store_date_sku_asin',
+    },
+}
+
+# Plan lines that indicate a full table scan
+_SQLITE_FULL_SCAN = re.compile(r'^SCAN (TABLE )?\w+$')
+_POSTGRES_FULL_SCAN = re.compile(r'Seq Scan on')
+
+
+def explain(sql: str, params: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Return the query plan for a SQL statement.
+
+    Args:
+        sql: SQL statement to explain
+        params: Bound parameters for the statement
+
+    Returns:
+        List[str]: One entry per plan line
+    """
+    dialect = db.engine.dialect.name
+    rows = db.session.execute(text(explain_statement(dialect, sql)), params or {}).fetchall()
+    return plan_lines(dialect, rows)
+
+
+def capture_statements(run: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    """Statements and parameters ``run`` sends to the database."""
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', _capture)
+    try:
+        run()
+    finally:
+        event.remove(engine, 'before_cursor_execute', _capture)
+    return statements
+
+
+def explain_executed(statement: str, parameters: Any) -> List[str]:
+    """Return the query plan for a statement as the DBAPI received it."""
+    dialect = db.engine.dialect.name
+    rows = db.session.connection().exec_driver_sql(
+        explain_statement(dialect, statement), parameters
+    ).fetchall()
+    return plan_lines(dialect, rows)
+
+
+def explain_statement(dialect: str, sql: str) -> str:
+    """Prefix a SQL statement with the dialect's EXPLAIN command."""
+    if dialect == 'sqlite':
+        return f'EXPLAIN QUERY PLAN {sql}'
+    return f'EXPLAIN {sql}'
+
+
+def plan_lines(dialect: str, rows: List[Any]) -> List[str]:
+    """Plan lines of the rows an EXPLAIN statement returned."""
+    if dialect == 'sqlite':
+        # Columns are (id, parent, notused, detail)
+        return [row[-1] for row in rows]
+    return [str(row[0]) for row in rows]
+
+
+def audit_query(sql: str, index: Optional[str] = None,
+                params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Audit a single query plan.
+
+    Args:
+        sql: SQL statement to audit
+        index: Index name the plan is expected to use
+        params: Bound parameters for the statement
+
+    Returns:
+        Dict with the plan, full scan lines and whether the index is used
+    """
+    return _audit_plan(explain(sql, params), index)
+
+
+def audit_code(run: Callable[[], Any], index: Union[str, Tuple[str, ...], None] = None) -> Dict[str, Any]:
+    """Audit the plan of the first statement application code executes.
+
+    Args:
+        run: Callable that issues the query
+        index: Index name, or alternative names, the plan is expected to use
+
+    Returns:
+        Dict with the statement, plan, full scan lines and whether the index is used
+    """
+    statements = capture_statements(run)
+    if not statements:
+        raise ValueError('The audited code executed no statement')
+    statement, parameters = statements[0]
+    result = _audit_plan(explain_executed(statement, parameters), index)
+    result['sql'] = statement
+    return result
+
+
+def _audit_plan(plan: List[str], index: Union[str, Tuple[str, ...], None]) -> Dict[str, Any]:
+    """Full scans and index use of a query plan; ``index`` may list alternatives."""
+    full_scans = [
+        line for line in plan
+        if _SQLITE_FULL_SCAN.match(line.strip()) or _POSTGRES_FULL_SCAN.search(line)
+    ]
+    indexes = (index,) if isinstance(index, str) else index
+    uses_index = indexes is None or any(name in line for name in indexes for line in plan)
+
+    return {
+        'plan': plan,
+        'index': index,
+        'uses_index': uses_index,
+        'full_scans': full_scans,
+        'ok': uses_index and not full_scans,
+    }
+
+
+def audit_hot_queries(params: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """Audit every query in ``HOT_QUERIES``.
+
+    Args:
+        params: Bound parameters; defaults cover all hot queries
+
+    Returns:
+        Dict mapping query name to its audit result
+    """
+    params = params or {
+        'store_id': 1,
+        'start_date': '2024-01-01',
+        'end_date': '2024-12-31',
+        'date': '2024-01-01',
+        'sku': 'SKU',
+        'asin': 'ASIN',
+    }
+    return {
+        name: audit_code(lambda run=query['run']: run(params), query['index'])
+        if 'run' in query else audit_query(query['sql'], query['index'], params)
+        for name, query in HOT_QUERIES.items()
+    }
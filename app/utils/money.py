@@ -0,0 +1,105 @@
+"""Money parsing utilities.
+
+Amazon exports format currency columns as strings such as ``"$1,234.50"``.
+These helpers normalize them to ``Decimal`` once, at ingest time, so the
+database only ever stores plain numeric values and analytics queries can
+aggregate with a simple ``SUM``.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Any, Iterable, Optional
+
+import pandas as pd
+
+# Characters stripped from money strings before conversion
+CURRENCY_SYMBOLS = ('$', '€', '£', '¥', '₺', ',', ' ')
+
+MONEY_QUANTUM = Decimal('0.01')
+
+# Monetary columns per report table
+MONEY_COLUMNS = {
+    'business_reports': ['ordered_product_sales'],
+    'advertising_reports': ['cpc', 'spend', 'total_sales'],
+    'inventory_reports': ['price'],
+    'return_reports': ['refund_amount'],
+}
+
+
+def parse_money(value: Any, default: Optional[Decimal] = Decimal('0.00')) -> Optional[Decimal]:
+    """Convert a money value to a two-decimal ``Decimal``.
+
+    Args:
+        value: Raw value (str, int, float, Decimal or None)
+        default: Value returned for empty input
+
+    Returns:
+        Optional[Decimal]: Parsed amount rounded to cents
+
+    Raises:
+        ValueError: If the value cannot be interpreted as money
+    """
+    if value is None:
+        return default
+    if isinstance(value, float) and pd.isna(value):
+        return default
+
+    if isinstance(value, Decimal):
+        amount = value
+    elif isinstance(value, (int, float)):
+        amount = Decimal(str(value))
+    else:
+        text = str(value).strip()
+        negative = text.startswith('(') and text.endswith(')')
+        if negative:
+            text = text[1:-1]
+        for symbol in CURRENCY_SYMBOLS:
+            text = text.replace(symbol, '')
+        if not text:
+            return default
+        try:
+            amount = Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"Invalid money value: {value!r}")
+        if negative:
+            amount = -amount
+
+    return amount.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def to_cents(value: Any) -> int:
+    """Convert a money value to integer cents."""
+    return int(parse_money(value) * 100)
+
+
+def normalize_money_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Normalize money columns of a DataFrame in place.
+
+    String values like ``"$1,234.50"`` are converted to floats so that the
+    processors' type checks and the ``Numeric`` columns receive clean values.
+    Columns that are already numeric are left untouched.
+
+    Args:
+        df: DataFrame to normalize
+        columns: Money column names; missing columns are ignored
+
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining
+    """
+    for column in columns:
+        if column not in df.columns or pd.api.types.is_numeric_dtype(df[column]):
+            continue
+        df[column] = df[column].map(_money_to_float)
+    return df
+
+
+def _money_to_float(value: Any) -> Any:
+    """Parse a single cell for ``normalize_money_columns``.
+
+    Unparseable values are returned unchanged so the processor's own type
+    validation reports them with its usual error message.
+    """
+    try:
+        amount = parse_money(value, default=None)
+    except ValueError:
+        return value
+    return float(amount) if amount is not None else None
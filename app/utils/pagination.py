@@ -1,38 +1,249 @@
-"""Pagination utilities."""
+"""Pagination utilities.
 
-from typing import Dict, Any
+Two modes are supported. ``keyset_paginate`` seeks past the last row seen
+and hands out an opaque cursor for the next page, so a page costs the same
+at any depth. ``paginate_query`` keeps page numbers for ranked results that
+cannot be seeked. Both fetch ``limit + 1`` rows to report ``has_more``
+without counting, and only count the full result when asked to, either
+exactly, from a cache keyed by the query and the store's data version, or
+from the planner's row estimate.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Query
 
-def paginate_query(query: Query, page: int = 1, per_page: int = 50) -> Dict[str, Any]:
-    """Paginate a SQLAlchemy query.
-    
+from app.core.cache import cache, get_data_version
+
+# Seconds a cached total count is reused for
+COUNT_CACHE_TTL = 300
+
+COUNT_MODES = ('exact', 'cached', 'estimate')
+
+def paginate_query(
+    query: Query,
+    page: int = 1,
+    per_page: int = 50,
+    count: Optional[str] = 'exact',
+    store_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Paginate a SQLAlchemy query by page number.
+
     Args:
         query: SQLAlchemy query to paginate
         page: Page number (default: 1)
         per_page: Items per page (default: 50)
-        
+        count: Total count mode, see count_query; None skips the count
+        store_id: Store whose data version keys a cached count
+
     Returns:
-        Dict with pagination info and items
+        Dict with pagination info and items; ``total`` and ``pages`` are
+        None when no count was requested
     """
-    page = int(page)
+    page = max(1, int(page))
     per_page = int(per_page)
-    
-    # Calculate offset and limit
-    offset = (page - 1) * per_page
-    
-    # Get total count
-    total = query.count()
-    
-    # Get paginated items
-    items = query.offset(offset).limit(per_page).all()
-    
-    # Calculate total pages
-    pages = (total + per_page - 1) // per_page
-    
+
+    # One extra row tells whether another page exists
+    rows = query.offset((page - 1) * per_page).limit(per_page + 1).all()
+
+    total = count_query(query, count, store_id=store_id)
+
     return {
-        'items': items,
+        'items': rows[:per_page],
         'page': page,
         'per_page': per_page,
+        'has_more': len(rows) > per_page,
         'total': total,
-        'pages': pages
+        'pages': (total + per_page - 1) // per_page if total is not None else None
     }
+
+def keyset_paginate(
+    query: Query,
+    columns: Sequence,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    descending: bool = False,
+    count: Optional[str] = None,
+    store_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Paginate a SQLAlchemy query by seeking past the last row seen.
+
+    Rows are ordered by ``columns``, which must be NOT NULL and end with a
+    unique column (usually the primary key); a NULL key would never compare
+    greater or less than the cursor and end the listing early. Each page starts with a ``WHERE (columns) >
+    (cursor values)`` seek on the index instead of an OFFSET scan, so deep
+    pages cost the same as the first one.
+
+    Args:
+        query: SQLAlchemy query to paginate
+        columns: Sort key columns, the last one unique
+        cursor: ``next_cursor`` of the previous page
+        limit: Items per page (default: 50)
+        descending: Sort newest first
+        count: Total count mode, see count_query; None skips the count
+        store_id: Store whose data version keys a cached count
+
+    Returns:
+        Dict with items, whether more rows exist, the cursor of the next
+        page (None on the last page) and the total if one was requested
+
+    Raises:
+        ValueError: If a sort column is nullable, or the cursor is malformed
+            or from another sort order
+    """
+    nullable = [column.key for column in columns if getattr(column.expression, 'nullable', False)]
+    if nullable:
+        raise ValueError(f"Keyset columns must be NOT NULL: {', '.join(nullable)}")
+
+    limit = int(limit)
+    key = tuple_(*columns)
+    scope = _cursor_scope(columns, descending)
+
+    total = count_query(query, count, store_id=store_id)
+
+    if cursor:
+        after = decode_cursor(cursor, scope=scope)
+        if len(after) != len(columns):
+            raise ValueError("Invalid cursor")
+        query = query.filter(key < tuple(after) if descending else key > tuple(after))
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    last = items[-1] if items and has_more else None
+
+    return {
+        'items': items,
+        'limit': limit,
+        'has_more': has_more,
+        'next_cursor': encode_cursor(
+            [getattr(last, column.key) for column in columns], scope=scope
+        ) if last is not None else None,
+        'total': total
+    }
+
+def count_query(query: Query, mode: Optional[str] = 'exact', store_id: Optional[int] = None,
+                ttl: int = COUNT_CACHE_TTL) -> Optional[int]:
+    """Count the rows of a query without re-scanning it on every page.
+
+    Args:
+        query: SQLAlchemy query to count
+        mode: 'exact' runs COUNT(*); 'cached' reuses a count of the same
+            query until the store's data changes or ``ttl`` expires;
+            'estimate' takes the planner's row estimate on PostgreSQL and
+            falls back to 'cached' elsewhere; None skips the count
+        store_id: Store whose data version keys a cached count
+        ttl: Seconds a cached count is reused for
+
+    Returns:
+        Row count, or None when mode is None
+
+    Raises:
+        ValueError: If the mode is not supported
+    """
+    if mode is None:
+        return None
+    if mode not in COUNT_MODES:
+        raise ValueError(f"Invalid count mode: {mode}. Valid values: {', '.join(COUNT_MODES)}")
+
+    query = query.order_by(None)
+    if mode == 'exact':
+        return query.count()
+
+    if mode == 'estimate':
+        estimate = _planner_estimate(query)
+        if estimate is not None:
+            return estimate
+
+    compiled = query.statement.compile()
+    digest = hashlib.sha1(
+        (str(compiled) + repr(sorted(compiled.params.items()))).encode()
+    ).hexdigest()
+    key = f"count:{digest}"
+    if store_id is not None:
+        key = f"count:{store_id}:v{get_data_version(store_id)}:{digest}"
+
+    total = cache.get(key)
+    if total is None:
+        total = query.count()
+        cache.set(key, total, ttl)
+    return total
+
+def encode_cursor(values: Sequence, scope: Optional[str] = None) -> str:
+    """Encode sort key values as an opaque URL-safe cursor.
+
+    Dates, datetimes and Decimals are tagged so they decode to the same
+    type. ``scope`` ties the cursor to one sort order.
+    """
+    payload: Dict[str, Any] = {'v': [_dump_value(value) for value in values]}
+    if scope:
+        payload['s'] = scope
+    data = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+def decode_cursor(cursor: str, scope: Optional[str] = None) -> List[Any]:
+    """Decode a cursor made by encode_cursor back to its sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed or was made for another scope
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(data)
+        values = [_load_value(value) for value in payload['v']]
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    if payload.get('s') != scope:
+        raise ValueError("Cursor does not match the requested sort order")
+    return values
+
+def _cursor_scope(columns: Sequence, descending: bool) -> str:
+    """Identify a sort order so cursors cannot be replayed against another."""
+    return ','.join(column.key for column in columns) + (':desc' if descending else ':asc')
+
+def _dump_value(value: Any) -> Any:
+    """Convert a sort value to JSON, tagging types JSON cannot represent."""
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'d': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'dec': str(value)}
+    return value
+
+def _load_value(value: Any) -> Any:
+    """Reverse _dump_value."""
+    if isinstance(value, dict):
+        if 'dt' in value:
+            return datetime.fromisoformat(value['dt'])
+        if 'd' in value:
+            return date.fromisoformat(value['d'])
+        if 'dec' in value:
+            return Decimal(value['dec'])
+        raise ValueError("Invalid cursor value")
+    if isinstance(value, list):
+        raise ValueError("Invalid cursor value")
+    return value
+
+def _planner_estimate(query: Query) -> Optional[int]:
+    """Row estimate from PostgreSQL's planner, None on other databases."""
+    connection = query.session.connection()
+    if connection.dialect.name != 'postgresql':
+        return None
+
+    compiled = query.statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
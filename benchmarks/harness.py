@@ -0,0 +1,130 @@
+"""Benchmark registry, timing and baseline comparison."""
+
+import contextlib
+import io
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict, List, Optional
+
+# name -> {'func': callable(context), 'setup': callable(context) or None}
+BENCHMARKS: Dict[str, Dict[str, Any]] = {}
+
+# Median slowdown over the baseline tolerated before a run fails
+DEFAULT_TOLERANCE = 0.25
+
+
+class BenchmarkError(Exception):
+    """A scenario ran but its result shows it did not do the measured work."""
+    pass
+
+
+def benchmark(name: str, setup: Optional[Callable] = None) -> Callable:
+    """Register a scenario.
+
+    The scenario is called with the run context and may return the number
+    of rows it processed, which adds a rows/sec figure to its result.
+    ``setup`` runs before every timed call and is not timed.
+    """
+    def register(func: Callable) -> Callable:
+        BENCHMARKS[name] = {'func': func, 'setup': setup}
+        return func
+    return register
+
+
+def measure(func: Callable, context: Any, setup: Optional[Callable] = None,
+            repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """Time a scenario.
+
+    Returns:
+        Dict: status 'ok' with min/median/mean seconds (and rows and
+        rows_per_sec when the scenario reports rows), or status 'error'
+        with the error message
+    """
+    timings = []
+    rows = None
+    try:
+        for run in range(warmup + repeat):
+            if setup:
+                setup(context)
+            # Legacy code paths print progress; keep it out of the report
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                rows = func(context)
+                elapsed = time.perf_counter() - start
+            if run >= warmup:
+                timings.append(elapsed)
+    except Exception as e:
+        return {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+    median = statistics.median(timings)
+    result = {
+        'status': 'ok',
+        'runs': repeat,
+        'min_s': round(min(timings), 6),
+        'median_s': round(median, 6),
+        'mean_s': round(statistics.mean(timings), 6),
+    }
+    if rows is not None:
+        result['rows'] = rows
+        result['rows_per_sec'] = round(rows / median, 1) if median else None
+    return result
+
+
+def run_benchmarks(context: Any, names: List[str], repeat: int = 5, warmup: int = 1,
+                   echo: Callable = print) -> Dict[str, Dict[str, Any]]:
+    """Measure the named scenarios in order."""
+    results = {}
+    for name in names:
+        scenario = BENCHMARKS[name]
+        results[name] = measure(scenario['func'], context, scenario['setup'], repeat, warmup)
+        echo(format_result(name, results[name]))
+    return results
+
+
+def format_result(name: str, result: Dict[str, Any]) -> str:
+    """One report line for a scenario result."""
+    if result['status'] != 'ok':
+        return f"{name:<55} ERROR {result['error']}"
+    line = f"{name:<55} {result['median_s'] * 1000:>10.2f} ms"
+    if 'rows_per_sec' in result:
+        line += f"  {result['rows_per_sec']:>12,.0f} rows/s"
+    return line
+
+
+def environment() -> Dict[str, str]:
+    """Machine details stored with the results."""
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'recorded_at': datetime.now(UTC).isoformat(timespec='seconds'),
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Regressions of a run against a baseline run.
+
+    A scenario regresses when it worked in the baseline and now fails, or
+    when its median time grew by more than ``tolerance`` (0.25 = 25%).
+    Scenarios missing from either side are ignored.
+
+    Returns:
+        List[str]: One message per regression
+    """
+    regressions = []
+    for name, before in baseline.items():
+        after = results.get(name)
+        if after is None or before.get('status') != 'ok':
+            continue
+        if after['status'] != 'ok':
+            regressions.append(f"{name}: now fails ({after['error']})")
+        elif after['median_s'] > before['median_s'] * (1 + tolerance):
+            regressions.append(
+                f"{name}: median {after['median_s'] * 1000:.2f} ms vs. baseline "
+                f"{before['median_s'] * 1000:.2f} ms (+{(after['median_s'] / before['median_s'] - 1) * 100:.0f}%)"
+            )
+    return regressions
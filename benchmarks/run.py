@@ -0,0 +1,168 @@
+"""Benchmark runner.
+
+Builds a throwaway database from the synthetic generator, times the
+scenarios and compares the run with the stored baseline::
+
+    python -m benchmarks --scale 100k
+    python -m benchmarks --filter ingest --repeat 3
+    python -m benchmarks --save-baseline
+
+Timings only compare on the same machine with the same options; record a
+new baseline with ``--save-baseline`` after changing either. The committed
+baseline.json was recorded on a single development machine and is only a
+reference: CI must record its own baseline on its runner hardware, e.g.
+``--save-baseline --baseline <file>`` on the target branch, and compare
+against that file instead of the committed one.
+"""
+
+import fnmatch
+import json
+import os
+import sys
+import tempfile
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from app import create_app
+from app.core.synthetic.generator import create_synthetic_stores, generate_dataset, resolve_scale
+from app.extensions import db
+from app.modules.auth.models import User
+
+from . import scenarios
+from .harness import BENCHMARKS, DEFAULT_TOLERANCE, compare, environment, run_benchmarks
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Fixed so that equal seeds give equal datasets on every day
+DEFAULT_END_DATE = date(2024, 12, 31)
+
+REPORTS = list(scenarios.INGEST)
+
+
+def prepare_dataset(scale: str, stores: int, days: int, seed: int, ingest_rows: int,
+                    end_date: date, csv_dir: str) -> scenarios.BenchmarkContext:
+    """Load the synthetic dataset and write the ingest CSV files.
+
+    Runs inside an app context on an empty database.
+    """
+    db.create_all()
+    user = User(username='benchmark', email='benchmark@example.com')
+    user.set_password('benchmark')
+    db.session.add(user)
+    db.session.commit()
+
+    store_ids = create_synthetic_stores(user.id, stores + 1)
+    data_store_ids, ingest_store_id = store_ids[:-1], store_ids[-1]
+
+    generate_dataset(REPORTS, data_store_ids, resolve_scale(scale), end_date, days=days, seed=seed, load=True)
+    generate_dataset(REPORTS, [ingest_store_id], ingest_rows, end_date, days=min(days, 30), seed=seed,
+                     output_dir=csv_dir)
+
+    return scenarios.BenchmarkContext(user.id, data_store_ids, ingest_store_id, end_date, csv_dir)
+
+
+def select(patterns: Tuple[str, ...]) -> List[str]:
+    """Registered scenario names matching any of the glob patterns."""
+    if not patterns:
+        return list(BENCHMARKS)
+    return [name for name in BENCHMARKS
+            if any(fnmatch.fnmatch(name, pattern) or name.startswith(pattern) for pattern in patterns)]
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """The baseline run, or None when there is none yet."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path: str, data: Dict[str, Any]):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+@click.command()
+@click.option('--scale', default='10k', show_default=True,
+              help='Rows per report type: 10k, 100k, 1m, 10m, 50m or a row count')
+@click.option('--stores', default=2, show_default=True, help='Number of data stores')
+@click.option('--days', default=365, show_default=True, help='Days of history')
+@click.option('--seed', default=0, show_default=True, help='Random seed of the dataset')
+@click.option('--ingest-rows', default=2000, show_default=True, help='Rows per uploaded CSV file')
+@click.option('--repeat', default=5, show_default=True, help='Timed runs per scenario')
+@click.option('--warmup', default=1, show_default=True, help='Untimed runs per scenario')
+@click.option('--filter', 'patterns', multiple=True,
+              help='Run scenarios matching a name prefix or glob, repeatable')
+@click.option('--output', default='benchmark-results.json', show_default=True,
+              type=click.Path(dir_okay=False), help='Results file')
+@click.option('--baseline', default=BASELINE_PATH, show_default=True,
+              type=click.Path(dir_okay=False), help='Baseline results file')
+@click.option('--tolerance', default=DEFAULT_TOLERANCE, show_default=True,
+              help='Median slowdown over the baseline treated as a regression')
+@click.option('--save-baseline', is_flag=True, help='Store this run as the baseline')
+@click.option('--database-url', help='Empty database to load (default: a temporary SQLite file)')
+@click.option('--list', 'list_only', is_flag=True, help='List the scenarios and exit')
+def main(scale: str, stores: int, days: int, seed: int, ingest_rows: int, repeat: int, warmup: int,
+         patterns: Tuple[str, ...], output: str, baseline: str, tolerance: float,
+         save_baseline: bool, database_url: Optional[str], list_only: bool):
+    """Time ingestion, analytics and listing scenarios on synthetic data."""
+    names = select(patterns)
+    if list_only:
+        click.echo('\n'.join(names))
+        return
+    if not names:
+        raise click.UsageError('No scenario matches --filter')
+
+    with tempfile.TemporaryDirectory(prefix='benchmarks-') as workdir:
+        app = create_app({
+            'TESTING': True,
+            'SECRET_KEY': 'benchmarks',
+            'SQLALCHEMY_DATABASE_URI': database_url or 'sqlite:///' + os.path.join(workdir, 'benchmarks.db'),
+            'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+        })
+        app.config['UPLOAD_FOLDER'] = os.path.join(workdir, 'uploads')
+        csv_dir = os.path.join(workdir, 'csv')
+        os.makedirs(csv_dir)
+
+        with app.app_context():
+            click.echo(f"Loading {scale} rows per report into {stores} stores...")
+            context = prepare_dataset(scale, stores, days, seed, ingest_rows, DEFAULT_END_DATE, csv_dir)
+            results = run_benchmarks(context, names, repeat=repeat, warmup=warmup, echo=click.echo)
+            db.session.remove()
+            if not database_url:
+                db.engine.dispose()
+
+    run = {
+        'meta': {
+            'scale': scale, 'stores': stores, 'days': days, 'seed': seed,
+            'ingest_rows': ingest_rows, 'repeat': repeat, 'warmup': warmup,
+            **environment(),
+        },
+        'results': results,
+    }
+    write_json(output, run)
+    click.echo(f"Results written to {output}")
+
+    if save_baseline:
+        write_json(baseline, run)
+        click.echo(f"Baseline written to {baseline}")
+        return
+
+    previous = load_baseline(baseline)
+    if previous is None:
+        click.echo('No baseline to compare with')
+        return
+
+    options = ('scale', 'stores', 'days', 'seed', 'ingest_rows')
+    if any(previous['meta'].get(key) != run['meta'][key] for key in options):
+        click.echo('Warning: baseline was recorded with different dataset options', err=True)
+
+    regressions = compare(results, previous['results'], tolerance)
+    for regression in regressions:
+        click.echo(f"REGRESSION {regression}", err=True)
+    if regressions:
+        sys.exit(1)
+    click.echo(f"No regressions against {baseline} (tolerance {tolerance:.0%})")
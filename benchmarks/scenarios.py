@@ -0,0 +1,136 @@
+"""Benchmark scenarios.
+
+Every scenario gets a BenchmarkContext describing the loaded synthetic
+dataset. Reads run against the first data store, ingest scenarios upload
+the generated CSV files into a separate store that is emptied before
+every run.
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Dict, List, Optional
+
+from werkzeug.datastructures import FileStorage
+
+from app.extensions import db
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.business.models import BusinessReport
+from app.modules.business.services.business_report import BusinessReportService
+from app.modules.inventory.models import CurrentInventory, InventoryChange, InventoryReport
+from app.modules.returns.models import ReturnRateFact, ReturnReport
+from app.modules.upload_csv.processors import (
+    AdvertisingCSVProcessor, BusinessCSVProcessor, InventoryCSVProcessor, ReturnCSVProcessor
+)
+from app.modules.uploaded_data.listing import REPORT_LISTINGS, list_reports
+
+from .harness import BenchmarkError, benchmark
+
+WINDOWS = (30, 90, 365)
+
+# Listing page fetched through cursors for the deep pagination scenario
+LISTING_DEEP_PAGE = 20
+
+# report type -> (processor, tables emptied before an ingest run)
+INGEST = {
+    'business': (BusinessCSVProcessor, [BusinessReport]),
+    'advertising': (AdvertisingCSVProcessor, [AdvertisingReport]),
+    'inventory': (InventoryCSVProcessor, [InventoryChange, CurrentInventory, InventoryReport]),
+    'returns': (ReturnCSVProcessor, [ReturnRateFact, ReturnReport]),
+}
+
+
+class BenchmarkContext:
+    """The dataset the scenarios run against."""
+
+    def __init__(self, user_id: int, store_ids: List[int], ingest_store_id: int,
+                 end_date: date, csv_dir: str):
+        self.user_id = user_id
+        self.store_id = store_ids[0]
+        self.store_ids = store_ids
+        self.ingest_store_id = ingest_store_id
+        self.end_date = end_date
+        self.csv_dir = csv_dir
+        # report type -> cursor of the deep listing page, found on first use
+        self.cursors: Dict[str, Optional[str]] = {}
+
+    def window(self, days: int):
+        """First and last day of a window ending on the dataset's last day."""
+        return self.end_date - timedelta(days=days - 1), self.end_date
+
+
+def _clear_ingest_store(report_type: str, context: BenchmarkContext):
+    for model in INGEST[report_type][1]:
+        model.query.filter_by(store_id=context.ingest_store_id).delete()
+    db.session.commit()
+
+
+def _ingest(report_type: str, context: BenchmarkContext) -> int:
+    path = os.path.join(context.csv_dir, f'{report_type}_report.csv')
+    with open(path, 'rb') as f:
+        rows = sum(1 for _ in f) - 1
+        f.seek(0)
+        upload = FileStorage(stream=f, filename=os.path.basename(path), content_type='text/csv')
+        success, message = INGEST[report_type][0]().process_file(upload, context.user_id)
+    if not success:
+        raise BenchmarkError(message)
+    return rows
+
+
+def _period_bounds(days: int, context: BenchmarkContext):
+    start, end = context.window(days)
+    return datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.max.time())
+
+
+def _business_trends(days: int, context: BenchmarkContext):
+    result = BusinessReportService(context.store_id).get_trends(*_period_bounds(days, context))
+    if not result:
+        raise BenchmarkError('no business trends returned')
+
+
+def _metrics_chart(days: int, context: BenchmarkContext):
+    chart = BusinessReportService(context.store_id).get_metrics_chart_data(*_period_bounds(days, context))
+    if not any(chart['data']['datasets'][0]['data']):
+        raise BenchmarkError('no current period metrics returned')
+
+
+def _first_page(report_type: str, context: BenchmarkContext) -> int:
+    page = list_reports(report_type, context.store_id)
+    if not page['items']:
+        raise BenchmarkError(f'no {report_type} rows listed')
+    return len(page['items'])
+
+
+def _find_deep_cursor(report_type: str, context: BenchmarkContext):
+    if report_type in context.cursors:
+        return
+    cursor = None
+    for _ in range(LISTING_DEEP_PAGE - 1):
+        cursor = list_reports(report_type, context.store_id, cursor=cursor)['next_cursor']
+        if cursor is None:
+            raise BenchmarkError(f'fewer than {LISTING_DEEP_PAGE} pages of {report_type} rows')
+    context.cursors[report_type] = cursor
+
+
+def _deep_page(report_type: str, context: BenchmarkContext) -> int:
+    page = list_reports(report_type, context.store_id, cursor=context.cursors[report_type])
+    return len(page['items'])
+
+
+for _report_type in INGEST:
+    benchmark(f'ingest.{_report_type}', setup=partial(_clear_ingest_store, _report_type))(
+        partial(_ingest, _report_type)
+    )
+
+for _days in WINDOWS:
+    benchmark(f'business_service.get_trends.{_days}d')(partial(_business_trends, _days))
+    benchmark(f'business_service.metrics_chart.{_days}d')(partial(_metrics_chart, _days))
+
+for _report_type in REPORT_LISTINGS:
+    benchmark(f'uploaded_data.list_reports.{_report_type}.first_page')(
+        partial(_first_page, _report_type)
+    )
+    benchmark(f'uploaded_data.list_reports.{_report_type}.page_{LISTING_DEEP_PAGE}',
+              setup=partial(_find_deep_cursor, _report_type))(
+        partial(_deep_page, _report_type)
+    )
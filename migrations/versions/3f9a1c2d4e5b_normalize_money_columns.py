@@ -0,0 +1,91 @@
+"""normalize legacy string values in money columns
+
+Revision ID: 3f9a1c2d4e5b
+Revises: bebf441c3555
+Create Date: 2025-02-03 10:12:45.218734
+
+"""
+import logging
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c2d4e5b'
+down_revision = 'bebf441c3555'
+branch_labels = None
+depends_on = None
+
+# Money columns that older uploads stored as formatted strings ("$1,234.50")
+MONEY_COLUMNS = {
+    'business_reports': ['ordered_product_sales'],
+    'advertising_reports': ['cpc', 'spend', 'total_sales'],
+    'inventory_reports': ['price'],
+    'return_reports': ['refund_amount'],
+}
+
+# Frozen copy of the upload parsing rules at the time of this revision, so
+# later changes to app.utils.money cannot change what the migration does
+CURRENCY_SYMBOLS = ('$', '€', '£', '¥', '₺', ',', ' ')
+MONEY_QUANTUM = Decimal('0.01')
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+def _parse_money(value):
+    """Parse a legacy money string; returns None for empty values."""
+    text = str(value).strip()
+    negative = text.startswith('(') and text.endswith(')')
+    if negative:
+        text = text[1:-1]
+    for symbol in CURRENCY_SYMBOLS:
+        text = text.replace(symbol, '')
+    if not text:
+        return None
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Invalid money value: {value!r}")
+    if negative:
+        amount = -amount
+    return amount.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def upgrade():
+    # Only SQLite lets text values slip into NUMERIC columns; on other
+    # backends the column type already guarantees clean numbers.
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    inspector = sa.inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    # Parse in Python with the upload rules frozen above, so accounting
+    # negatives like "(12.50)" stay negative. Values that do not parse are
+    # left as they are instead of becoming 0.
+    for table, columns in MONEY_COLUMNS.items():
+        if table not in existing_tables:
+            continue
+        for column in columns:
+            rows = bind.execute(sa.text(
+                f"SELECT id, {column} FROM {table} WHERE typeof({column}) = 'text'"
+            )).fetchall()
+            for row_id, value in rows:
+                try:
+                    amount = _parse_money(value)
+                except ValueError:
+                    logger.warning("Skipping unparseable %s.%s value %r (id %s)", table, column, value, row_id)
+                    continue
+                bind.execute(
+                    sa.text(f"UPDATE {table} SET {column} = :amount WHERE id = :id"),
+                    {'amount': str(amount) if amount is not None else None, 'id': row_id}
+                )
+
+
+def downgrade():
+    # Cleaned values are valid numbers under the old schema as well;
+    # the original formatting is not restored.
+    pass
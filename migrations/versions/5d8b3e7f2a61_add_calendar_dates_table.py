@@ -0,0 +1,147 @@
+"""add calendar_dates table
+
+Revision ID: 5d8b3e7f2a61
+Revises: 7a2e4c9b1d03
+Create Date: 2025-02-05 14:22:07.184903
+
+"""
+from datetime import date, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8b3e7f2a61'
+down_revision = '7a2e4c9b1d03'
+branch_labels = None
+depends_on = None
+
+SEED_BATCH_SIZE = 1000
+SEED_START_YEAR = 2020
+SEED_END_YEAR = 2030
+
+
+# Frozen copy of the calendar rules at the time of this revision, so later
+# changes to app.core.calendar cannot change what the migration seeds;
+# `flask calendar populate` refreshes rows with the current rules.
+def _nth_weekday(year, month, weekday, n):
+    """Return the n-th weekday (0 = Monday) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + timedelta(days=offset + 7 * (n - 1))
+
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _thanksgiving(year):
+    return _nth_weekday(year, 11, 3, 4)
+
+
+HOLIDAYS = {
+    "New Year's Day": lambda y: date(y, 1, 1),
+    "Valentine's Day": lambda y: date(y, 2, 14),
+    "Mother's Day": lambda y: _nth_weekday(y, 5, 6, 2),
+    'Memorial Day': lambda y: _nth_weekday(y, 5, 0, -1),
+    "Father's Day": lambda y: _nth_weekday(y, 6, 6, 3),
+    'Independence Day': lambda y: date(y, 7, 4),
+    'Labor Day': lambda y: _nth_weekday(y, 9, 0, 1),
+    'Halloween': lambda y: date(y, 10, 31),
+    'Thanksgiving': _thanksgiving,
+    'Black Friday': lambda y: _thanksgiving(y) + timedelta(days=1),
+    'Cyber Monday': lambda y: _thanksgiving(y) + timedelta(days=4),
+    'Christmas Day': lambda y: date(y, 12, 25),
+    "New Year's Eve": lambda y: date(y, 12, 31),
+}
+
+SPECIAL_PERIODS = {
+    'is_prime_day': lambda y: (_nth_weekday(y, 7, 1, 2), _nth_weekday(y, 7, 1, 2) + timedelta(days=1)),
+    'is_back_to_school': lambda y: (date(y, 7, 15), date(y, 9, 15)),
+    'is_cyber_week': lambda y: (_thanksgiving(y), _thanksgiving(y) + timedelta(days=4)),
+    'is_holiday_season': lambda y: (date(y, 11, 1), date(y, 12, 31)),
+}
+
+
+def _calendar_rows(start_year, end_year):
+    """Yield calendar_dates rows for every day of the given years."""
+    for year in range(start_year, end_year + 1):
+        holidays = {rule(year): name for name, rule in HOLIDAYS.items()}
+        periods = {column: rule(year) for column, rule in SPECIAL_PERIODS.items()}
+        day = date(year, 1, 1)
+        while day.year == year:
+            iso_year, iso_week, _ = day.isocalendar()
+            quarter = (day.month - 1) // 3 + 1
+            row = {
+                'date': day,
+                'year': day.year,
+                'quarter': quarter,
+                'month': day.month,
+                'day': day.day,
+                'day_of_week': day.weekday(),
+                'iso_year': iso_year,
+                'iso_week': iso_week,
+                'week_label': f'{iso_year}-W{iso_week:02d}',
+                'month_label': f'{day.year}-{day.month:02d}',
+                'quarter_label': f'{day.year}-Q{quarter}',
+                'year_label': str(day.year),
+                'is_weekend': day.weekday() >= 5,
+                'is_holiday': day in holidays,
+                'holiday_name': holidays.get(day),
+            }
+            for column, (start, end) in periods.items():
+                row[column] = start <= day <= end
+            yield row
+            day += timedelta(days=1)
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    calendar_dates = op.create_table('calendar_dates',
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('quarter', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Integer(), nullable=False),
+    sa.Column('day_of_week', sa.Integer(), nullable=False),
+    sa.Column('iso_year', sa.Integer(), nullable=False),
+    sa.Column('iso_week', sa.Integer(), nullable=False),
+    sa.Column('week_label', sa.String(length=8), nullable=False),
+    sa.Column('month_label', sa.String(length=7), nullable=False),
+    sa.Column('quarter_label', sa.String(length=7), nullable=False),
+    sa.Column('year_label', sa.String(length=4), nullable=False),
+    sa.Column('is_weekend', sa.Boolean(), nullable=False),
+    sa.Column('is_holiday', sa.Boolean(), nullable=False),
+    sa.Column('holiday_name', sa.String(length=100), nullable=True),
+    sa.Column('is_prime_day', sa.Boolean(), nullable=False),
+    sa.Column('is_back_to_school', sa.Boolean(), nullable=False),
+    sa.Column('is_cyber_week', sa.Boolean(), nullable=False),
+    sa.Column('is_holiday_season', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('date')
+    )
+    with op.batch_alter_table('calendar_dates', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_calendar_dates_week_label'), ['week_label'], unique=False)
+        batch_op.create_index(batch_op.f('ix_calendar_dates_month_label'), ['month_label'], unique=False)
+        batch_op.create_index(batch_op.f('ix_calendar_dates_quarter_label'), ['quarter_label'], unique=False)
+
+    # ### end Alembic commands ###
+
+    # Seed the default range so the trend queries joining the calendar
+    # return rows right after upgrading; `flask calendar populate` extends
+    # or refreshes it
+    rows = list(_calendar_rows(SEED_START_YEAR, SEED_END_YEAR))
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        op.bulk_insert(calendar_dates, rows[start:start + SEED_BATCH_SIZE])
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('calendar_dates', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_calendar_dates_quarter_label'))
+        batch_op.drop_index(batch_op.f('ix_calendar_dates_month_label'))
+        batch_op.drop_index(batch_op.f('ix_calendar_dates_week_label'))
+
+    op.drop_table('calendar_dates')
+    # ### end Alembic commands ###
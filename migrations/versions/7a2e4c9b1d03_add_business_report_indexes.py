@@ -0,0 +1,44 @@
+"""add upsert key and covering index to business_reports
+
+Revision ID: 7a2e4c9b1d03
+Revises: 3f9a1c2d4e5b
+Create Date: 2025-02-04 09:41:18.552310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a2e4c9b1d03'
+down_revision = '3f9a1c2d4e5b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 1. Remove duplicate upsert keys, keeping the most recent row
+    op.execute(
+        """
+        DELETE FROM business_reports
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM business_reports
+            GROUP BY store_id, date, sku, asin
+        )
+        """
+    )
+
+    # 2. Add the unique upsert index and the covering index
+    with op.batch_alter_table('business_reports', schema=None) as batch_op:
+        batch_op.create_index(
+            'uq_business_store_date_sku_asin', ['store_id', 'date', 'sku', 'asin'], unique=True)
+        batch_op.create_index(
+            'idx_business_store_date_metrics',
+            ['store_id', 'date', 'asin', 'ordered_product_sales', 'units_ordered', 'sessions'],
+            unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('business_reports', schema=None) as batch_op:
+        batch_op.drop_index('idx_business_store_date_metrics')
+        batch_op.drop_index('uq_business_store_date_sku_asin')
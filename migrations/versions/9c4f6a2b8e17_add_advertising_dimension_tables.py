@@ -0,0 +1,168 @@
+"""move advertising campaign, ad group and search term names to dimension tables
+
+Revision ID: 9c4f6a2b8e17
+Revises: 5d8b3e7f2a61
+Create Date: 2025-02-06 11:05:52.640118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4f6a2b8e17'
+down_revision = '5d8b3e7f2a61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 1. Dimension tables
+    op.create_table('ad_campaigns',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('store_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ad_campaigns', schema=None) as batch_op:
+        batch_op.create_index('uq_ad_campaign_store_name', ['store_id', 'name'], unique=True)
+
+    op.create_table('ad_groups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('campaign_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['ad_campaigns.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ad_groups', schema=None) as batch_op:
+        batch_op.create_index('uq_ad_group_campaign_name', ['campaign_id', 'name'], unique=True)
+
+    op.create_table('ad_search_terms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('term', sa.String(length=200), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('term')
+    )
+
+    # 2. Fill dimensions from the existing report rows
+    op.execute(
+        """
+        INSERT INTO ad_campaigns (store_id, name)
+        SELECT DISTINCT store_id, campaign_name FROM advertising_reports
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO ad_groups (campaign_id, name)
+        SELECT DISTINCT c.id, r.ad_group_name
+        FROM advertising_reports r
+        JOIN ad_campaigns c ON c.store_id = r.store_id AND c.name = r.campaign_name
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO ad_search_terms (term)
+        SELECT DISTINCT search_term FROM advertising_reports
+        """
+    )
+
+    # 3. Point report rows at the dimensions
+    with op.batch_alter_table('advertising_reports', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('campaign_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('ad_group_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('search_term_id', sa.Integer(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE advertising_reports SET
+            campaign_id = (
+                SELECT c.id FROM ad_campaigns c
+                WHERE c.store_id = advertising_reports.store_id
+                  AND c.name = advertising_reports.campaign_name
+            ),
+            search_term_id = (
+                SELECT t.id FROM ad_search_terms t
+                WHERE t.term = advertising_reports.search_term
+            )
+        """
+    )
+    op.execute(
+        """
+        UPDATE advertising_reports SET
+            ad_group_id = (
+                SELECT g.id FROM ad_groups g
+                WHERE g.campaign_id = advertising_reports.campaign_id
+                  AND g.name = advertising_reports.ad_group_name
+            )
+        """
+    )
+
+    # 4. Remove duplicate upsert keys, keeping the most recent row
+    op.execute(
+        """
+        DELETE FROM advertising_reports
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM advertising_reports
+            GROUP BY store_id, date, campaign_id, ad_group_id, targeting_type, search_term_id
+        )
+        """
+    )
+
+    # 5. Drop the name columns and index the integer keys
+    with op.batch_alter_table('advertising_reports', schema=None) as batch_op:
+        batch_op.drop_index('idx_advertising_campaign')
+        batch_op.drop_column('campaign_name')
+        batch_op.drop_column('ad_group_name')
+        batch_op.drop_column('search_term')
+        batch_op.alter_column('campaign_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column('ad_group_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column('search_term_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_advertising_campaign', 'ad_campaigns', ['campaign_id'], ['id'])
+        batch_op.create_foreign_key('fk_advertising_ad_group', 'ad_groups', ['ad_group_id'], ['id'])
+        batch_op.create_foreign_key('fk_advertising_search_term', 'ad_search_terms', ['search_term_id'], ['id'])
+        batch_op.create_index('idx_advertising_campaign', ['campaign_id'], unique=False)
+        batch_op.create_index(
+            'uq_advertising_upsert',
+            ['store_id', 'date', 'campaign_id', 'ad_group_id', 'targeting_type', 'search_term_id'],
+            unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('advertising_reports', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('campaign_name', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('ad_group_name', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('search_term', sa.String(length=200), nullable=True))
+
+    op.execute(
+        """
+        UPDATE advertising_reports SET
+            campaign_name = (SELECT name FROM ad_campaigns WHERE id = advertising_reports.campaign_id),
+            ad_group_name = (SELECT name FROM ad_groups WHERE id = advertising_reports.ad_group_id),
+            search_term = (SELECT term FROM ad_search_terms WHERE id = advertising_reports.search_term_id)
+        """
+    )
+
+    with op.batch_alter_table('advertising_reports', schema=None) as batch_op:
+        batch_op.drop_index('uq_advertising_upsert')
+        batch_op.drop_index('idx_advertising_campaign')
+        batch_op.drop_constraint('fk_advertising_search_term', type_='foreignkey')
+        batch_op.drop_constraint('fk_advertising_ad_group', type_='foreignkey')
+        batch_op.drop_constraint('fk_advertising_campaign', type_='foreignkey')
+        batch_op.drop_column('search_term_id')
+        batch_op.drop_column('ad_group_id')
+        batch_op.drop_column('campaign_id')
+        batch_op.alter_column('campaign_name', existing_type=sa.String(length=100), nullable=False)
+        batch_op.alter_column('ad_group_name', existing_type=sa.String(length=100), nullable=False)
+        batch_op.alter_column('search_term', existing_type=sa.String(length=200), nullable=False)
+        batch_op.create_index('idx_advertising_campaign', ['campaign_name'], unique=False)
+
+    op.drop_table('ad_search_terms')
+    with op.batch_alter_table('ad_groups', schema=None) as batch_op:
+        batch_op.drop_index('uq_ad_group_campaign_name')
+
+    op.drop_table('ad_groups')
+    with op.batch_alter_table('ad_campaigns', schema=None) as batch_op:
+        batch_op.drop_index('uq_ad_campaign_store_name')
+
+    op.drop_table('ad_campaigns')
@@ -12,5 +12,6 @@ setup(
         'python-dateutil',
         'pandas',
         'numpy',
+        'pyarrow',
     ],
 )
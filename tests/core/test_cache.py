@@ -0,0 +1,157 @@
+"""Test cases for the response cache."""
+
+import pytest
+from flask import jsonify
+from sqlalchemy import event
+
+from app import create_app
+from app.core.cache import Cache, bump_data_version, cache, cached_response, get_data_version
+from app.core.models import StoreDataVersion
+from app.extensions import db
+
+
+def _params(args):
+    store_id = args.get('store_id', type=int)
+    if not store_id:
+        return None
+    return {'store_id': store_id, 'group_by': args.get('group_by', 'daily')}
+
+
+@pytest.fixture
+def cached_app():
+    """Create a small app with a cached view that counts its calls."""
+    cache.clear()
+    app = create_app({'TESTING': True, 'SECRET_KEY': 'cache', 'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+    calls = []
+
+    @app.route('/trends')
+    @cached_response(_params, ttl=60)
+    def trends():
+        calls.append(1)
+        return jsonify({'calls': len(calls)})
+
+    with app.app_context():
+        db.create_all()
+    return app, calls
+
+
+def test_repeated_requests_hit_cache(cached_app):
+    """Test the view runs once for identical normalized parameters."""
+    app, calls = cached_app
+    client = app.test_client()
+
+    first = client.get('/trends?store_id=1')
+    second = client.get('/trends?group_by=daily&store_id=1')
+
+    assert first.status_code == second.status_code == 200
+    assert first.json == second.json
+    assert first.headers['ETag'] == second.headers['ETag']
+    assert len(calls) == 1
+
+
+def test_if_none_match_returns_304(cached_app):
+    """Test an unchanged response is revalidated without running the view."""
+    app, calls = cached_app
+    client = app.test_client()
+
+    etag = client.get('/trends?store_id=1').headers['ETag']
+    response = client.get('/trends?store_id=1', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.data == b''
+    assert len(calls) == 1
+
+
+def test_data_version_bump_invalidates(cached_app):
+    """Test new data for a store invalidates its cached responses."""
+    app, calls = cached_app
+    client = app.test_client()
+
+    etag = client.get('/trends?store_id=1').headers['ETag']
+    other_store_etag = client.get('/trends?store_id=2').headers['ETag']
+
+    with app.app_context():
+        version = get_data_version(1)
+        assert bump_data_version(1) > version
+        db.session.commit()
+
+    response = client.get('/trends?store_id=1', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert len(calls) == 3
+
+    response = client.get('/trends?store_id=2', headers={'If-None-Match': other_store_etag})
+    assert response.status_code == 304
+
+
+def test_missing_store_bypasses_cache(cached_app):
+    """Test requests without a store are not cached."""
+    app, calls = cached_app
+    client = app.test_client()
+
+    client.get('/trends')
+    response = client.get('/trends')
+
+    assert 'ETag' not in response.headers
+    assert len(calls) == 2
+
+
+def test_data_version_is_shared(cached_app):
+    """Test a bump committed by another worker invalidates cached responses."""
+    app, calls = cached_app
+    client = app.test_client()
+
+    etag = client.get('/trends?store_id=1').headers['ETag']
+    with app.app_context():
+        # Another worker's bump reaches this one only through the database
+        db.session.add(StoreDataVersion(store_id=1, version=42))
+        db.session.commit()
+
+    # This worker trusts its copy of the version until it expires
+    response = client.get('/trends?store_id=1', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+    cache.delete('data_version:1')
+    response = client.get('/trends?store_id=1', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_not_modified_skips_database(cached_app):
+    """Test a 304 is served without querying the database."""
+    app, calls = cached_app
+    client = app.test_client()
+    etag = client.get('/trends?store_id=1').headers['ETag']
+
+    statements = []
+    with app.app_context():
+        engine = db.engine
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', _count)
+    try:
+        response = client.get('/trends?store_id=1', headers={'If-None-Match': etag})
+    finally:
+        event.remove(engine, 'before_cursor_execute', _count)
+
+    assert response.status_code == 304
+    assert statements == []
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the cache stays within its size, dropping expired entries first."""
+    lru = Cache(max_entries=3)
+    lru.set('a', 1)
+    lru.set('b', 2, ttl=-1)
+    lru.set('c', 3)
+    lru.get('a')
+    lru.set('d', 4)
+    assert len(lru) == 3
+    assert lru.get('b') is None
+
+    lru.set('e', 5)
+    assert len(lru) == 3
+    assert lru.get('c') is None
+    assert [lru.get(key) for key in ('a', 'd', 'e')] == [1, 4, 5]
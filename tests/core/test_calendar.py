@@ -0,0 +1,100 @@
+"""Test cases for the calendar dimension."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from app.core.calendar import (
+    build_calendar_row, calendar_cli, day_match_sql, ensure_calendar, get_special_period_range,
+    populate_calendar
+)
+from app.core.models.calendar import CalendarDate
+from app.modules.business.models import BusinessReport
+
+
+def test_build_calendar_row_labels():
+    """Test date parts and group labels."""
+    row = build_calendar_row(date(2023, 1, 1))
+
+    assert row['quarter'] == 1
+    assert row['week_label'] == '2022-W52'  # ISO week of the previous year
+    assert row['month_label'] == '2023-01'
+    assert row['quarter_label'] == '2023-Q1'
+    assert row['is_weekend'] is True
+    assert row['holiday_name'] == "New Year's Day"
+
+
+def test_build_calendar_row_moving_periods():
+    """Test holidays and special periods that move each year."""
+    black_friday = build_calendar_row(date(2024, 11, 29))
+    assert black_friday['holiday_name'] == 'Black Friday'
+    assert black_friday['is_cyber_week'] is True
+    assert black_friday['is_holiday_season'] is True
+
+    assert build_calendar_row(date(2023, 11, 24))['holiday_name'] == 'Black Friday'
+    assert build_calendar_row(date(2024, 7, 9))['is_prime_day'] is True
+    assert build_calendar_row(date(2024, 3, 5))['is_holiday'] is False
+
+
+def test_populate_calendar(database):
+    """Test populating the table and reading special period ranges."""
+    count = populate_calendar(date(2024, 1, 1), date(2024, 12, 31))
+
+    assert count == 366
+    assert CalendarDate.query.filter_by(year=2024).count() == 366
+    assert get_special_period_range('cyber_week', 2024) == (date(2024, 11, 28), date(2024, 12, 2))
+    assert get_special_period_range('cyber_week', 1999) is None
+
+    # Re-running refreshes rows instead of duplicating them
+    populate_calendar(date(2024, 1, 1), date(2024, 12, 31))
+    assert CalendarDate.query.filter_by(year=2024).count() == 366
+
+
+def test_ensure_calendar_extends_missing_days(database):
+    """Test a range outside the populated calendar is filled in on demand."""
+    populate_calendar(date(2030, 1, 1), date(2030, 12, 31))
+
+    assert ensure_calendar(date(2030, 6, 1), date(2030, 6, 30)) == 0
+    assert ensure_calendar(date(2030, 12, 1), date(2031, 1, 31)) == 62
+    assert CalendarDate.query.filter(CalendarDate.date >= date(2031, 1, 1)).count() == 31
+    assert database.session.get(CalendarDate, date(2031, 1, 1)).holiday_name == "New Year's Day"
+
+
+def test_populate_command(app, database):
+    """Test the calendar populate CLI command."""
+    runner = app.test_cli_runner()
+    result = runner.invoke(calendar_cli, ['populate', '--start-year', '2025', '--end-year', '2025'])
+
+    assert 'Populated 365 calendar days' in result.output
+    assert CalendarDate.query.filter_by(year=2025).count() == 365
+
+
+def test_day_match_joins_datetime_rows(database):
+    """Test a gap-filled trend picks up rows stored as DateTime, end day included."""
+    populate_calendar(date(2024, 1, 1), date(2024, 1, 31))
+    database.session.add_all([
+        BusinessReport(
+            store_id=1, date=day, sku='SKU-1', asin='B000000001', title='Item',
+            sessions=10, units_ordered=2, ordered_product_sales=Decimal(sales)
+        )
+        for day, sales in ((datetime(2024, 1, 3), '10.00'), (datetime(2024, 1, 5, 18, 30), '25.50'))
+    ])
+    database.session.flush()
+
+    rows = database.session.execute(text(f"""
+        SELECT dates.date, COALESCE(SUM(ordered_product_sales), 0)
+        FROM (
+            SELECT date FROM calendar_dates
+            WHERE date BETWEEN date(:start_date) AND date(:end_date)
+        ) AS dates
+        LEFT JOIN business_reports ON
+            {day_match_sql('business_reports.date', 'dates.date')}
+            AND business_reports.store_id = 1
+        GROUP BY dates.date
+        ORDER BY dates.date
+    """), {'start_date': '2024-01-03', 'end_date': '2024-01-05'}).all()
+
+    assert [(day, float(revenue)) for day, revenue in rows] == [
+        ('2024-01-03', 10.0), ('2024-01-04', 0.0), ('2024-01-05', 25.5)
+    ]
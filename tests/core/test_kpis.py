@@ -0,0 +1,111 @@
+"""Test cases for shared KPI aggregates."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from app.core.analytics.kpis import (
+    advertising_kpis, business_kpis, dashboard_kpis, inventory_kpis, ratio
+)
+from app.modules.advertising.dimensions import resolve_dimensions
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.advertising.services import AdvertisingReportService
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.models import InventoryReport
+
+
+def _inventory(date, sku, afn, mfn, unsellable):
+    return InventoryReport(
+        store_id=1, date=date, sku=sku, asin=sku, product_name=sku,
+        condition='New', price=Decimal('10.00'),
+        mfn_listing_exists=True, mfn_fulfillable_quantity=mfn,
+        afn_listing_exists=True, afn_warehouse_quantity=afn + unsellable,
+        afn_fulfillable_quantity=afn, afn_unsellable_quantity=unsellable,
+        afn_reserved_quantity=1, afn_total_quantity=afn + unsellable,
+        per_unit_volume=Decimal('0.1000')
+    )
+
+
+@pytest.fixture
+def kpi_reports(database):
+    """Create a few rows in each report table."""
+    df = pd.DataFrame({
+        'store_id': [1, 1],
+        'campaign_name': ['Brand', 'Brand'],
+        'ad_group_name': ['Group', 'Group'],
+        'search_term': ['term a', 'term b']
+    })
+    resolve_dimensions(df)
+
+    rows = [
+        AdvertisingReport(
+            store_id=1, date=datetime(2024, 1, 5),
+            campaign_id=int(row.campaign_id), ad_group_id=int(row.ad_group_id),
+            search_term_id=int(row.search_term_id),
+            targeting_type='manual', match_type='exact',
+            impressions=1000, clicks=20, spend=Decimal('10.00'),
+            total_sales=Decimal('40.00'), total_orders=2, total_units=2
+        )
+        for row in df.itertuples()
+    ]
+    rows += [
+        BusinessReport(
+            store_id=1, date=datetime(2024, 1, day), sku=f'SKU{day}', asin=f'ASIN{day}',
+            title='Product', sessions=50, units_ordered=5,
+            ordered_product_sales=Decimal('100.00'), total_order_items=4
+        )
+        for day in (5, 6)
+    ]
+    rows += [
+        _inventory(datetime(2024, 1, 1), 'OLD', 99, 99, 99),
+        _inventory(datetime(2024, 1, 6), 'A', 10, 5, 2),
+        _inventory(datetime(2024, 1, 6), 'B', 20, 0, 0),
+    ]
+    database.session.add_all(rows)
+    database.session.flush()
+    return rows
+
+
+def test_ratio():
+    """Test ratios guard against zero denominators."""
+    assert ratio(1, 4, 100) == 25.0
+    assert ratio(5, 0) == 0.0
+
+
+def test_advertising_kpis(kpi_reports):
+    """Test advertising totals and derived ratios."""
+    kpis = advertising_kpis(1, datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+    assert kpis['rows'] == 2
+    assert kpis['total_spend'] == 20.0
+    assert kpis['total_impressions'] == 2000
+    assert kpis['roas'] == 4.0
+    assert kpis['acos'] == 25.0
+    assert kpis['ctr'] == 2.0
+    assert kpis['cpc'] == 0.5
+
+
+def test_business_and_inventory_kpis(kpi_reports):
+    """Test sales totals and the latest inventory snapshot."""
+    business = business_kpis(1, datetime(2024, 1, 1), datetime(2024, 1, 31))
+    assert business['total_sales'] == 200.0
+    assert business['total_orders'] == 8
+    assert business['conversion_rate'] == 10.0
+    assert business['average_order_value'] == 25.0
+
+    inventory = inventory_kpis(1)
+    assert inventory['skus'] == 2
+    assert inventory['fulfillable_quantity'] == 35
+    assert inventory['unsellable_quantity'] == 2
+
+
+def test_kpis_without_data(database):
+    """Test an empty store returns zero totals."""
+    kpis = dashboard_kpis(1, end_date=datetime(2024, 1, 31))
+
+    assert kpis['business']['rows'] == 0
+    assert kpis['advertising']['roas'] == 0.0
+    assert kpis['inventory']['skus'] == 0
+    assert AdvertisingReportService.get_performance_metrics(1)['error']
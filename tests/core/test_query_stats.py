@@ -0,0 +1,89 @@
+"""Test cases for per-request query tracking."""
+
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from app import create_app
+from app.core.query_stats import assert_max_queries, statement_shape, track_queries
+from app.extensions import db
+
+
+@pytest.fixture
+def tracked_app():
+    """A separate app with one route that runs a query per row."""
+    app = create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'query-stats',
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'QUERY_REPEAT_THRESHOLD': 5,
+    })
+
+    @app.route('/rows/<int:count>')
+    def rows(count):
+        values = [db.session.execute(text('SELECT :n'), {'n': n}).scalar() for n in range(count)]
+        return {'rows': values}
+
+    return app
+
+
+def test_statement_shape():
+    """Test literals and IN lists collapse so per-row queries share a shape."""
+    assert statement_shape("SELECT * FROM t WHERE id = 12 AND name = 'a''b'") == \
+        'SELECT * FROM t WHERE id = ? AND name = ?'
+    assert statement_shape('SELECT *\n  FROM t WHERE id IN (?, ?, ?)') == 'SELECT * FROM t WHERE id IN (...)'
+    assert statement_shape('SELECT anon_1.id FROM t AS anon_1') == 'SELECT anon_1.id FROM t AS anon_1'
+
+
+def test_track_queries_counts_repeated_shapes(app):
+    """Test counts, timings and repeated shapes, including nested collectors."""
+    with track_queries() as outer:
+        db.session.execute(text('SELECT 1 AS one')).scalar()
+        with track_queries() as inner:
+            for n in range(3):
+                db.session.execute(text('SELECT :n'), {'n': n}).scalar()
+
+    assert (outer.count, inner.count) == (4, 3)
+    assert outer.duration >= inner.duration > 0
+    assert inner.repeated(3) == [('SELECT ?', 3)]
+    assert inner.repeated(4) == []
+    assert outer.shapes == {'SELECT ? AS one': 1, 'SELECT ?': 3}
+
+
+def test_assert_max_queries(app):
+    """Test query budgets fail with the statements that ran."""
+    with assert_max_queries(2):
+        db.session.execute(text('SELECT 1'))
+
+    with pytest.raises(AssertionError, match=r'3 queries executed, at most 2 expected:\n    3 x SELECT \?'):
+        with assert_max_queries(2):
+            for n in range(3):
+                db.session.execute(text('SELECT :n'), {'n': n})
+
+
+def test_request_reports_queries(tracked_app, caplog):
+    """Test the Server-Timing header and the N+1 warning."""
+    client = tracked_app.test_client()
+
+    with caplog.at_level(logging.WARNING, logger='app.core.query_stats'):
+        response = client.get('/rows/2')
+    assert response.headers['Server-Timing'].startswith('db;dur=')
+    assert response.headers['Server-Timing'].endswith(';desc="2 queries"')
+    assert not caplog.records
+
+    with caplog.at_level(logging.WARNING, logger='app.core.query_stats'):
+        response = client.get('/rows/6')
+    assert response.headers['Server-Timing'].endswith(';desc="6 queries"')
+    assert caplog.messages == ['Possible N+1 in GET /rows/6: 6 x SELECT ?']
+
+
+def test_tracking_can_be_disabled():
+    """Test QUERY_STATS_ENABLED turns the request hooks off."""
+    app = create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'query-stats',
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'QUERY_STATS_ENABLED': False,
+    })
+    assert 'Server-Timing' not in app.test_client().get('/auth/login').headers
@@ -0,0 +1,118 @@
+"""Test cases for the slow-query log."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from app import create_app
+from app.core.slow_queries import SlowQueryLog, _query_plan, get_slow_query_log
+from app.extensions import db
+from app.modules.auth.models import User
+from app.modules.uploaded_data.listing import list_reports
+
+
+@pytest.fixture
+def slow_app(tmp_path):
+    """A separate app that records every statement."""
+    app = create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'slow-queries',
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'SLOW_QUERY_MS': 0,
+        'SLOW_QUERY_LOG': str(tmp_path / 'slow.jsonl'),
+    })
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def test_log_rotates_and_reads_newest_first(tmp_path):
+    """Test size rotation keeps the configured number of backups."""
+    log = SlowQueryLog(str(tmp_path / 'slow.jsonl'), max_bytes=60, backups=2)
+    for n in range(6):
+        log.append({'n': n, 'statement': 'SELECT 1'})
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'slow.jsonl', 'slow.jsonl.1', 'slow.jsonl.2', 'slow.jsonl.lock'
+    ]
+    # One record per file at this size, the oldest three are gone
+    assert [record['n'] for record in log.records()] == [5, 4, 3]
+    assert [record['n'] for record in log.records(limit=2)] == [5, 4]
+
+
+def _append_records(path, worker):
+    log = SlowQueryLog(path, max_bytes=200, backups=1000)
+    for n in range(200):
+        log.append({'worker': worker, 'n': n})
+
+
+def test_processes_sharing_the_log_keep_every_record(tmp_path):
+    """Test rotation by several processes neither loses nor overwrites files."""
+    path = str(tmp_path / 'slow.jsonl')
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_append_records, [path] * 4, range(4)))
+
+    records = SlowQueryLog(path, backups=1000).records(limit=1000)
+    assert sorted((record['worker'], record['n']) for record in records) == [
+        (worker, n) for worker in range(4) for n in range(200)
+    ]
+
+
+def test_failed_explain_keeps_the_transaction(slow_app):
+    """Test a failing EXPLAIN is rolled back to its savepoint only."""
+    with slow_app.app_context():
+        user = User(username='pending', email='pending@example.com')
+        user.set_password('password')
+        db.session.add(user)
+        db.session.flush()
+
+        dbapi_connection = db.session.connection().connection.dbapi_connection
+        plan = _query_plan('sqlite', dbapi_connection.cursor(), 'SELECT * FROM missing_table', ())
+
+        assert plan[0].startswith('EXPLAIN failed: OperationalError')
+        assert dbapi_connection.in_transaction
+        assert User.query.filter_by(username='pending').count() == 1
+        db.session.rollback()
+        assert User.query.filter_by(username='pending').count() == 0
+
+
+def test_slow_statements_are_recorded_with_plan_and_caller(slow_app):
+    """Test records carry parameters, elapsed time, plan and app frames."""
+    with slow_app.app_context():
+        list_reports('business', 7, asin='B0TEST')
+        record = get_slow_query_log(slow_app).records(limit=1)[0]
+
+    assert record['statement'].startswith('SELECT business_reports.id')
+    assert "'B0TEST'" in record['parameters'] and '7' in record['parameters']
+    assert record['elapsed_ms'] >= 0
+    assert any('business_reports' in line for line in record['plan'])
+    assert any(line.startswith('app/modules/uploaded_data/listing.py:') and line.endswith('in list_reports')
+               for line in record['stack'])
+
+
+def test_admin_can_read_the_log(slow_app):
+    """Test the admin page and API list records and reject other users."""
+    with slow_app.app_context():
+        admin = User(username='admin', email='admin@example.com', role='admin')
+        admin.set_password('password')
+        user = User(username='user', email='user@example.com')
+        user.set_password('password')
+        db.session.add_all([admin, user])
+        db.session.commit()
+        admin_id, user_id = admin.id, user.id
+
+    client = slow_app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+    assert client.get('/admin/api/slow-queries').status_code == 403
+
+    with client.session_transaction() as session:
+        session['_user_id'] = str(admin_id)
+    response = client.get('/admin/api/slow-queries?limit=5')
+    assert response.status_code == 200
+    assert len(response.json['records']) == 5
+    assert all(record['statement'] for record in response.json['records'])
+
+    page = client.get('/admin/slow-queries')
+    assert page.status_code == 200
+    assert b'Statements over 0 ms' in page.data
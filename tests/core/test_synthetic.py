@@ -0,0 +1,89 @@
+"""Test cases for the synthetic benchmark data generator."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from app.core.synthetic.generator import (
+    SYNTHETIC_REPORTS, build_catalog, generate_dataset, generate_frames, resolve_scale
+)
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.models import CurrentInventory, InventoryChange
+from app.modules.returns.models import ReturnRateFact, ReturnReport
+from app.modules.upload_csv.processors import (
+    AdvertisingCSVProcessor, BusinessCSVProcessor, InventoryCSVProcessor, ReturnCSVProcessor
+)
+
+END_DATE = date(2024, 12, 31)
+
+
+def frames(report_type, seed=1, **options):
+    """All rows of a small dataset as one DataFrame."""
+    options.setdefault('batch_size', 500)
+    return pd.concat(generate_frames(report_type, [1, 2], 2000, END_DATE, days=40, seed=seed, **options),
+                     ignore_index=True)
+
+
+def test_generation_is_deterministic():
+    """Test equal seeds give equal rows and batching does not change them."""
+    for report_type in SYNTHETIC_REPORTS:
+        first = frames(report_type)
+        pd.testing.assert_frame_equal(first, frames(report_type))
+        assert not first.equals(frames(report_type, seed=2))
+
+    pd.testing.assert_frame_equal(frames('business'), frames('business', batch_size=10_000))
+
+
+def test_row_counts_and_scales():
+    """Test daily reports cover whole catalogs and returns hit the target."""
+    business = frames('business')
+    assert len(business) == 2 * 40 * 25
+    assert business.groupby('store_id')['date'].nunique().tolist() == [40, 40]
+    assert len(frames('returns')) == 2000
+
+    assert resolve_scale('10m') == 10_000_000
+    assert resolve_scale('25_000') == 25_000
+    with pytest.raises(ValueError):
+        resolve_scale('huge')
+
+
+def test_long_tail_and_seasonality():
+    """Test demand concentrates on best sellers and peaks in Cyber Week."""
+    catalog = build_catalog(0, 1000, seed=1)
+    top_share = catalog['sessions'].head(100).sum() / catalog['sessions'].sum()
+    assert top_share > 0.7
+
+    business = pd.concat(generate_frames('business', [1], 20_000, date(2024, 12, 10), days=60, seed=1))
+    daily = business.groupby('date')['sessions'].sum()
+    assert daily[pd.Timestamp(2024, 12, 2)] > daily[pd.Timestamp(2024, 10, 22)] * 2  # Cyber Monday vs. a Tuesday
+
+
+@pytest.mark.parametrize('report_type, processor', [
+    ('business', BusinessCSVProcessor),
+    ('advertising', AdvertisingCSVProcessor),
+    ('inventory', InventoryCSVProcessor),
+    ('returns', ReturnCSVProcessor),
+])
+def test_csv_files_pass_upload_validation(tmp_path, report_type, processor):
+    """Test generated CSV files are accepted by the upload processors."""
+    generate_dataset([report_type], [1], 300, END_DATE, days=10, output_dir=str(tmp_path))
+
+    df = pd.read_csv(tmp_path / f'{report_type}_report.csv')
+    assert len(df) > 0
+    assert processor().validate_data(df) == (True, [])
+
+
+def test_load_into_database(database):
+    """Test bulk loads fill the report tables and their derived tables."""
+    counts = generate_dataset(['business', 'inventory', 'returns'], [1], 300, END_DATE, days=10, load=True)
+
+    try:
+        assert BusinessReport.query.filter_by(store_id=1).count() == counts['business'] == 300
+        assert ReturnReport.query.filter_by(store_id=1).count() == 300
+        assert CurrentInventory.query.filter_by(store_id=1).count() == 30
+        assert ReturnRateFact.query.filter_by(store_id=1).count() > 0
+    finally:
+        for model in (ReturnRateFact, InventoryChange, CurrentInventory):
+            model.query.filter_by(store_id=1).delete()
+        database.session.commit()
@@ -0,0 +1,202 @@
+"""Test cases for the Prometheus metrics registry and endpoint."""
+
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.cache import Cache
+from app.core.jobs import submit_job
+from app.core import telemetry
+from app.core.telemetry import CACHE_LOOKUPS, DB_POOL_SIZE, JOBS, MetricsRegistry, _watch_pool, registry
+
+
+def _define(metrics_registry):
+    """The same metrics in every simulated worker process."""
+    return (
+        metrics_registry.counter('uploads_total', 'Uploads', ['report_type']),
+        metrics_registry.gauge('workers_busy', 'Busy workers'),
+        metrics_registry.histogram('upload_seconds', 'Upload time', buckets=(1, 5)),
+    )
+
+
+def _worker(directory):
+    """Record values in a separate process and exit."""
+    uploads, busy, seconds = _define(MetricsRegistry(directory))
+    uploads.inc(2, report_type='business')
+    busy.set(3)
+    seconds.observe(4)
+    uploads.registry.flush()
+
+
+def _run_worker(directory):
+    worker = multiprocessing.get_context('fork').Process(target=_worker, args=(directory,))
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+
+
+def _value(metric, **labels):
+    return registry.collect()[metric.name].get(tuple(str(labels[name]) for name in metric.labelnames), 0)
+
+
+def test_render_text_format():
+    """Test counters, gauges and cumulative histogram buckets."""
+    metrics = MetricsRegistry()
+    uploads, busy, seconds = _define(metrics)
+    uploads.inc(report_type='busi"ness')
+    uploads.inc(2, report_type='busi"ness')
+    busy.set(1)
+    busy.dec()
+    for value in (0.5, 2, 7):
+        seconds.observe(value)
+
+    assert metrics.render().splitlines() == [
+        '# HELP uploads_total Uploads',
+        '# TYPE uploads_total counter',
+        'uploads_total{report_type="busi\\"ness"} 3.0',
+        '# HELP workers_busy Busy workers',
+        '# TYPE workers_busy gauge',
+        'workers_busy 0.0',
+        '# HELP upload_seconds Upload time',
+        '# TYPE upload_seconds histogram',
+        'upload_seconds_bucket{le="1.0"} 1.0',
+        'upload_seconds_bucket{le="5.0"} 2.0',
+        'upload_seconds_bucket{le="+Inf"} 3.0',
+        'upload_seconds_sum 9.5',
+        'upload_seconds_count 3.0',
+    ]
+
+    with pytest.raises(ValueError):
+        uploads.inc(-1, report_type='business')
+    with pytest.raises(ValueError):
+        uploads.inc(store='1')
+
+
+def test_values_add_up_across_processes(tmp_path):
+    """Test a scrape sums worker files and drops gauges of exited workers."""
+    _run_worker(str(tmp_path))
+
+    metrics = MetricsRegistry(str(tmp_path))
+    uploads, busy, seconds = _define(metrics)
+    uploads.inc(report_type='business')
+    busy.set(1)
+    seconds.observe(0.5)
+
+    values = metrics.collect()
+    assert values['uploads_total'] == {('business',): 3.0}
+    assert values['workers_busy'] == {(): 1.0}
+    assert values['upload_seconds'] == {(): [1, 1, 0, 4.5]}
+
+
+def test_exited_workers_are_folded_into_retained_totals(tmp_path):
+    """Test files of exited workers are removed without losing their counts."""
+    metrics = MetricsRegistry(str(tmp_path))
+    uploads, busy, seconds = _define(metrics)
+    _run_worker(str(tmp_path))
+    assert metrics.collect()['uploads_total'] == {('business',): 2.0}
+
+    _run_worker(str(tmp_path))
+    values = metrics.collect()
+    assert values['uploads_total'] == {('business',): 4.0}
+    assert values['workers_busy'] == {}
+    assert values['upload_seconds'] == {(): [0, 2, 0, 8.0]}
+    assert sorted(os.listdir(tmp_path)) == ['.lock', os.path.basename(metrics.path), 'retained.json']
+
+
+def test_reused_pid_folds_the_old_file(tmp_path):
+    """Test a process with the PID of an exited one keeps that one's counts."""
+    exited = MetricsRegistry(str(tmp_path))
+    _define(exited)[0].inc(5, report_type='business')
+    exited.flush()
+
+    metrics = MetricsRegistry(str(tmp_path))
+    uploads = _define(metrics)[0]
+    uploads.inc(report_type='business')
+    metrics.flush()
+
+    assert not os.path.exists(exited.path)
+    assert metrics.collect()['uploads_total'] == {('business',): 6.0}
+
+
+def test_idle_process_flushes_in_background(tmp_path, monkeypatch):
+    """Test a change is written without a later change or an explicit flush."""
+    monkeypatch.setattr(telemetry, 'METRICS_FLUSH_INTERVAL', 0.01)
+    metrics = MetricsRegistry(str(tmp_path))
+    _define(metrics)[0].inc(report_type='business')
+
+    deadline = time.monotonic() + 5
+    while not os.path.exists(metrics.path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with open(metrics.path) as f:
+        assert json.load(f)['metrics']['uploads_total'] == [[['business'], 1.0]]
+
+
+def test_cache_and_job_metrics(app):
+    """Test cache lookups, expiry evictions and finished jobs are counted."""
+    cache = Cache()
+    hits, misses = _value(CACHE_LOOKUPS, namespace='telemetry', result='hit'), \
+        _value(CACHE_LOOKUPS, namespace='telemetry', result='miss')
+    cache.set('telemetry:a', 1)
+    cache.get('telemetry:a')
+    cache.get('telemetry:b')
+    assert _value(CACHE_LOOKUPS, namespace='telemetry', result='hit') == hits + 1
+    assert _value(CACHE_LOOKUPS, namespace='telemetry', result='miss') == misses + 1
+
+    completed = _value(JOBS, status='completed')
+    app.config['JOB_EXECUTOR'] = 'sync'
+    try:
+        assert submit_job(lambda value: value * 2, 21) == 42
+    finally:
+        app.config.pop('JOB_EXECUTOR')
+    assert _value(JOBS, status='completed') == completed + 1
+
+
+def test_pool_size_is_set_on_first_checkout(tmp_path):
+    """Test the pool size is reported once used, also after a fork reset."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=3)
+    _watch_pool('telemetry', engine.pool)
+    assert ('telemetry',) not in DB_POOL_SIZE.values
+
+    try:
+        engine.connect().close()
+        assert _value(DB_POOL_SIZE, bind='telemetry') == 3
+
+        # What a forked worker starts from
+        DB_POOL_SIZE.values.clear()
+        engine.connect().close()
+        assert _value(DB_POOL_SIZE, bind='telemetry') == 3
+    finally:
+        DB_POOL_SIZE.values.pop(('telemetry',), None)
+        engine.dispose()
+
+
+def test_metrics_endpoint(app, client):
+    """Test the scrape output and the optional bearer token."""
+    client.get('/metrics')
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type == 'text/plain; version=0.0.4; charset=utf-8'
+    body = response.get_data(as_text=True)
+    assert 'http_requests_total{endpoint="metrics",method="GET",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{endpoint="metrics",method="GET",le="+Inf"}' in body
+    assert '# TYPE ingest_chunk_duration_seconds histogram' in body
+    assert '# TYPE db_pool_connections_in_use gauge' in body
+
+    app.config['METRICS_TOKEN'] = 'scrape-token'
+    try:
+        assert client.get('/metrics').status_code == 401
+        assert client.get('/metrics', headers={'Authorization': 'Bearer scrape-token'}).status_code == 200
+    finally:
+        app.config.pop('METRICS_TOKEN')
+
+    # Outside debug and testing a token is required
+    app.config['TESTING'] = False
+    try:
+        assert client.get('/metrics').status_code == 403
+    finally:
+        app.config['TESTING'] = True
@@ -0,0 +1,94 @@
+"""Test cases for advertising routes."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.modules.advertising.dimensions import resolve_dimensions
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.auth.models import User
+from app.modules.stores.models import Store
+
+
+@pytest.fixture
+def leaderboard_client():
+    """A client logged in to a separate app with one store's search terms."""
+    app = create_app({
+        'TESTING': True,
+        'SECRET_KEY': 'advertising-routes',
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+    })
+    with app.app_context():
+        db.create_all()
+        user = User(username='advertiser', email='advertiser@example.com')
+        user.set_password('password')
+        db.session.add(user)
+        db.session.flush()
+        store = Store(name='Store', marketplace='US', user_id=user.id)
+        db.session.add(store)
+        db.session.flush()
+        user.active_store_id = store.id
+
+        df = pd.DataFrame({
+            'store_id': store.id,
+            'campaign_name': ['Brand', 'Brand', 'Generic'],
+            'ad_group_name': 'Group',
+            'search_term': ['term a', 'term b', 'term c'],
+        })
+        resolve_dimensions(df)
+        db.session.add_all([
+            AdvertisingReport(
+                store_id=store.id, date=datetime(2024, 1, 5),
+                campaign_id=row.campaign_id, ad_group_id=row.ad_group_id,
+                search_term_id=row.search_term_id, targeting_type='manual', match_type='exact',
+                impressions=impressions, clicks=10, spend=Decimal(spend),
+                total_sales=Decimal('40.00'), total_orders=1, total_units=1
+            )
+            for row, impressions, spend in zip(df.itertuples(), (1000, 500, 200), ('25.00', '15.00', '5.00'))
+        ])
+        db.session.commit()
+        user_id = user.id
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+    return client
+
+
+def test_leaderboard_json_shape(leaderboard_client):
+    """Test the leaderboard returns ranked items with pagination info."""
+    response = leaderboard_client.get('/advertising/leaderboard?metric=spend&limit=2')
+
+    assert response.status_code == 200
+    board = response.json
+    assert (board['dimension'], board['metric'], board['order'], board['page']) == ('search_term', 'spend', 'desc', 1)
+    assert [(item['rank'], item['name']) for item in board['items']] == [(1, 'term a'), (2, 'term b')]
+    assert {'impressions', 'clicks', 'spend', 'sales', 'orders', 'acos', 'roas'} <= set(board['items'][0])
+    assert board['items'][0]['spend'] == 25.0
+    assert (board['total'], board['pages']) == (3, 2)
+
+    response = leaderboard_client.get('/advertising/leaderboard?metric=spend&order=asc&limit=1&page=2')
+    assert [item['name'] for item in response.json['items']] == ['term b']
+
+
+def test_leaderboard_date_range_includes_end_day(leaderboard_client):
+    """Test the end date covers the whole day of DateTime report rows."""
+    response = leaderboard_client.get('/advertising/leaderboard?start_date=2024-01-05&end_date=2024-01-05')
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json['items']] == ['term a', 'term b', 'term c']
+
+    response = leaderboard_client.get('/advertising/leaderboard?start_date=2024-01-06')
+    assert response.json['items'] == []
+
+
+@pytest.mark.parametrize('query', ['metric=title', 'dimension=asin', 'end_date=2024-13-01'])
+def test_leaderboard_rejects_invalid_parameters(leaderboard_client, query):
+    """Test unsupported metrics and dimensions are a 400."""
+    response = leaderboard_client.get(f'/advertising/leaderboard?{query}')
+
+    assert response.status_code == 400
+    assert response.json['error']
@@ -0,0 +1,229 @@
+"""Test cases for advertising services."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from app.modules.advertising.dimensions import resolve_dimensions
+from app.modules.advertising.models import AdCampaign, AdSearchTerm, AdvertisingReport
+from app.modules.advertising.services import (
+    AdvertisingReportService, get_advertising_trends, get_campaigns
+)
+
+
+ROW_FIELDS = ['date', 'campaign_name', 'search_term', 'impressions', 'clicks',
+              'spend', 'sales', 'orders', 'units']
+
+
+def _reports(rows):
+    """Build reports, resolving dimension names the way ingest does."""
+    df = pd.DataFrame([dict(zip(ROW_FIELDS, row)) for row in rows])
+    df['store_id'] = 1
+    df['ad_group_name'] = 'Group'
+    resolve_dimensions(df)
+
+    return [
+        AdvertisingReport(
+            store_id=1,
+            date=row.date,
+            campaign_id=row.campaign_id,
+            ad_group_id=row.ad_group_id,
+            search_term_id=row.search_term_id,
+            targeting_type='manual',
+            match_type='exact',
+            impressions=row.impressions,
+            clicks=row.clicks,
+            spend=Decimal(row.spend),
+            total_sales=Decimal(row.sales),
+            total_orders=row.orders,
+            total_units=row.units
+        )
+        for row in df.itertuples()
+    ]
+
+
+@pytest.fixture
+def advertising_reports(database):
+    """Create search-term level rows across two periods."""
+    reports = _reports([
+        # Previous period
+        (datetime(2024, 1, 1), 'Brand', 'old term', 100, 5, '10.00', '20.00', 1, 1),
+        # Current period
+        (datetime(2024, 1, 5), 'Brand', 'term a', 1000, 50, '25.00', '100.00', 2, 3),
+        (datetime(2024, 1, 5), 'Brand', 'term b', 500, 25, '15.00', '60.00', 1, 1),
+        (datetime(2024, 1, 5), 'Generic', 'term c', 200, 10, '10.00', '0.00', 0, 0),
+        (datetime(2024, 1, 6), 'Generic', 'term c', 300, 0, '0.00', '0.00', 0, 0),
+    ])
+    database.session.add_all(reports)
+    database.session.flush()
+    return reports
+
+
+def test_trends_grouped_by_day(advertising_reports):
+    """Test daily totals and derived metrics."""
+    data = get_advertising_trends(1, '2024-01-04', '2024-01-07')
+
+    assert data['labels'] == ['2024-01-05', '2024-01-06']
+    assert data['impressions'] == [1700, 300]
+    assert data['clicks'] == [85, 0]
+    assert data['spend'] == [50.0, 0.0]
+    assert data['sales'] == [160.0, 0.0]
+    assert data['orders'] == [3, 0]
+    assert data['units'] == [4, 0]
+    assert data['acos'][0] == pytest.approx(31.25)
+    assert data['roas'][1] == 0
+    assert data['total_spend'] == 50.0
+
+
+def test_trends_previous_period(advertising_reports):
+    """Test previous period totals and growth."""
+    data = get_advertising_trends(1, '2024-01-04', '2024-01-07')
+
+    assert data['previous_spend'] == 10.0
+    assert data['previous_sales'] == 20.0
+    assert data['spend_growth'] == pytest.approx(400.0)
+
+
+def test_trends_campaign_filter(advertising_reports):
+    """Test filtering by campaign name."""
+    data = get_advertising_trends(1, '2024-01-04', '2024-01-07', campaign='Generic')
+
+    assert data['impressions'] == [200, 300]
+    assert data['previous_spend'] == 0
+
+
+def test_trends_empty_period(advertising_reports):
+    """Test a window without rows returns the empty structure."""
+    data = get_advertising_trends(1, '2023-06-01', '2023-06-30')
+
+    assert data['labels'] == []
+    assert data['total_spend'] == 0
+
+
+def test_get_campaigns(advertising_reports):
+    """Test campaigns are listed by name."""
+    names = sorted(c['name'] for c in get_campaigns(1))
+
+    assert names == ['Brand', 'Generic']
+
+
+def test_advertising_data_sections(advertising_reports):
+    """Test all sections are built from per-day and per-campaign totals."""
+    service = AdvertisingReportService(1)
+    data = service.get_advertising_data(
+        start_date=datetime(2024, 1, 4), end_date=datetime(2024, 1, 7)
+    )
+
+    assert data['performance']['labels'] == ['2024-01-05', '2024-01-06']
+    assert data['performance']['spend'] == [50.0, 0.0]
+    assert data['performance']['acos'] == [31.25, 0]
+    assert data['metrics']['impressions'] == [1700, 300]
+    assert data['summary']['total_sales'] == 160.0
+    assert data['summary']['clicks'] == 85
+
+    campaigns = {c['name']: c for c in data['campaigns']}
+    assert campaigns['Brand']['impressions'] == 1500
+    assert campaigns['Brand']['acos'] == 25.0
+    assert campaigns['Generic']['impressions'] == 500
+    assert campaigns['Generic']['status'] == 'Active'
+
+
+def test_advertising_data_filters(advertising_reports):
+    """Test campaign filter and empty results."""
+    service = AdvertisingReportService(1)
+
+    data = service.get_advertising_data(campaign='Generic')
+    assert [c['name'] for c in data['campaigns']] == ['Generic']
+
+    empty = service.get_advertising_data(start_date=datetime(2030, 1, 1))
+    assert empty['performance']['labels'] == []
+    assert empty['summary']['total_spend'] == 0
+
+
+def test_resolve_dimensions_reuses_ids(advertising_reports):
+    """Test names resolve to the same ids and are stored once."""
+    df = pd.DataFrame({
+        'store_id': [1, 1, 2],
+        'campaign_name': ['Brand', 'New', 'Brand'],
+        'ad_group_name': ['Group', 'Group', 'Group'],
+        'search_term': ['term a', 'term a', 'term z']
+    })
+    resolve_dimensions(df)
+
+    brand = AdCampaign.query.filter_by(store_id=1, name='Brand').one()
+    assert df['campaign_id'][0] == brand.id
+    assert df['campaign_id'][2] != brand.id  # Campaigns are per store
+    assert df['ad_group_id'][0] == advertising_reports[1].ad_group_id
+    assert df['search_term_id'][0] == df['search_term_id'][1] == advertising_reports[1].search_term_id
+    assert AdSearchTerm.query.filter_by(term='term a').count() == 1
+
+
+def test_report_name_accessors(advertising_reports):
+    """Test reports still expose names and can be filtered by them."""
+    report = advertising_reports[1]
+
+    assert report.campaign_name == 'Brand'
+    assert report.ad_group_name == 'Group'
+    assert report.search_term == 'term a'
+    assert report.to_dict()['campaign_name'] == 'Brand'
+    assert AdvertisingReport.query.filter(AdvertisingReport.campaign_name == 'Generic').count() == 2
+
+
+def test_service_campaigns_and_ad_groups(advertising_reports):
+    """Test campaign and ad group lists come from the dimensions."""
+    service = AdvertisingReportService(1)
+
+    campaigns = {c['name']: c['ad_count'] for c in service.get_campaigns()}
+    assert campaigns == {'Brand': 3, 'Generic': 2}
+    assert service.get_ad_groups(campaign='Generic') == [{'name': 'Group', 'ad_count': 2}]
+    assert service.get_advertising_data(ad_group='Group')['summary']['impressions'] == 2100
+
+
+def test_leaderboard_top_search_terms(advertising_reports):
+    """Test top-N search terms by spend within a date range."""
+    service = AdvertisingReportService(1)
+    board = service.get_leaderboard(
+        metric='spend', limit=2,
+        start_date=datetime(2024, 1, 4), end_date=datetime(2024, 1, 7)
+    )
+
+    assert [item['name'] for item in board['items']] == ['term a', 'term b']
+    assert board['items'][0]['rank'] == 1
+    assert board['items'][0]['acos'] == 25.0
+    assert board['total'] == 3
+    assert board['pages'] == 2
+
+    second_page = service.get_leaderboard(
+        metric='spend', limit=2, page=2,
+        start_date=datetime(2024, 1, 4), end_date=datetime(2024, 1, 7)
+    )
+    assert [(item['rank'], item['name']) for item in second_page['items']] == [(3, 'term c')]
+
+
+def test_leaderboard_ratio_order_and_threshold(advertising_reports):
+    """Test bottom-N by a ratio, NULL ratios last and min impressions."""
+    service = AdvertisingReportService(1)
+
+    board = service.get_leaderboard(metric='acos', order='asc')
+    names = [item['name'] for item in board['items']]
+    assert names[-1] == 'term c'  # No sales, ACoS undefined
+    assert board['items'][-1]['acos'] is None
+
+    board = service.get_leaderboard(metric='impressions', min_impressions=500)
+    assert board['items'][0]['name'] == 'term a'
+    assert sorted(item['name'] for item in board['items']) == ['term a', 'term b', 'term c']
+
+
+def test_leaderboard_by_campaign(advertising_reports):
+    """Test campaign leaderboard and argument validation."""
+    service = AdvertisingReportService(1)
+
+    board = service.get_leaderboard(dimension='campaign', metric='sales')
+    assert [(item['name'], item['sales']) for item in board['items']] == [('Brand', 180.0), ('Generic', 0.0)]
+
+    with pytest.raises(ValueError):
+        service.get_leaderboard(metric='title')
+    with pytest.raises(ValueError):
+        service.get_leaderboard(dimension='asin')
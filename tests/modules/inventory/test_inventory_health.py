@@ -0,0 +1,79 @@
+"""Test cases for the inventory health engine."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from app.modules.business.models import BusinessReport
+from app.modules.inventory.health import compute_inventory_health, get_inventory_health
+from app.modules.inventory.models import InventoryReport
+from app.modules.inventory.services import InventoryReportService
+from app.modules.inventory.snapshots import refresh_inventory_snapshots
+
+
+def _inventory(rows):
+    return pd.DataFrame([
+        {
+            'sku': sku, 'asin': sku, 'product_name': sku, 'price': Decimal('10.00'),
+            'mfn_fulfillable_quantity': 0, 'afn_fulfillable_quantity': quantity,
+            'afn_warehouse_quantity': quantity * 2, 'afn_unsellable_quantity': 0,
+            'afn_reserved_quantity': 0
+        }
+        for sku, quantity in rows
+    ])
+
+
+def test_compute_inventory_health():
+    """Test cover, stock-out date, reorder and status per SKU."""
+    inventory = _inventory([('FAST', 30), ('SLOW', 1000), ('IDLE', 5), ('GONE', 0), ('OK', 90)])
+    sales = pd.DataFrame({'sku': ['FAST', 'SLOW', 'GONE', 'OK'], 'units': [60, 30, 30, 60]})
+
+    health = compute_inventory_health(inventory, sales, date(2024, 1, 31)).set_index('sku')
+
+    assert health.loc['FAST', 'daily_velocity'] == 2.0
+    assert health.loc['FAST', 'days_of_cover'] == 15.0
+    assert health.loc['FAST', 'stockout_date'] == pd.Timestamp('2024-02-15')
+    assert health.loc['FAST', 'reorder_quantity'] == 90  # 60 days x 2/day - 30 on hand
+    assert health.loc['SLOW', 'status'] == 'overstock'
+    assert health.loc['OK', 'status'] == 'healthy'
+    assert health.loc['IDLE', 'status'] == 'no_sales'
+    assert pd.isna(health.loc['IDLE', 'days_of_cover'])
+    assert health.loc['GONE', 'status'] == 'out_of_stock'
+    assert health.loc['FAST', 'inventory_value'] == 300.0
+    assert health.loc['FAST', 'afn_utilization_rate'] == 50.0
+
+
+def test_inventory_health_from_database(database):
+    """Test the store's current inventory is joined with trailing sales."""
+    database.session.add_all([
+        InventoryReport(
+            store_id=1, date=datetime(2024, 1, 31), sku='A', asin='A', product_name='A',
+            condition='New', price=Decimal('5.00'), mfn_listing_exists=False,
+            mfn_fulfillable_quantity=0, afn_listing_exists=True, afn_warehouse_quantity=10,
+            afn_fulfillable_quantity=10, afn_unsellable_quantity=0, afn_reserved_quantity=0,
+            afn_total_quantity=10, per_unit_volume=Decimal('0.1000')
+        ),
+        BusinessReport(
+            store_id=1, date=datetime(2024, 1, 20), sku='A', asin='A', title='A',
+            sessions=10, units_ordered=30, ordered_product_sales=Decimal('150.00'), total_order_items=30
+        ),
+        BusinessReport(  # Outside the 30 day window
+            store_id=1, date=datetime(2023, 12, 1), sku='A', asin='A', title='A',
+            sessions=10, units_ordered=300, ordered_product_sales=Decimal('1500.00'), total_order_items=300
+        ),
+    ])
+    database.session.flush()
+    refresh_inventory_snapshots(1)
+
+    health = get_inventory_health(1)
+    assert health.loc[0, 'days_of_cover'] == 10.0
+    assert bool(health.loc[0, 'reorder']) is True
+
+    data = InventoryReportService(1).get_health(status='reorder')
+    assert data['summary']['statuses']['reorder'] == 1
+    assert data['items'][0]['stockout_date'] == '2024-02-10'
+
+    with pytest.raises(ValueError):
+        get_inventory_health(1, velocity_days=0)
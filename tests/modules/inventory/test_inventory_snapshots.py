@@ -0,0 +1,118 @@
+"""Test cases for current inventory and snapshot changes."""
+
+from datetime import datetime, time
+from decimal import Decimal
+
+import pytest
+
+from app.modules.inventory.models import CurrentInventory, InventoryChange, InventoryReport
+from app.modules.inventory.services import InventoryReportService
+from app.modules.inventory.snapshots import refresh_inventory_snapshots
+
+
+def _snapshot(day, sku, fulfillable, unsellable=0, name='Product'):
+    return InventoryReport(
+        store_id=1, date=datetime(2024, 1, day), sku=sku, asin=f'ASIN-{sku}', product_name=name,
+        condition='New', price=Decimal('10.00'),
+        mfn_listing_exists=False, mfn_fulfillable_quantity=0,
+        afn_listing_exists=True, afn_warehouse_quantity=fulfillable + unsellable,
+        afn_fulfillable_quantity=fulfillable, afn_unsellable_quantity=unsellable,
+        afn_reserved_quantity=0, afn_total_quantity=fulfillable + unsellable,
+        per_unit_volume=Decimal('0.1000')
+    )
+
+
+@pytest.fixture
+def snapshots(database):
+    """Create three daily snapshots of two SKUs."""
+    reports = [
+        _snapshot(1, 'A', 10), _snapshot(1, 'B', 5),
+        _snapshot(2, 'A', 10), _snapshot(2, 'B', 3, unsellable=1),
+        _snapshot(3, 'A', 7, name='Product v2'),
+    ]
+    database.session.add_all(reports)
+    database.session.flush()
+    refresh_inventory_snapshots(1)
+    return reports
+
+
+def test_current_inventory_holds_latest_row_per_sku(snapshots):
+    """Test each SKU keeps only its latest snapshot."""
+    service = InventoryReportService(1)
+    current = {row['sku']: row for row in service.get_current()['items']}
+
+    assert current['A']['date'] == '2024-01-03'
+    assert current['A']['afn_fulfillable_quantity'] == 7
+    assert current['B']['date'] == '2024-01-02'
+    assert service.get_skus() == [{'sku': 'A', 'name': 'Product v2'}, {'sku': 'B', 'name': 'Product'}]
+
+
+def test_snapshot_changes(snapshots):
+    """Test changes are recorded only when quantities move."""
+    changes = [(c['sku'], c['date'], c['fulfillable_change'], c['unsellable_change'])
+               for c in InventoryReportService(1).get_changes()['items']]
+
+    assert changes[:2] == [
+        ('A', '2024-01-03', -3, 0),
+        ('B', '2024-01-02', -2, 1),
+    ]
+    assert sorted(changes[2:]) == [
+        ('A', '2024-01-01', 10, 0),
+        ('B', '2024-01-01', 5, 0),
+    ]
+
+
+def test_current_and_changes_are_paged(snapshots):
+    """Test the lists follow their cursors through every row once."""
+    service = InventoryReportService(1)
+
+    first = service.get_current(limit=1)
+    second = service.get_current(cursor=first['next_cursor'], limit=1)
+    assert [row['sku'] for row in first['items'] + second['items']] == ['A', 'B']
+    assert second['has_more'] is False
+
+    changes, cursor = [], None
+    while True:
+        page = service.get_changes(cursor=cursor, limit=3)
+        changes.extend(page['items'])
+        if not page['has_more']:
+            break
+        cursor = page['next_cursor']
+    assert len(changes) == 4
+    assert [change['date'] for change in changes] == sorted((change['date'] for change in changes), reverse=True)
+
+
+def test_incremental_refresh(snapshots, database):
+    """Test refreshing touched SKUs from a date leaves older history alone."""
+    database.session.add(_snapshot(4, 'B', 9))
+    database.session.flush()
+
+    assert refresh_inventory_snapshots(1, ['B'], since=datetime(2024, 1, 4)) == 1
+
+    database.session.expire_all()
+    assert database.session.get(CurrentInventory, (1, 'B')).afn_fulfillable_quantity == 9
+    assert database.session.get(CurrentInventory, (1, 'A')).afn_fulfillable_quantity == 7
+    latest = InventoryChange.query.filter_by(sku='B').order_by(InventoryChange.date.desc()).first()
+    assert (latest.fulfillable_change, latest.previous_date) == (6, datetime(2024, 1, 2))
+    assert InventoryChange.query.filter_by(store_id=1).count() == 5
+
+
+def test_changes_end_date_covers_whole_day(snapshots):
+    """Test an inclusive end-of-day bound keeps changes dated that day."""
+    page = InventoryReportService(1).get_changes(
+        start_date=datetime(2024, 1, 2), end_date=datetime.combine(datetime(2024, 1, 3), time.max)
+    )
+
+    assert [(c['sku'], c['date']) for c in page['items']] == [('A', '2024-01-03'), ('B', '2024-01-02')]
+
+
+def test_snapshot_rows_are_paged(snapshots):
+    """Test raw snapshot rows come back a page at a time, newest first."""
+    service = InventoryReportService(1)
+
+    first = service.get_data(sku='A', limit=2)
+    second = service.get_data(sku='A', cursor=first['next_cursor'], limit=2)
+
+    assert [row['date'] for row in first['items']] == ['2024-01-03', '2024-01-02']
+    assert [row['date'] for row in second['items']] == ['2024-01-01']
+    assert second['has_more'] is False
@@ -0,0 +1,103 @@
+"""Test cases for return services."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.modules.business.models import BusinessReport
+from app.modules.returns.models import ReturnRateFact, ReturnReport
+from app.modules.returns.return_rates import refresh_return_rates
+from app.modules.returns.services import ReturnReportService
+
+
+def _return(day, order_id, asin, quantity, reason, refund):
+    return ReturnReport(
+        store_id=1, return_date=datetime(2024, 1, day), order_id=order_id,
+        sku=f'SKU-{asin}', asin=asin, title='Product', quantity=quantity,
+        return_reason=reason, status='Refunded', refund_amount=Decimal(refund),
+        return_center='FBA', return_carrier='UPS', tracking_number='1Z000'
+    )
+
+
+def _sales(day, asin, units):
+    return BusinessReport(
+        store_id=1, date=datetime(2024, 1, day), sku=f'SKU-{asin}', asin=asin,
+        title='Product', sessions=100, units_ordered=units,
+        ordered_product_sales=Decimal('100.00'), total_order_items=units
+    )
+
+
+@pytest.fixture
+def return_reports(database):
+    """Create returns over three days and sales for the first two."""
+    reports = [
+        _return(1, 'O-1', 'A1', 2, 'Defective', '20.00'),
+        _return(1, 'O-2', 'A2', 1, 'Wrong item', '15.50'),
+        _return(2, 'O-3', 'A1', 3, 'Defective', '30.00'),
+        _return(3, 'O-4', 'A2', 1, 'Not needed', '9.99'),
+        _return(3, 'O-5', 'A1', 1, 'Defective', '10.00'),
+    ]
+    database.session.add_all(reports + [_sales(1, 'A1', 10), _sales(1, 'A2', 10), _sales(2, 'A1', 10)])
+    database.session.flush()
+    refresh_return_rates(1)
+    return reports
+
+
+def test_return_data_aggregates(return_reports):
+    """Test rate, reasons and summary come from grouped totals."""
+    data = ReturnReportService(1).get_return_data(
+        start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31)
+    )
+
+    assert data['return_rate']['labels'] == ['2024-01-01', '2024-01-02', '2024-01-03']
+    assert data['return_rate']['rates'] == [15.0, 30.0, 0]
+    assert data['return_reasons']['reasons'][0] == 'Defective'
+    assert data['return_reasons']['counts'][0] == 6
+    assert data['summary'] == {'total_returns': 8, 'total_refund': 85.49, 'return_rate': 26.67}
+    assert 'return_items' not in data
+
+
+def test_return_data_filters(return_reports):
+    """Test ASIN and reason filters apply to every aggregate."""
+    data = ReturnReportService(1).get_return_data(asin='A2')
+
+    assert data['summary']['total_returns'] == 2
+    assert data['summary']['return_rate'] == 20.0
+    assert sorted(data['return_reasons']['reasons']) == ['Not needed', 'Wrong item']
+
+    data = ReturnReportService(1).get_return_data(return_reason='Wrong item')
+    assert data['return_rate']['rates'][:2] == [5.0, 0]
+
+
+def test_refresh_return_rates_incrementally(return_reports, database):
+    """Test only the touched (date, ASIN) slice is recomputed."""
+    fact = database.session.get(ReturnRateFact, (1, datetime(2024, 1, 1).date(), 'A1'))
+    assert (fact.returned_units, fact.units_ordered) == (2, 10)
+    assert fact.return_rate == 20.0
+
+    database.session.add(_return(1, 'O-6', 'A1', 3, 'Defective', '30.00'))
+    database.session.flush()
+    assert refresh_return_rates(1, [(datetime(2024, 1, 1), 'A1')]) == 1
+
+    database.session.expire_all()
+    fact = database.session.get(ReturnRateFact, (1, datetime(2024, 1, 1).date(), 'A1'))
+    assert (fact.returned_units, fact.units_ordered) == (5, 10)
+    assert ReturnRateFact.query.filter_by(store_id=1).count() == 5
+
+
+def test_return_items_keyset_pages(return_reports):
+    """Test items are paged newest first without overlap."""
+    service = ReturnReportService(1)
+
+    first = service.get_return_items(limit=2)
+    assert [item['order_id'] for item in first['items']] == ['O-5', 'O-4']
+    assert first['has_more'] is True
+
+    second = service.get_return_items(cursor=first['next_cursor'], limit=2)
+    assert [item['order_id'] for item in second['items']] == ['O-3', 'O-2']
+
+    last = service.get_return_items(cursor=second['next_cursor'], limit=2)
+    assert [item['order_id'] for item in last['items']] == ['O-1']
+    assert last['has_more'] is False
+    assert last['next_cursor'] is None
@@ -0,0 +1,132 @@
+"""Test cases for store-access checks."""
+
+import pytest
+from sqlalchemy import event
+
+from app.modules.auth.models import User
+from app.modules.stores.access import get_store_ids
+from app.modules.stores.models import Store
+
+
+@pytest.fixture
+def owners(database):
+    """Two users, the first owning two stores, committed so commit hooks run."""
+    users = [User(email=f'owner{n}@example.com', username=f'owner{n}', role='user') for n in (1, 2)]
+    for user in users:
+        user.set_password('password')
+    database.session.add_all(users)
+    database.session.flush()
+    database.session.add_all([
+        Store(name=f'Store {n}', marketplace='US', user_id=users[0].id) for n in (1, 2)
+    ])
+    database.session.commit()
+
+    yield users
+
+    Store.query.filter(Store.user_id.in_([user.id for user in users])).delete()
+    database.session.commit()
+
+
+@pytest.fixture
+def queries(database):
+    """Count the SQL statements run while the test executes."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = database.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', count)
+
+
+def _store_ids(user):
+    """Store IDs owned by a user, straight from the database."""
+    return sorted(store.id for store in Store.query.filter_by(user_id=user.id))
+
+
+def test_access_checks_query_once_per_request(owners, queries):
+    """Test the first check loads the store set and later checks hit no SQL."""
+    owner, other = owners
+    store_ids = _store_ids(owner)
+    owner.__dict__.pop('_store_ids', None)
+    queries.clear()
+
+    assert owner.has_store_access(store_ids[0])
+    assert owner.has_store_access(str(store_ids[1]))
+    assert not other.has_store_access(store_ids[0])
+    assert not owner.has_store_access(None)
+    assert sum('FROM stores' in statement for statement in queries) == 2  # one set per user
+
+    # A later request gets a new User instance and loads the set again
+    queries.clear()
+    owner.__dict__.pop('_store_ids')
+    assert owner.has_store_access(store_ids[0])
+    assert sum('FROM stores' in statement for statement in queries) == 1
+
+
+def test_change_from_another_worker_is_seen_next_request(owners, database):
+    """Test a reassignment committed elsewhere revokes access on the next request."""
+    owner, other = owners
+    store_id = _store_ids(owner)[0]
+    assert owner.has_store_access(store_id)
+
+    # Another worker's change arrives only through the database
+    with database.engine.begin() as connection:
+        connection.execute(Store.__table__.update().where(Store.__table__.c.id == store_id)
+                           .values(user_id=other.id))
+
+    owner.__dict__.pop('_store_ids')
+    assert not owner.has_store_access(store_id)
+
+
+def test_bulk_update_is_seen_after_commit(owners, database):
+    """Test a bulk Query.update() in the same request is seen once committed."""
+    owner, other = owners
+    store_id = _store_ids(owner)[0]
+    assert owner.has_store_access(store_id)
+
+    Store.query.filter_by(id=store_id).update({'user_id': other.id})
+    database.session.commit()
+
+    assert not owner.has_store_access(store_id)
+    assert other.has_store_access(store_id)
+
+
+def test_new_store_is_seen_after_commit(owners, database):
+    """Test a committed new store is visible to the next check."""
+    owner, _ = owners
+    assert len(owner.store_ids) == 2
+
+    store = Store(name='Store 3', marketplace='UK', user_id=owner.id)
+    database.session.add(store)
+    database.session.commit()
+
+    assert owner.has_store_access(store.id)
+    assert get_store_ids(owner.id) == frozenset(_store_ids(owner))
+
+
+def test_reassigned_store_moves_access(owners, database):
+    """Test reassigning a store revokes the old owner and grants the new one."""
+    owner, other = owners
+    store = Store.query.filter_by(user_id=owner.id).first()
+    assert owner.has_store_access(store.id) and not other.has_store_access(store.id)
+
+    store.user_id = other.id
+    database.session.commit()
+
+    assert not owner.has_store_access(store.id)
+    assert other.has_store_access(store.id)
+
+
+def test_rolled_back_store_grants_nothing(owners, database):
+    """Test a rolled back store does not grant access."""
+    owner, _ = owners
+    before = owner.store_ids
+
+    database.session.add(Store(name='Store 4', marketplace='DE', user_id=owner.id))
+    database.session.flush()
+    database.session.rollback()
+
+    assert get_store_ids(owner.id) == before
@@ -0,0 +1,135 @@
+"""Test cases for background export jobs."""
+
+import gzip
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.modules.business.models import BusinessReport
+from app.modules.uploaded_data import jobs
+from app.modules.uploaded_data.jobs import (
+    create_export_job, export_job_status, get_export_job, save_export_progress
+)
+from app.modules.uploaded_data.models import ExportJob
+
+
+@pytest.fixture
+def inline_jobs(app, database, tmp_path):
+    """Run jobs inline and write exports to a temporary folder."""
+    config = {key: app.config.get(key) for key in ('JOB_EXECUTOR', 'UPLOAD_FOLDER')}
+    app.config.update(JOB_EXECUTOR='sync', UPLOAD_FOLDER=str(tmp_path))
+
+    database.session.add_all([
+        BusinessReport(
+            store_id=1, date=datetime(2024, 1, day), sku=f'SKU{day}', asin='ASIN1',
+            title='Product', sessions=10, units_ordered=day,
+            ordered_product_sales=Decimal('10.00'), total_order_items=day
+        )
+        for day in range(1, 8)
+    ])
+    database.session.commit()
+
+    yield
+
+    # Jobs commit their status, so clean up outside the savepoint
+    ExportJob.query.delete()
+    database.session.commit()
+    app.config.update(config)
+
+
+def test_export_job_writes_file(inline_jobs):
+    """Test a job streams its export to disk and records the outcome."""
+    job = create_export_job(1, 1, 'business', 'csv.gz', datetime(2024, 1, 2), datetime(2024, 1, 6))
+
+    status = export_job_status(get_export_job(job.id, 1))
+    assert status['status'] == 'completed'
+    assert (status['rows_written'], status['progress']) == (5, 100.0)
+
+    with gzip.open(job.file_path, 'rt') as export:
+        lines = export.read().splitlines()
+    assert len(lines) == 6
+    assert lines[1].startswith('1,2024-01-02,SKU2')
+    assert status['file_size'] > 0
+
+
+def test_export_job_progress_while_running(inline_jobs, database):
+    """Test running jobs report the rows written saved on the job row."""
+    job = ExportJob(user_id=1, store_id=1, report_type='business', format='csv',
+                    status='running', rows_total=8, rows_written=0)
+    database.session.add(job)
+    database.session.commit()
+
+    save_export_progress(job.id, 2)
+    database.session.expire_all()
+    assert export_job_status(get_export_job(job.id, 1))['progress'] == 25.0
+
+
+def test_export_job_saves_progress_every_few_batches(inline_jobs, monkeypatch):
+    """Test a running job saves its progress after every N batches."""
+    saved = []
+
+    def five_batches(*args, on_batch, **kwargs):
+        for _ in range(5):
+            on_batch(2)
+            yield b'x'
+
+    monkeypatch.setattr(jobs, 'EXPORT_PROGRESS_BATCHES', 2)
+    monkeypatch.setattr(jobs, 'save_export_progress', lambda job_id, rows: saved.append(rows))
+    monkeypatch.setattr(jobs, 'stream_export', five_batches)
+
+    job = create_export_job(1, 1, 'business')
+
+    assert saved == [4, 8]
+    assert get_export_job(job.id, 1).rows_written == 10
+
+
+def test_export_job_is_private(inline_jobs):
+    """Test users only see their own jobs."""
+    job = create_export_job(1, 1, 'business')
+
+    assert get_export_job(job.id, 1) is not None
+    assert get_export_job(job.id, 2) is None
+
+
+def test_invalid_export_job(inline_jobs):
+    """Test unknown report types and formats are rejected before queueing."""
+    with pytest.raises(ValueError):
+        create_export_job(1, 1, 'orders')
+    with pytest.raises(ValueError):
+        create_export_job(1, 1, 'business', 'xlsx')
+    assert ExportJob.query.count() == 0
+
+
+def test_cleanup_fails_abandoned_jobs_and_expires_files(inline_jobs, app, database, tmp_path):
+    """Test jobs of dead workers are failed and old export files deleted."""
+    now = datetime(2024, 3, 1, 12, 0)
+    folder = tmp_path / jobs.EXPORT_JOB_FOLDER
+    folder.mkdir()
+    old_file, fresh_file, stray_file = folder / 'old.csv', folder / 'fresh.csv', folder / 'dead.csv.part'
+    for path in (old_file, fresh_file, stray_file):
+        path.write_text('x')
+    hour_ago = (now - timedelta(hours=1)).timestamp()
+    os.utime(stray_file, (hour_ago, hour_ago))
+    os.utime(old_file, (hour_ago, hour_ago))
+
+    def _job(status, updated_at, **fields):
+        return ExportJob(user_id=1, store_id=1, report_type='business', format='csv',
+                         status=status, created_at=updated_at, updated_at=updated_at, **fields)
+
+    abandoned = _job('running', now - timedelta(hours=1))
+    active = _job('running', now - timedelta(minutes=5))
+    expired = _job('completed', now - timedelta(days=8), file_path=str(old_file),
+                   completed_at=now - timedelta(days=8))
+    kept = _job('completed', now - timedelta(days=1), file_path=str(fresh_file),
+                completed_at=now - timedelta(days=1))
+    database.session.add_all([abandoned, active, expired, kept])
+    database.session.commit()
+
+    assert jobs.cleanup_export_jobs(now) == {'failed': 1, 'expired': 1, 'removed': 1}
+
+    database.session.expire_all()
+    assert [job.status for job in (abandoned, active, expired, kept)] == ['failed', 'running', 'expired', 'completed']
+    assert expired.file_path is None
+    assert sorted(path.name for path in folder.iterdir()) == ['fresh.csv']
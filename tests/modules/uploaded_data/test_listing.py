@@ -0,0 +1,106 @@
+"""Test cases for uploaded data listings."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.query_stats import assert_max_queries
+from app.modules.auth.models import User
+from app.modules.business.models import BusinessReport
+from app.modules.uploaded_data.listing import REPORT_LISTINGS, list_reports, serialize_report
+
+
+@pytest.fixture
+def business_reports(database):
+    """Create six business rows over three days."""
+    reports = [
+        BusinessReport(
+            store_id=1, date=datetime(2024, 1, day), sku=f'SKU{day}{n}', asin=f'ASIN{n}',
+            title='Product', sessions=day * 10 + n, units_ordered=n,
+            ordered_product_sales=Decimal('10.00') * n, total_order_items=n
+        )
+        for day in (1, 2, 3) for n in (1, 2)
+    ]
+    database.session.add_all(reports)
+    database.session.flush()
+    return reports
+
+
+def _walk(**options):
+    """Follow next links through every page and collect the SKUs."""
+    skus, cursor = [], None
+    while True:
+        page = list_reports('business', 1, cursor=cursor, **options)
+        skus.append([report.sku for report in page['items']])
+        if not page['has_more']:
+            return skus
+        cursor = page['next_cursor']
+
+
+def test_keyset_pages_by_date(business_reports):
+    """Test newest-first pages with ties on date broken by id."""
+    assert _walk(limit=4) == [['SKU32', 'SKU31', 'SKU22', 'SKU21'], ['SKU12', 'SKU11']]
+
+
+def test_sort_and_filters_are_pushed_down(business_reports):
+    """Test server-side sort on a metric and equality and date filters."""
+    assert _walk(limit=2, sort='sessions', order='asc', asin='ASIN2') == [['SKU12', 'SKU22'], ['SKU32']]
+
+    page = list_reports('business', 1, start_date='2024-01-02', end_date='2024-01-02')
+    assert sorted(report.sku for report in page['items']) == ['SKU21', 'SKU22']
+
+
+@pytest.mark.parametrize('report_type', sorted(REPORT_LISTINGS))
+def test_sort_columns_are_not_null(report_type):
+    """Test every sortable column can carry a keyset cursor."""
+    listing = REPORT_LISTINGS[report_type]
+    table = listing['model'].__table__
+
+    assert [name for name in listing['sort'] if table.c[name].nullable] == []
+
+
+def test_invalid_listing_options(business_reports):
+    """Test unknown report types, sort columns and filters are rejected."""
+    with pytest.raises(ValueError):
+        list_reports('orders', 1)
+    with pytest.raises(ValueError):
+        list_reports('business', 1, sort='title')
+    with pytest.raises(ValueError):
+        list_reports('business', 1, title='Product')
+    with pytest.raises(ValueError):
+        list_reports('business', 1, limit=0)
+    with pytest.raises(ValueError):
+        list_reports('business', 1, cursor='not-a-cursor')
+
+
+def test_cursor_is_bound_to_sort(business_reports):
+    """Test a cursor cannot be replayed against another sort order."""
+    cursor = list_reports('business', 1, limit=2)['next_cursor']
+
+    with pytest.raises(ValueError):
+        list_reports('business', 1, sort='sessions', cursor=cursor)
+
+
+def test_serialize_report(business_reports):
+    """Test rows serialize to JSON-safe column values."""
+    data = serialize_report('business', business_reports[1])
+
+    assert data['date'] == '2024-01-01T00:00:00'
+    assert data['ordered_product_sales'] == 20.0
+    assert 'categories' not in data
+
+
+def test_listing_api_query_budget(app, client, database, business_reports):
+    """Test a page of the listing API loads the user and the rows only."""
+    user = User(username='lister', email='lister@example.com', active_store_id=1)
+    user.set_password('password')
+    database.session.add(user)
+    database.session.flush()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+
+    with assert_max_queries(2):
+        response = client.get('/uploaded-data/api/business?limit=4')
+    assert response.status_code == 200
+    assert len(response.json['items']) == 4
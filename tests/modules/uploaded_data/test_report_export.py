@@ -0,0 +1,153 @@
+"""Test cases for streaming report exports."""
+
+import csv
+import gzip
+import io
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from werkzeug.datastructures import MIMEAccept
+
+from app.modules.advertising.dimensions import resolve_dimensions
+from app.modules.advertising.models import AdvertisingReport
+from app.modules.business.models import BusinessReport
+from app.modules.category.models import ASINCategory, Category
+from app.modules.uploaded_data.export import (
+    REPORT_EXPORTS, has_report_data, negotiate_format, stream_export
+)
+from app.utils.index_audit import capture_statements
+
+
+@pytest.fixture
+def business_reports(database):
+    """Create five days of rows for one categorized and one plain ASIN."""
+    parent = Category(name='Electronics', code='ELEC')
+    database.session.add(parent)
+    database.session.flush()
+    child = Category(name='Cables', code='ELEC-CAB', parent_id=parent.id)
+    database.session.add(child)
+    database.session.flush()
+    database.session.add_all([
+        ASINCategory(asin='ASIN1', category_id=parent.id, title='Cable'),
+        ASINCategory(asin='ASIN1', category_id=child.id, title='Cable')
+    ])
+
+    database.session.add_all([
+        BusinessReport(
+            store_id=1, date=datetime(2024, 1, day), sku=f'SKU{n}', asin=f'ASIN{n}',
+            title='Product', sessions=10, units_ordered=n,
+            ordered_product_sales=Decimal('12.50') * n, total_order_items=n,
+            conversion_rate=Decimal('5.00')
+        )
+        for day in range(1, 6) for n in (1, 2)
+    ])
+    database.session.flush()
+
+
+def _rows(data: bytes):
+    """Parse exported CSV bytes into dicts."""
+    return list(csv.DictReader(io.StringIO(data.decode())))
+
+
+def test_csv_export_in_chunks(business_reports):
+    """Test the CSV export yields the header, then one chunk per batch."""
+    chunks = list(stream_export('business', 1, datetime(2024, 1, 2), datetime(2024, 1, 4), batch_size=4))
+
+    assert len(chunks) == 3
+    rows = _rows(b''.join(chunks))
+    assert list(rows[0]) == REPORT_EXPORTS['business']['columns']
+    assert [(row['date'], row['sku']) for row in rows[:2]] == [('2024-01-02', 'SKU1'), ('2024-01-02', 'SKU2')]
+    assert len(rows) == 6
+
+    assert (rows[0]['category'], rows[0]['subcategory']) == ('Electronics', 'Cables')
+    assert (rows[1]['category'], rows[1]['subcategory']) == ('', '')
+    assert rows[1]['ordered_product_sales'] == '25.00'
+
+
+def test_gzip_csv_export(business_reports):
+    """Test the gzip CSV export decompresses to the plain CSV."""
+    plain = b''.join(stream_export('business', 1, fmt='csv', batch_size=3))
+    compressed = b''.join(stream_export('business', 1, fmt='csv.gz', batch_size=3))
+
+    assert gzip.decompress(compressed) == plain
+    assert len(_rows(plain)) == 10
+
+
+@pytest.mark.parametrize('report_type', sorted(REPORT_EXPORTS))
+def test_every_report_type_exports(database, report_type):
+    """Test each report type's columns resolve to a valid query."""
+    data = b''.join(stream_export(report_type, 1))
+
+    assert data.decode().strip() == ','.join(REPORT_EXPORTS[report_type]['columns'])
+
+
+def test_advertising_export_joins_dimensions(database):
+    """Test dimension names come from joins rather than per-row subqueries."""
+    df = pd.DataFrame({
+        'store_id': 1,
+        'campaign_name': ['Brand', 'Generic'],
+        'ad_group_name': ['Exact', 'Broad'],
+        'search_term': ['usb cable', 'charger'],
+    })
+    resolve_dimensions(df)
+    database.session.add_all([
+        AdvertisingReport(
+            store_id=1, date=datetime(2024, 1, 1 + n), campaign_id=row.campaign_id,
+            ad_group_id=row.ad_group_id, search_term_id=row.search_term_id,
+            targeting_type='manual', match_type='exact', impressions=100, clicks=5,
+            spend=Decimal('2.50'), total_sales=Decimal('10.00'), total_orders=1, total_units=1
+        )
+        for n, row in enumerate(df.itertuples())
+    ])
+    database.session.flush()
+
+    chunks = []
+    statements = capture_statements(lambda: chunks.extend(stream_export('advertising', 1)))
+    rows = _rows(b''.join(chunks))
+
+    assert [(row['campaign_name'], row['ad_group_name'], row['search_term']) for row in rows] == [
+        ('Brand', 'Exact', 'usb cable'), ('Generic', 'Broad', 'charger')
+    ]
+    sql = statements[-1][0]
+    assert 'JOIN ad_campaigns' in sql and 'JOIN ad_search_terms' in sql
+    assert '(SELECT' not in sql
+
+
+def test_columnar_exports(business_reports):
+    """Test Parquet and Arrow IPC exports read back with every row."""
+    parquet = b''.join(stream_export('business', 1, fmt='parquet', batch_size=4))
+    table = pq.read_table(pa.BufferReader(parquet))
+    assert table.num_rows == 10
+    assert table.column('ordered_product_sales').type == pa.decimal128(10, 2)
+    assert sum(table.column('ordered_product_sales').to_pylist()) == Decimal('187.50')
+    assert table.column('category').to_pylist()[:2] == ['Electronics', None]
+
+    arrow = b''.join(stream_export('business', 1, fmt='arrow', batch_size=4))
+    assert pa.ipc.open_stream(arrow).read_all().num_rows == 10
+
+
+def test_negotiate_format():
+    """Test an explicit format wins over the Accept header, which defaults to CSV."""
+    assert negotiate_format('csv.gz', MIMEAccept([('text/csv', 1)])) == 'csv.gz'
+    assert negotiate_format(None, MIMEAccept([('application/gzip', 1)])) == 'csv.gz'
+    assert negotiate_format(None, MIMEAccept([('*/*', 1)])) == 'csv'
+    assert negotiate_format(None, MIMEAccept()) == 'csv'
+
+
+def test_invalid_export_options(business_reports):
+    """Test unknown report types and formats are rejected before streaming."""
+    with pytest.raises(ValueError):
+        stream_export('orders', 1)
+    with pytest.raises(ValueError):
+        stream_export('business', 1, fmt='xlsx')
+
+
+def test_has_report_data(business_reports):
+    """Test the existence probe used before streaming."""
+    assert has_report_data('business', 1, datetime(2024, 1, 1), datetime(2024, 1, 1))
+    assert not has_report_data('business', 1, datetime(2023, 1, 1), datetime(2023, 12, 31))
+    assert not has_report_data('returns', 1)
@@ -0,0 +1,75 @@
+"""Test cases for the benchmark harness and runner."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.harness import BenchmarkError, compare, measure
+from benchmarks.run import main, select
+
+
+def test_measure_reports_rows_and_errors():
+    """Test timings, rows/sec and failed scenarios."""
+    calls = []
+    result = measure(lambda context: 100, None, setup=lambda context: calls.append(1), repeat=3, warmup=1)
+    assert result['status'] == 'ok'
+    assert result['runs'] == 3 and len(calls) == 4
+    assert result['rows'] == 100 and result['rows_per_sec'] > 0
+
+    def failing(context):
+        raise BenchmarkError('nothing returned')
+
+    assert measure(failing, None) == {'status': 'error', 'error': 'BenchmarkError: nothing returned'}
+
+
+def test_compare_flags_slowdowns_and_new_failures():
+    """Test only scenarios that worked before can regress."""
+    baseline = {
+        'fast': {'status': 'ok', 'median_s': 0.100},
+        'slow': {'status': 'ok', 'median_s': 0.100},
+        'broken': {'status': 'ok', 'median_s': 0.100},
+        'legacy': {'status': 'error', 'error': 'AttributeError: x'},
+    }
+    results = {
+        'fast': {'status': 'ok', 'median_s': 0.120},
+        'slow': {'status': 'ok', 'median_s': 0.130},
+        'broken': {'status': 'error', 'error': 'ValueError: y'},
+        'legacy': {'status': 'error', 'error': 'AttributeError: x'},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith('slow: median 130.00 ms')
+    assert regressions[1] == 'broken: now fails (ValueError: y)'
+
+
+def test_select_by_prefix_and_glob():
+    """Test scenario filters."""
+    assert select(('ingest',)) == ['ingest.business', 'ingest.advertising', 'ingest.inventory', 'ingest.returns']
+    assert select(('uploaded_data.*.first_page',)) == [
+        f'uploaded_data.list_reports.{report_type}.first_page'
+        for report_type in ('business', 'advertising', 'inventory', 'returns')
+    ]
+
+
+@pytest.mark.slow
+def test_runner_writes_results_and_compares(tmp_path):
+    """Test a small run end to end against a recorded baseline."""
+    output, baseline = tmp_path / 'results.json', tmp_path / 'baseline.json'
+    args = ['--scale', '600', '--stores', '1', '--days', '10', '--ingest-rows', '50', '--repeat', '1',
+            '--filter', 'ingest.returns', '--filter', 'uploaded_data.*.first_page',
+            '--output', str(output), '--baseline', str(baseline)]
+
+    result = CliRunner().invoke(main, args + ['--save-baseline'])
+    assert result.exit_code == 0, result.output
+
+    run = json.loads(output.read_text())
+    assert run['meta']['scale'] == '600'
+    assert set(run['results']) == set(select(('ingest.returns', 'uploaded_data.*.first_page')))
+    assert all(entry['status'] == 'ok' for entry in run['results'].values())
+    assert run['results']['ingest.returns']['rows'] == 50
+
+    result = CliRunner().invoke(main, args + ['--tolerance', '1000'])
+    assert result.exit_code == 0, result.output
+    assert 'No regressions' in result.output
@@ -0,0 +1,55 @@
+"""Startup import-time budget for the application factory."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules that must not load while the app is created. Request handlers and
+# CLI commands import them when they actually need them.
+DEFERRED_MODULES = ['pandas', 'numpy', 'app.utils.analytics_engine']
+
+# Total import time budget for create_app in milliseconds. Imports take about
+# 800 ms with the deferred modules left out and 1100 ms with them loaded on
+# the reference machine. Override with STARTUP_IMPORT_BUDGET_MS on slower hosts.
+STARTUP_IMPORT_BUDGET_MS = int(os.environ.get('STARTUP_IMPORT_BUDGET_MS', 1000))
+
+STARTUP_SCRIPT = (
+    "from app import create_app; "
+    "create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'SECRET_KEY': 'startup'})"
+)
+
+
+def measure_startup_imports():
+    """Run create_app under ``python -X importtime`` in a fresh interpreter.
+
+    Returns:
+        dict: Cumulative import time in microseconds by module name
+        int: Total import time in microseconds
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', STARTUP_SCRIPT],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+
+    modules, total = {}, 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line.split(':', 1)[1].split('|')
+        modules[name.strip()] = int(cumulative)
+        if not name.startswith('  '):
+            total += int(cumulative)
+    return modules, total
+
+
+@pytest.mark.slow
+def test_startup_defers_heavy_imports():
+    """Test creating the app neither loads pandas nor exceeds the time budget."""
+    modules, total = measure_startup_imports()
+
+    assert 'app.modules.business.routes' in modules
+    assert [name for name in DEFERRED_MODULES if name in modules] == []
+    assert total / 1000 < STARTUP_IMPORT_BUDGET_MS, f"Startup imports took {total / 1000:.0f} ms"
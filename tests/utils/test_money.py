@@ -0,0 +1,48 @@
+"""Tests for money parsing utilities."""
+
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from app.utils.money import parse_money, to_cents, normalize_money_columns
+
+
+def test_parse_money_strips_formatting():
+    """Test currency symbols and thousands separators are removed."""
+    assert parse_money('$1,234.50') == Decimal('1234.50')
+    assert parse_money(' 12 ') == Decimal('12.00')
+    assert parse_money('(15.25)') == Decimal('-15.25')
+
+
+def test_parse_money_numeric_and_empty_values():
+    """Test numeric input and empty values."""
+    assert parse_money(10) == Decimal('10.00')
+    assert parse_money(0.125) == Decimal('0.13')
+    assert parse_money(None) == Decimal('0.00')
+    assert parse_money('', default=None) is None
+
+
+def test_parse_money_invalid_value():
+    """Test invalid values raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_money('abc')
+
+
+def test_to_cents():
+    """Test conversion to integer cents."""
+    assert to_cents('$1,234.56') == 123456
+
+
+def test_normalize_money_columns():
+    """Test DataFrame money columns become numeric."""
+    df = pd.DataFrame({
+        'spend': ['$1,000.00', '25.5', 'invalid'],
+        'clicks': [1, 2, 3]
+    })
+
+    normalize_money_columns(df, ['spend', 'total_sales'])
+
+    assert df['spend'].tolist()[:2] == [1000.0, 25.5]
+    assert df['spend'].tolist()[2] == 'invalid'  # Left for type validation
+    assert df['clicks'].tolist() == [1, 2, 3]
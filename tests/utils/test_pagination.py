@@ -0,0 +1,111 @@
+"""Test cases for pagination utilities."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.cache import bump_data_version
+from app.modules.business.models import BusinessReport
+from app.modules.uploaded_data.models import ExportJob
+from app.utils.pagination import (
+    count_query, decode_cursor, encode_cursor, keyset_paginate, paginate_query
+)
+
+
+@pytest.fixture
+def business_reports(database):
+    """Create five business rows, two on the same day."""
+    reports = [
+        BusinessReport(
+            store_id=1, date=datetime(2024, 1, day), sku=f'SKU{n}', asin=f'ASIN{n}',
+            title='Product', sessions=n, units_ordered=n,
+            ordered_product_sales=Decimal('10.00'), total_order_items=n
+        )
+        for n, day in enumerate((1, 2, 2, 3, 4), start=1)
+    ]
+    database.session.add_all(reports)
+    database.session.flush()
+    return reports
+
+
+def _query():
+    """Store 1 business rows."""
+    return BusinessReport.query.filter(BusinessReport.store_id == 1)
+
+
+def test_cursor_round_trip():
+    """Test cursors restore dates, datetimes and Decimals."""
+    values = [datetime(2024, 1, 2, 3, 4), date(2024, 1, 2), Decimal('1.50'), 'a', 7, None]
+
+    assert decode_cursor(encode_cursor(values, scope='x'), scope='x') == values
+
+
+def test_cursor_rejects_tampering():
+    """Test malformed cursors and cursors from another scope are rejected."""
+    cursor = encode_cursor([1], scope='date,id:desc')
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, scope='sessions,id:desc')
+    with pytest.raises(ValueError):
+        decode_cursor('%%%')
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor([])[:-2] + 'x')
+
+
+def test_keyset_pages_follow_cursor(business_reports):
+    """Test keyset pages cover every row once with date ties broken by id."""
+    columns = (BusinessReport.date, BusinessReport.id)
+    skus, cursor = [], None
+    while True:
+        page = keyset_paginate(_query(), columns, cursor=cursor, limit=2, descending=True)
+        skus.append([report.sku for report in page['items']])
+        if not page['has_more']:
+            break
+        cursor = page['next_cursor']
+
+    assert skus == [['SKU5', 'SKU4'], ['SKU3', 'SKU2'], ['SKU1']]
+    assert page['next_cursor'] is None
+    assert page['total'] is None
+
+
+def test_keyset_rejects_nullable_columns(business_reports):
+    """Test a nullable sort key is refused instead of ending pages early."""
+    with pytest.raises(ValueError, match='rows_total'):
+        keyset_paginate(_query(), (ExportJob.rows_total, BusinessReport.id))
+
+
+def test_paginate_query_probes_has_more(business_reports):
+    """Test page numbers report has_more without a count when asked to."""
+    query = _query().order_by(BusinessReport.id)
+
+    first = paginate_query(query, page=1, per_page=3, count=None)
+    last = paginate_query(query, page=2, per_page=3)
+
+    assert [report.sku for report in first['items']] == ['SKU1', 'SKU2', 'SKU3']
+    assert first['has_more'] is True
+    assert first['total'] is None and first['pages'] is None
+    assert last['has_more'] is False
+    assert (last['total'], last['pages']) == (5, 2)
+
+
+def test_cached_count_follows_data_version(business_reports, database):
+    """Test a cached count is reused until the store's data changes."""
+    assert count_query(_query(), 'cached', store_id=1) == 5
+
+    database.session.add(BusinessReport(
+        store_id=1, date=datetime(2024, 1, 5), sku='SKU6', asin='ASIN6', title='Product',
+        sessions=1, units_ordered=1, ordered_product_sales=Decimal('1.00'), total_order_items=1
+    ))
+    database.session.flush()
+
+    assert count_query(_query(), 'cached', store_id=1) == 5
+    bump_data_version(1)
+    assert count_query(_query(), 'cached', store_id=1) == 6
+    assert count_query(_query(), 'estimate', store_id=1) == 6
+
+
+def test_invalid_count_mode(business_reports):
+    """Test unknown count modes are rejected."""
+    with pytest.raises(ValueError):
+        count_query(_query(), 'guess')